@@ -1,15 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import List, Any, Optional
 
 from app.core.database import get_db
 from app.schemas import User, App, AppCreate, AppUpdate, AppWithComponents, AppPublic, AppWithContent
 from app.services.auth import AuthService
 from app.services.app import AppService
+from app.services.published_app_cache import published_app_cache
 from app.models.user import UserRole
 
 router = APIRouter()
 
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (weak comparison)"""
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.replace("W/", "", 1) for candidate in candidates)
+
+
+def _published_app_response(request: Request, app_service: AppService, slug: str, version: Optional[int]) -> Response:
+    """Pre-encoded published app snapshot, answering 304 when the client's copy is current"""
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="App not found or not published"
+    )
+    # The current version is always read from the database so every worker sees
+    # publishes and unpublishes at once; only the immutable bodies are cached
+    current = app_service.get_published_version(slug)
+    if current is None:
+        raise not_found
+
+    app_id, current_version = current
+    cached = published_app_cache.get(app_id, version or current_version)
+    if cached is None:
+        snapshot = app_service.get_published_snapshot(app_id, version or current_version)
+        if not snapshot:
+            raise not_found
+        cached = published_app_cache.store(snapshot)
+
+    body, etag = cached
+    # A pinned version never changes; the current one must be revalidated
+    cache_control = "public, max-age=31536000, immutable" if version else "no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/", response_model=List[App])
 @router.get("", response_model=List[App])
 def get_apps(
@@ -95,37 +132,23 @@ def get_app_by_slug(
 @router.get("/slug/{slug}/content", response_model=AppWithContent)
 def get_published_app_content(
     slug: str,
+    request: Request,
+    version: Optional[int] = Query(None, ge=1, description="Published version; defaults to the current one"),
     db: Session = Depends(get_db)
 ) -> Any:
     """Get published app with full content (pages, components, layouts) for rendering"""
-    app_service = AppService(db)
-    app = app_service.get_by_slug_with_content(slug)
-    
-    if not app or not app.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="App not found or not published"
-        )
-    
-    return app
+    return _published_app_response(request, AppService(db), slug, version)
 
 
 @router.get("/standalone/{slug}", response_model=AppWithContent)
 def get_standalone_app(
     slug: str,
+    request: Request,
+    version: Optional[int] = Query(None, ge=1, description="Published version; defaults to the current one"),
     db: Session = Depends(get_db)
 ) -> Any:
     """Get standalone published app (no authentication required)"""
-    app_service = AppService(db)
-    app = app_service.get_by_slug_with_content(slug)
-    
-    if not app or not app.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="App not found or not published"
-        )
-    
-    return app
+    return _published_app_response(request, AppService(db), slug, version)
 
 
 @router.put("/{app_id}", response_model=App)
@@ -207,7 +230,15 @@ def publish_app(
         )
     
     published_app = app_service.publish(app_id)
-    return {"message": "App published successfully", "app": published_app}
+    # Warm the cache so the first anonymous view does not hit the database
+    published_app_cache.store(
+        app_service.get_published_snapshot(published_app.id, published_app.published_version)
+    )
+    return {
+        "message": "App published successfully",
+        "version": published_app.published_version,
+        "app": published_app,
+    }
 
 
 @router.post("/{app_id}/unpublish")
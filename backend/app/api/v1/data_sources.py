@@ -1,14 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import time
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Any
 
 from app.core.database import get_db
 from app.schemas import (
     User, DataSource, DataSourceCreate, DataSourceUpdate, 
-    DataSourcePublic, DataSourceTestResult, QueryRequest, QueryResult
+    DataSourcePublic, DataSourceTestResult, QueryRequest, QueryResult, QueryCacheStats,
+    StreamQueryRequest, BatchQueryRequest, BatchQueryResult, RunningQuery, QueryGovernorStats
 )
 from app.services.auth import AuthService
-from app.services.data_source import DataSourceService
+from app.core.config import settings
+from app.core.serialization import FastJSONResponse
+from app.services.data_source import DataSourceService, encode_ndjson, encode_json_stream
+from app.services.query_cache import query_cache
+from app.services.query_governor import query_governor
 from app.models.user import UserRole
 
 router = APIRouter()
@@ -48,6 +57,120 @@ def create_data_source(
     return data_source
 
 
+@router.post("/batch-query", response_model=BatchQueryResult)
+async def execute_batch_query(
+    batch_request: BatchQueryRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Execute many queries (possibly on different data sources) in one request"""
+    start_time = time.time()
+    data_source_service = DataSourceService(db)
+    
+    # Load every referenced data source at once and check access per source
+    data_source_ids = list({item.data_source_id for item in batch_request.queries})
+    data_sources = await run_in_threadpool(data_source_service.get_by_ids, data_source_ids)
+    data_sources_by_id = {ds.id: ds for ds in data_sources}
+    
+    access_errors = {}
+    for data_source_id in data_source_ids:
+        data_source = data_sources_by_id.get(data_source_id)
+        if not data_source:
+            access_errors[data_source_id] = "Data source not found"
+        elif data_source.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+            access_errors[data_source_id] = "Not enough permissions to query this data source"
+        elif not data_source.is_active:
+            access_errors[data_source_id] = "Data source is not active"
+    
+    runnable = [
+        (data_sources_by_id[item.data_source_id], item.query)
+        for item in batch_request.queries
+        if item.data_source_id not in access_errors
+    ]
+    query_results = iter(await data_source_service.execute_batch_async(runnable))
+    
+    results = []
+    for item in batch_request.queries:
+        if item.data_source_id in access_errors:
+            result = QueryResult(success=False, error=access_errors[item.data_source_id])
+        else:
+            result = next(query_results)
+        results.append({
+            "key": item.key,
+            "data_source_id": item.data_source_id,
+            "result": dict(result)
+        })
+    
+    # Encoded directly; rows are not re-validated against BatchQueryResult
+    return FastJSONResponse({
+        "results": results,
+        "execution_time_ms": (time.time() - start_time) * 1000
+    })
+
+
+@router.get("/cache/stats", response_model=QueryCacheStats)
+def get_query_cache_stats(
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Get query result cache hit/miss counters (admin only)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can view cache statistics"
+        )
+    
+    return query_cache.get_stats()
+
+
+@router.get("/queries", response_model=List[RunningQuery])
+def get_running_queries(
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """List queued and running queries on the user's data sources (all for admins)"""
+    owner_id = None if current_user.role == UserRole.ADMIN else current_user.id
+    return [ticket.to_dict() for ticket in query_governor.list_tickets(owner_id)]
+
+
+@router.get("/queries/stats", response_model=QueryGovernorStats)
+def get_query_governor_stats(
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Get queued/rejected/timed-out query counters (admin only)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can view query statistics"
+        )
+    
+    return query_governor.get_stats()
+
+
+@router.post("/queries/{query_id}/cancel")
+def cancel_query(
+    query_id: str,
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Cancel a queued or running query"""
+    ticket = query_governor.get_ticket(query_id)
+    
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Query not found or already finished"
+        )
+    
+    # Check if user owns the data source being queried
+    if ticket.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to cancel this query"
+        )
+    
+    # Sync route: aborting the query upstream may block on the data source
+    ticket.cancel()
+    return {"message": "Query cancelled successfully"}
+
+
 @router.get("/{data_source_id}", response_model=DataSource)
 def get_data_source(
     data_source_id: int,
@@ -98,7 +221,7 @@ def update_data_source(
             detail="Not enough permissions to update this data source"
         )
     
-    updated_data_source = data_source_service.update(data_source_id, data_source_update)
+    updated_data_source = data_source_service.update_data_source(data_source_id, data_source_update)
     return updated_data_source
 
 
@@ -125,7 +248,7 @@ def delete_data_source(
             detail="Not enough permissions to delete this data source"
         )
     
-    data_source_service.delete(data_source_id)
+    data_source_service.delete_data_source(data_source_id)
     return {"message": "Data source deleted successfully"}
 
 
@@ -157,7 +280,7 @@ def test_data_source(
 
 
 @router.post("/{data_source_id}/query", response_model=QueryResult)
-def execute_query(
+async def execute_query(
     data_source_id: int,
     query_request: QueryRequest,
     db: Session = Depends(get_db),
@@ -165,7 +288,7 @@ def execute_query(
 ) -> Any:
     """Execute query on data source"""
     data_source_service = DataSourceService(db)
-    data_source = data_source_service.get(data_source_id)
+    data_source = await run_in_threadpool(data_source_service.get, data_source_id)
     
     if not data_source:
         raise HTTPException(
@@ -187,17 +310,99 @@ def execute_query(
             detail="Data source is not active"
         )
     
-    result = data_source_service.execute_query(data_source, query_request)
-    return result
+    result = await data_source_service.execute_query_async(data_source, query_request)
+    return FastJSONResponse(dict(result))
+
+
+@router.post("/{data_source_id}/query/stream")
+async def stream_query(
+    data_source_id: int,
+    query_request: StreamQueryRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Stream query results as NDJSON or chunked JSON (no 1000 row cap)"""
+    data_source_service = DataSourceService(db)
+    data_source = await run_in_threadpool(data_source_service.get, data_source_id)
+    
+    if not data_source:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Data source not found"
+        )
+    
+    # Check if user owns the data source
+    if data_source.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to query this data source"
+        )
+    
+    # Check if data source is active
+    if not data_source.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data source is not active"
+        )
+    
+    try:
+        rows = await data_source_service.stream_query_async(data_source, query_request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except asyncio.TimeoutError:
+        # Errors before the first row get the same shape as /query
+        timeout = query_governor.get_timeout(data_source)
+        result = QueryResult(success=False, error=f"Query timed out after {timeout} seconds", query_id=query_request.query_id)
+        return FastJSONResponse(result.dict())
+    except Exception as e:
+        return FastJSONResponse(QueryResult(success=False, error=str(e), query_id=query_request.query_id).dict())
+    
+    batch_size = settings.DATA_SOURCE_STREAM_BATCH_SIZE
+    if format == "json":
+        return StreamingResponse(encode_json_stream(rows, batch_size), media_type="application/json")
+    return StreamingResponse(encode_ndjson(rows, batch_size), media_type="application/x-ndjson")
+
+
+@router.delete("/{data_source_id}/cache")
+def invalidate_query_cache(
+    data_source_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Invalidate cached query results of a data source"""
+    data_source_service = DataSourceService(db)
+    data_source = data_source_service.get(data_source_id)
+    
+    if not data_source:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Data source not found"
+        )
+    
+    # Check if user owns the data source
+    if data_source.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to modify this data source"
+        )
+    
+    query_cache.invalidate(data_source_id)
+    return {"message": "Query cache invalidated successfully"}
 
 
 @router.get("/{data_source_id}/schema")
 def get_data_source_schema(
     data_source_id: int,
+    refresh: bool = False,
+    mode: str = Query("full", pattern="^(full|tables)$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(AuthService.get_current_user)
 ) -> Any:
-    """Get data source schema information"""
+    """Get data source schema information (`mode=tables` lists table names only)"""
     data_source_service = DataSourceService(db)
     data_source = data_source_service.get(data_source_id)
     
@@ -221,5 +426,75 @@ def get_data_source_schema(
             detail="Data source is not active"
         )
     
-    schema_info = data_source_service.get_schema(data_source)
+    if mode == "tables":
+        return data_source_service.get_schema_tables(data_source)
+    schema_info = data_source_service.get_schema(data_source, refresh=refresh)
     return schema_info
+
+
+@router.post("/{data_source_id}/schema/refresh")
+def refresh_data_source_schema(
+    data_source_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Re-introspect and store data source schema information"""
+    data_source_service = DataSourceService(db)
+    data_source = data_source_service.get(data_source_id)
+    
+    if not data_source:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Data source not found"
+        )
+    
+    # Check if user owns the data source
+    if data_source.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access this data source schema"
+        )
+    
+    # Check if data source is active
+    if not data_source.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data source is not active"
+        )
+    
+    schema_info = data_source_service.get_schema(data_source, refresh=True)
+    return schema_info
+
+
+@router.get("/{data_source_id}/schema/tables/{table_name}")
+def get_data_source_table_schema(
+    data_source_id: int,
+    table_name: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Get column information for a single table"""
+    data_source_service = DataSourceService(db)
+    data_source = data_source_service.get(data_source_id)
+    
+    if not data_source:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Data source not found"
+        )
+    
+    # Check if user owns the data source
+    if data_source.owner_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access this data source schema"
+        )
+    
+    # Check if data source is active
+    if not data_source.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data source is not active"
+        )
+    
+    return data_source_service.get_table_schema(data_source, table_name)
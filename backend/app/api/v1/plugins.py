@@ -4,7 +4,7 @@ from typing import List, Any, Optional
 from sqlalchemy import and_, or_, desc, asc
 
 from app.core.database import get_db
-from app.schemas import User, Plugin, PluginCreate, PluginUpdate, PluginPublic, PluginCategory, PluginCategoryCreate, PluginCategoryUpdate
+from app.schemas import User, Plugin, PluginCreate, PluginUpdate, PluginPublic, PluginCard, PluginCategory, PluginCategoryCreate, PluginCategoryUpdate
 from app.schemas.plugin import (
     PluginInstallation, PluginInstallationCreate, PluginInstallationUpdate,
     PluginReview, PluginReviewCreate, PluginReviewUpdate, PluginReviewPublic,
@@ -45,7 +45,7 @@ def create_plugin_category(
 
 
 # Plugin Marketplace
-@router.get("/", response_model=List[PluginPublic])
+@router.get("/", response_model=List[PluginCard])
 def get_plugins(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
@@ -55,7 +55,7 @@ def get_plugins(
     is_featured: Optional[bool] = Query(None),
     min_rating: Optional[float] = Query(None, ge=0, le=5),
     search_query: Optional[str] = Query(None),
-    sort_by: str = Query("download_count"),
+    sort_by: Optional[str] = Query(None, description="relevance, download_count, rating, created_at or name; relevance when searching, otherwise download_count"),
     sort_order: str = Query("desc"),
     db: Session = Depends(get_db)
 ) -> Any:
@@ -76,7 +76,7 @@ def get_plugins(
     return plugin_service.search_plugins(filters, skip=skip, limit=limit)
 
 
-@router.get("/featured", response_model=List[PluginPublic])
+@router.get("/featured", response_model=List[PluginCard])
 def get_featured_plugins(
     limit: int = Query(10, ge=1, le=20),
     db: Session = Depends(get_db)
@@ -95,6 +95,41 @@ def get_plugin_stats(
     return plugin_service.get_stats()
 
 
+@router.post("/ratings/reconcile")
+def reconcile_plugin_ratings(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Recompute plugin rating aggregates from the reviews (admin only)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can reconcile plugin ratings"
+        )
+
+    plugin_service = PluginService(db)
+    fixed = plugin_service.reconcile_ratings()
+    return {"message": "Plugin ratings reconciled successfully", "reconciled_plugins": fixed}
+
+
+@router.post("/downloads/reconcile")
+def reconcile_plugin_downloads(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(AuthService.get_current_user)
+) -> Any:
+    """Flush buffered download counts and repair counts below the installations (admin only)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can reconcile plugin download counts"
+        )
+
+    plugin_service = PluginService(db)
+    plugin_service.flush_download_counts()
+    fixed = plugin_service.reconcile_download_counts()
+    return {"message": "Plugin download counts reconciled successfully", "reconciled_plugins": fixed}
+
+
 @router.get("/{plugin_id}", response_model=PluginPublic)
 def get_plugin(
     plugin_id: int,
@@ -172,7 +207,7 @@ def delete_plugin(
             detail="Only the plugin author or admin can delete this plugin"
         )
     
-    plugin_service.delete(plugin_id)
+    plugin_service.delete_plugin(plugin_id)
     return {"message": "Plugin deleted successfully"}
 
 
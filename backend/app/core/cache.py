@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+
+from .config import settings
+
+
+class MemoryCacheBackend:
+    """
+    In-process, size-bounded LRU cache with per-entry TTL.
+
+    Counters (used for invalidation generations) live outside the LRU so
+    they are never evicted.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache shared by all workers.
+
+    Values are stored as JSON. Redis errors are treated as cache misses so an
+    unavailable cache never fails the request it is meant to speed up.
+    """
+
+    def __init__(self, url: str, namespace: str = "reshift:"):
+        self.namespace = namespace
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self.namespace + key)
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            self._client.set(self.namespace + key, json.dumps(value, default=str), ex=ttl)
+        except redis.RedisError:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self.namespace + key)
+        except redis.RedisError:
+            pass
+
+    def get_counter(self, key: str) -> int:
+        try:
+            raw = self._client.get(self.namespace + key)
+        except redis.RedisError:
+            return 0
+        return int(raw) if raw is not None else 0
+
+    def incr(self, key: str) -> int:
+        try:
+            return int(self._client.incr(self.namespace + key))
+        except redis.RedisError:
+            return 0
+
+    def size(self) -> Optional[int]:
+        # Shared keyspace; the entry count is not tracked per namespace
+        return None
+
+
+def create_cache_backend(max_entries: int):
+    """Create the cache backend selected by `CACHE_BACKEND`"""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.CACHE_REDIS_URL)
+    return MemoryCacheBackend(max_entries=max_entries)
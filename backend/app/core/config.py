@@ -19,6 +19,50 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     
+    # Data source connection pooling
+    DATA_SOURCE_POOL_SIZE: int = 5
+    DATA_SOURCE_MAX_OVERFLOW: int = 5
+    DATA_SOURCE_POOL_TIMEOUT: int = 30
+    DATA_SOURCE_POOL_RECYCLE: int = 300
+    DATA_SOURCE_ENGINE_IDLE_TIMEOUT: int = 600  # seconds before an unused engine is disposed
+    DATA_SOURCE_MAX_ENGINES: int = 50
+    DATA_SOURCE_MAX_CLIENTS: int = 50  # open MongoDB/Redis/HTTP clients per worker
+    DATA_SOURCE_KEEPALIVE_EXPIRY: int = 30
+    DATA_SOURCE_QUERY_TIMEOUT: int = 30  # seconds
+    DATA_SOURCE_MAX_CONCURRENT_QUERIES: int = 4  # per data source, per worker
+    DATA_SOURCE_MAX_CONCURRENT_QUERIES_PER_OWNER: int = 8  # across an owner's data sources, per worker
+    DATA_SOURCE_MAX_QUEUED_QUERIES_PER_OWNER: int = 32  # further queries are rejected
+    BATCH_QUERY_MAX_PARALLELISM: int = 8
+    DATA_SOURCE_STREAM_BATCH_SIZE: int = 500  # rows fetched/encoded per chunk when streaming
+    REST_API_HTTP2: bool = True
+    REST_API_MAX_RETRIES: int = 2  # retries of idempotent requests on 429/502/503/504 or network errors
+    REST_API_RETRY_BACKOFF: float = 0.5  # seconds, doubled on every retry
+    REST_API_MAX_FOLLOW_PAGES: int = 10
+    
+    # Caching
+    CACHE_BACKEND: str = "memory"  # "memory" (per worker) or "redis" (shared)
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    QUERY_CACHE_DEFAULT_TTL: int = 0  # seconds; data sources may override with cache_ttl
+    QUERY_CACHE_MAX_ENTRIES: int = 1000
+    REST_API_HTTP_CACHE_TTL: int = 3600  # seconds stale responses are kept for conditional requests
+    REST_API_HTTP_CACHE_MAX_ENTRIES: int = 1000
+    PUBLISHED_APP_CACHE_TTL: int = 86400  # seconds; snapshot bodies never change, so this only bounds memory
+    PUBLISHED_APP_CACHE_MAX_ENTRIES: int = 500
+    SCHEMA_CACHE_TTL: int = 3600  # seconds before a persisted schema is re-introspected
+    MONGODB_SCHEMA_SAMPLE_SIZE: int = 100  # documents sampled per collection
+    MONGODB_SCHEMA_TIME_BUDGET: int = 10  # seconds for sampling all collections
+    MONGODB_SCHEMA_MAX_WORKERS: int = 8
+
+    # Plugin marketplace search
+    PLUGIN_SEARCH_BACKEND: str = "auto"  # "auto" (native full-text on MySQL/PostgreSQL) or "memory"
+    PLUGIN_SEARCH_TYPO_FALLBACK: bool = True  # retry native searches without hits on the in-process index
+    PLUGIN_SEARCH_MAX_CANDIDATES: int = 1000  # best in-process matches handed to the SQL query
+    PLUGIN_SEARCH_REFRESH_INTERVAL: int = 30  # seconds between syncs of the in-process index
+    PLUGIN_RATING_RECONCILE_INTERVAL: int = 3600  # seconds between rating aggregate repairs; 0 disables
+    PLUGIN_DOWNLOAD_FLUSH_INTERVAL: int = 5  # seconds between writes of buffered download counts
+    PLUGIN_DOWNLOAD_RECONCILE_INTERVAL: int = 3600  # seconds between download count repairs; 0 disables
+    PLUGIN_STATS_CACHE_TTL: int = 60  # seconds; dropped sooner when this worker changes plugins or categories
+    
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,81 @@
+import threading
+import uuid
+from typing import Dict
+
+import redis
+
+from .config import settings
+
+
+class MemoryCounterBuffer:
+    """Per-worker buffer of pending counter increments"""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: int, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + amount
+
+    def drain(self) -> Dict[int, int]:
+        """Take every pending increment, leaving the buffer empty"""
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+    def restore(self, counts: Dict[int, int]) -> None:
+        """Put back increments that could not be applied"""
+        for key, amount in counts.items():
+            self.add(key, amount)
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+
+class RedisCounterBuffer:
+    """
+    Buffer of pending counter increments in a Redis hash shared by all workers.
+
+    Draining renames the hash before reading it, so increments made while a
+    flush runs land in a fresh hash and are never lost or counted twice.
+    """
+
+    def __init__(self, url: str, name: str, namespace: str = "reshift:"):
+        self.key = f"{namespace}counters:{name}"
+        self._client = redis.Redis.from_url(url)
+
+    def add(self, key: int, amount: int = 1) -> None:
+        try:
+            self._client.hincrby(self.key, str(key), amount)
+        except redis.RedisError as e:
+            # Reconciliation repairs the count; the write that triggered it must not fail
+            print(f"Failed to buffer counter increment for {key}: {e}")
+
+    def drain(self) -> Dict[int, int]:
+        draining = f"{self.key}:draining:{uuid.uuid4().hex}"
+        try:
+            self._client.rename(self.key, draining)
+        except redis.ResponseError:
+            # No such key: nothing is pending
+            return {}
+        counts = self._client.hgetall(draining)
+        self._client.delete(draining)
+        return {int(key): int(amount) for key, amount in counts.items()}
+
+    def restore(self, counts: Dict[int, int]) -> None:
+        pipeline = self._client.pipeline()
+        for key, amount in counts.items():
+            pipeline.hincrby(self.key, str(key), amount)
+        pipeline.execute()
+
+    def pending(self) -> int:
+        return sum(int(amount) for amount in self._client.hvals(self.key))
+
+
+def create_counter_buffer(name: str):
+    """Create the counter buffer matching `CACHE_BACKEND`"""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCounterBuffer(settings.CACHE_REDIS_URL, name)
+    return MemoryCounterBuffer()
@@ -0,0 +1,117 @@
+from typing import List, Tuple
+
+from sqlalchemy import Column, and_, func, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from .database import Base
+
+# Columns added to tables that already existed: `create_all` only creates
+# missing tables, so these are added to existing databases on startup.
+# DEPLOYMENT_GUIDE.md lists the same changes as SQL.
+ADDED_COLUMNS = {
+    "apps": ("published_version",),
+    "data_sources": ("cache_ttl", "query_timeout"),
+    "plugins": (
+        "rating_sum", "rating_1_count", "rating_2_count", "rating_3_count", "rating_4_count", "rating_5_count",
+    ),
+}
+
+# Snapshots were first keyed by (slug, version) in app_snapshots; their rows are
+# copied to app_published_snapshots, keyed by (app_id, version)
+LEGACY_SNAPSHOT_TABLE = "app_snapshots"
+SNAPSHOT_COLUMNS = ("app_id", "version", "content", "content_size", "etag", "created_at")
+
+
+def upgrade_schema(engine: Engine) -> List[Tuple[str, str]]:
+    """Bring an existing database up to the models (run after `create_all`); returns the columns added"""
+    added = add_missing_columns(engine)
+    if any(table_name == "plugins" for table_name, _ in added):
+        backfill_plugin_ratings(engine)
+    copy_legacy_snapshots(engine)
+    return added
+
+
+def add_missing_columns(engine: Engine) -> List[Tuple[str, str]]:
+    """Add the `ADDED_COLUMNS` an existing table lacks; safe when several workers start at once"""
+    added = []
+    for table_name, column_names in ADDED_COLUMNS.items():
+        inspector = inspect(engine)
+        if not inspector.has_table(table_name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        table = Base.metadata.tables[table_name]
+        for name in column_names:
+            if name in existing:
+                continue
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(_add_column_ddl(engine, table.c[name])))
+            except DBAPIError:
+                # Another worker may have added it first
+                if name not in {column["name"] for column in inspect(engine).get_columns(table_name)}:
+                    raise
+                continue
+            print(f"Added column {table_name}.{name}")
+            added.append((table_name, name))
+    return added
+
+
+def backfill_plugin_ratings(engine: Engine) -> None:
+    """Fill new rating aggregate columns from plugin_reviews, so rated plugins don't read as 0"""
+    plugins = Base.metadata.tables["plugins"]
+    reviews = Base.metadata.tables["plugin_reviews"]
+
+    def of_plugin(aggregate, *criteria):
+        return select(aggregate).where(and_(reviews.c.plugin_id == plugins.c.id, *criteria)).scalar_subquery()
+
+    values = {"rating_sum": of_plugin(func.coalesce(func.sum(reviews.c.rating), 0))}
+    for star in range(1, 6):
+        values[f"rating_{star}_count"] = of_plugin(func.count(), reviews.c.rating == star)
+    # A schema upgrade is not an edit: keep updated_at as it was
+    values["updated_at"] = plugins.c.updated_at
+    with engine.begin() as conn:
+        filled = conn.execute(update(plugins).values(values)).rowcount
+    print(f"Backfilled rating aggregates of {filled} plugins")
+
+
+def copy_legacy_snapshots(engine: Engine) -> int:
+    """Copy the rows of the legacy snapshot table once, while the new table is empty"""
+    if not inspect(engine).has_table(LEGACY_SNAPSHOT_TABLE):
+        return 0
+    snapshots = Base.metadata.tables["app_published_snapshots"]
+    if _has_rows(engine, snapshots):
+        return 0
+    quote = engine.dialect.identifier_preparer.quote
+    columns = ", ".join(quote(name) for name in SNAPSHOT_COLUMNS)
+    try:
+        with engine.begin() as conn:
+            copied = conn.execute(text(
+                f"INSERT INTO {quote(snapshots.name)} ({columns}) "
+                f"SELECT {columns} FROM {quote(LEGACY_SNAPSHOT_TABLE)}"
+            )).rowcount
+    except DBAPIError:
+        # Another worker may have copied them first
+        if not _has_rows(engine, snapshots):
+            raise
+        return 0
+    if copied:
+        print(f"Copied {copied} snapshots from {LEGACY_SNAPSHOT_TABLE}")
+    return copied
+
+
+def _has_rows(engine: Engine, table) -> bool:
+    with engine.connect() as conn:
+        return bool(conn.execute(select(func.count()).select_from(table)).scalar())
+
+
+def _add_column_ddl(engine: Engine, column: Column) -> str:
+    quote = engine.dialect.identifier_preparer.quote
+    ddl = (
+        f"ALTER TABLE {quote(column.table.name)} ADD COLUMN {quote(column.name)} "
+        f"{column.type.compile(dialect=engine.dialect)}"
+    )
+    if column.nullable:
+        return ddl + " NULL"
+    # Existing rows take the model's default
+    return ddl + f" NOT NULL DEFAULT {column.default.arg}"
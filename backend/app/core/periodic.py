@@ -0,0 +1,14 @@
+import asyncio
+from typing import Any, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+
+async def run_periodically(interval: float, job: Callable[[], Any], name: str) -> None:
+    """Run a blocking `job` in the threadpool every `interval` seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(job)
+        except Exception as e:
+            print(f"Periodic job '{name}' failed: {e}")
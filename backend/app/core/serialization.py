@@ -0,0 +1,38 @@
+import decimal
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not handle natively, matching FastAPI's encoder"""
+    if isinstance(value, BaseModel):
+        return dict(value)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("utf-8", errors="replace")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def json_dumps(value: Any) -> bytes:
+    """Serialize to JSON bytes with orjson"""
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded with orjson.
+
+    Returning it from a route skips FastAPI's response_model validation and
+    `jsonable_encoder`, which walk every value of large query results.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
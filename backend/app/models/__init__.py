@@ -1,8 +1,8 @@
 from .user import User
-from .app import App
+from .app import App, AppSnapshot
 from .component import Component
-from .data_source import DataSource
+from .data_source import DataSource, DataSourceSchema
 from .layout import Layout
 from .page import Page
 
-__all__ = ["User", "App", "Component", "DataSource", "Layout", "Page"]
+__all__ = ["User", "App", "AppSnapshot", "Component", "DataSource", "DataSourceSchema", "Layout", "Page"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, JSON, Text, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -13,6 +13,7 @@ class App(Base):
     slug = Column(String(255), unique=True, index=True, nullable=False)
     config = Column(JSON, nullable=True)  # JSON configuration of the app
     is_published = Column(Boolean, default=False, nullable=False)
+    published_version = Column(Integer, nullable=True)  # Snapshot served to the public
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -25,3 +26,19 @@ class App(Base):
     layouts = relationship("Layout", back_populates="app", cascade="all, delete-orphan")
     pages = relationship("Page", back_populates="app", cascade="all, delete-orphan")
     plugin_installations = relationship("PluginInstallation", back_populates="app", cascade="all, delete-orphan")
+    snapshots = relationship("AppSnapshot", back_populates="app", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class AppSnapshot(Base):
+    """Immutable build of a published app's content, one row per publish"""
+    __tablename__ = "app_published_snapshots"
+
+    app_id = Column(Integer, ForeignKey("apps.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, primary_key=True)  # Numbered per app, from 1
+    content = Column(LargeBinary(length=2**32 - 1), nullable=False)  # zlib-compressed AppWithContent JSON
+    content_size = Column(Integer, nullable=False)  # Uncompressed size in bytes
+    etag = Column(String(66), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    app = relationship("App", back_populates="snapshots")
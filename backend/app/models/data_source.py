@@ -24,6 +24,8 @@ class DataSource(Base):
     connection_config = Column(JSON, nullable=False)  # Connection parameters (encrypted)
     test_query = Column(Text, nullable=True)  # Test query to validate connection
     is_active = Column(Boolean, default=True, nullable=False)
+    cache_ttl = Column(Integer, nullable=True)  # Query result cache TTL in seconds (None = default, 0 = off)
+    query_timeout = Column(Integer, nullable=True)  # Query timeout in seconds (None = default)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -32,3 +34,18 @@ class DataSource(Base):
     
     # Relationships
     owner = relationship("User", back_populates="data_sources")
+    schema_snapshot = relationship(
+        "DataSourceSchema", uselist=False, back_populates="data_source", cascade="all, delete-orphan"
+    )
+
+
+class DataSourceSchema(Base):
+    """Persisted result of schema introspection for a data source"""
+    __tablename__ = "data_source_schemas"
+
+    data_source_id = Column(Integer, ForeignKey("data_sources.id"), primary_key=True)
+    schema_info = Column(JSON, nullable=False)  # Full introspected schema
+    introspected_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Relationships
+    data_source = relationship("DataSource", back_populates="schema_snapshot")
@@ -1,9 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Float, Index, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 
+def plugin_search_vector(name, description, long_description):
+    """PostgreSQL tsvector of a plugin's searchable text, weighted name > description > long description"""
+    def weighted(column, weight):
+        document = func.to_tsvector(literal_column("'english'::regconfig"), func.coalesce(column, literal_column("''")))
+        return func.setweight(document, literal_column(f"'{weight}'"))
+
+    return weighted(name, "A").op("||")(weighted(description, "B")).op("||")(weighted(long_description, "C"))
+
+
 class PluginCategory(Base):
     __tablename__ = "plugin_categories"
 
@@ -55,18 +64,41 @@ class Plugin(Base):
     download_count = Column(Integer, default=0, nullable=False)
     rating = Column(Float, default=0.0, nullable=False)
     review_count = Column(Integer, default=0, nullable=False)
+    # Running rating aggregates, updated in SQL with each review write
+    rating_sum = Column(Integer, default=0, nullable=False)
+    rating_1_count = Column(Integer, default=0, nullable=False)
+    rating_2_count = Column(Integer, default=0, nullable=False)
+    rating_3_count = Column(Integer, default=0, nullable=False)
+    rating_4_count = Column(Integer, default=0, nullable=False)
+    rating_5_count = Column(Integer, default=0, nullable=False)
     
     # Metadata
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Full-text search indexes, one per dialect (see app.services.plugin_search)
+    __table_args__ = (
+        Index(
+            "ix_plugins_fulltext", name, description, long_description, mysql_prefix="FULLTEXT"
+        ).ddl_if(dialect="mysql"),
+        Index(
+            "ix_plugins_search_vector", plugin_search_vector(name, description, long_description),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationships
     category = relationship("PluginCategory", back_populates="plugins")
     author = relationship("User", back_populates="plugins")
     installations = relationship("PluginInstallation", back_populates="plugin")
     reviews = relationship("PluginReview", back_populates="plugin")
 
+    @property
+    def rating_histogram(self) -> dict:
+        """Number of reviews per star rating"""
+        return {star: getattr(self, f"rating_{star}_count") or 0 for star in range(1, 6)}
+
 
 class PluginInstallation(Base):
     __tablename__ = "plugin_installations"
@@ -4,12 +4,13 @@ from .app import App, AppCreate, AppUpdate, AppInDB, AppWithComponents, AppPubli
 from .component import Component, ComponentCreate, ComponentUpdate, ComponentInDB, ComponentWithPosition
 from .data_source import (
     DataSource, DataSourceCreate, DataSourceUpdate, DataSourceInDB, 
-    DataSourcePublic, DataSourceTestResult, QueryRequest, QueryResult
+    DataSourcePublic, DataSourceTestResult, QueryRequest, QueryResult, QueryResultFormat, QueryCacheStats, StreamQueryRequest,
+    BatchQueryItem, BatchQueryRequest, BatchQueryResultItem, BatchQueryResult, RunningQuery, QueryGovernorStats
 )
 from .layout import Layout, LayoutCreate, LayoutUpdate, LayoutInDB
 from .token import Token, TokenData
 from .plugin import (
-    Plugin, PluginCreate, PluginUpdate, PluginPublic, PluginCategory, PluginCategoryCreate, PluginCategoryUpdate,
+    Plugin, PluginCreate, PluginUpdate, PluginPublic, PluginCard, PluginCategory, PluginCategoryCreate, PluginCategoryUpdate,
     PluginInstallation, PluginInstallationCreate, PluginInstallationUpdate,
     PluginReview, PluginReviewCreate, PluginReviewUpdate, PluginReviewPublic,
     PluginSearchFilters, PluginStats, PluginType
@@ -24,13 +25,14 @@ __all__ = [
     "Component", "ComponentCreate", "ComponentUpdate", "ComponentInDB", "ComponentWithPosition",
     # Data source schemas
     "DataSource", "DataSourceCreate", "DataSourceUpdate", "DataSourceInDB", 
-    "DataSourcePublic", "DataSourceTestResult", "QueryRequest", "QueryResult",
+    "DataSourcePublic", "DataSourceTestResult", "QueryRequest", "QueryResult", "QueryResultFormat", "QueryCacheStats", "StreamQueryRequest",
+    "BatchQueryItem", "BatchQueryRequest", "BatchQueryResultItem", "BatchQueryResult", "RunningQuery", "QueryGovernorStats",
     # Layout schemas
     "Layout", "LayoutCreate", "LayoutUpdate", "LayoutInDB",
     # Token schemas
     "Token", "TokenData",
     # Plugin schemas
-    "Plugin", "PluginCreate", "PluginUpdate", "PluginPublic", "PluginCategory", "PluginCategoryCreate", "PluginCategoryUpdate",
+    "Plugin", "PluginCreate", "PluginUpdate", "PluginPublic", "PluginCard", "PluginCategory", "PluginCategoryCreate", "PluginCategoryUpdate",
     "PluginInstallation", "PluginInstallationCreate", "PluginInstallationUpdate",
     "PluginReview", "PluginReviewCreate", "PluginReviewUpdate", "PluginReviewPublic",
     "PluginSearchFilters", "PluginStats", "PluginType"
@@ -25,6 +25,7 @@ class AppUpdate(BaseModel):
 class AppInDB(AppBase):
     id: int
     owner_id: int
+    published_version: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from enum import Enum
 from app.models.data_source import DataSourceType
 
 
@@ -11,6 +12,8 @@ class DataSourceBase(BaseModel):
     connection_config: Dict[str, Any]
     test_query: Optional[str] = None
     is_active: bool = True
+    cache_ttl: Optional[int] = Field(None, ge=0)
+    query_timeout: Optional[int] = Field(None, ge=1)
 
     @validator('connection_config')
     def validate_connection_config(cls, v, values):
@@ -37,6 +40,8 @@ class DataSourceUpdate(BaseModel):
     connection_config: Optional[Dict[str, Any]] = None
     test_query: Optional[str] = None
     is_active: Optional[bool] = None
+    cache_ttl: Optional[int] = Field(None, ge=0)
+    query_timeout: Optional[int] = Field(None, ge=1)
 
 
 class DataSourceInDB(DataSourceBase):
@@ -60,6 +65,8 @@ class DataSourcePublic(BaseModel):
     description: Optional[str] = None
     type: DataSourceType
     is_active: bool
+    cache_ttl: Optional[int] = None
+    query_timeout: Optional[int] = None
     created_at: datetime
 
     class Config:
@@ -74,11 +81,30 @@ class DataSourceTestResult(BaseModel):
     error: Optional[str] = None
 
 
+class QueryResultFormat(str, Enum):
+    ROWS = "rows"  # data: list of row objects
+    COLUMNAR = "columnar"  # columns + column_data: one array per column
+
+
 class QueryRequest(BaseModel):
     """Request to execute query on data source"""
     query: str
     parameters: Optional[Dict[str, Any]] = None
     limit: Optional[int] = Field(100, le=1000)  # Max 1000 rows
+    format: QueryResultFormat = QueryResultFormat.ROWS
+    # Cursor pagination: SQL pages by `order_key` (a unique column), MongoDB by
+    # _id and REST APIs by the `pagination` settings in the query JSON
+    paginate: bool = False
+    order_key: Optional[str] = None
+    order_desc: bool = False
+    cursor: Optional[str] = None  # next_cursor returned with the previous page
+    # Client-chosen id for cancelling the query while it runs; generated if omitted
+    query_id: Optional[str] = Field(None, max_length=64, pattern=r"^[A-Za-z0-9_-]+$")
+
+
+class StreamQueryRequest(QueryRequest):
+    """Request to stream query results; the row limit is optional and uncapped"""
+    limit: Optional[int] = Field(None, ge=1)
 
 
 class QueryResult(BaseModel):
@@ -86,6 +112,67 @@ class QueryResult(BaseModel):
     success: bool
     data: Optional[List[Dict[str, Any]]] = None
     columns: Optional[List[str]] = None
+    column_data: Optional[List[List[Any]]] = None  # Set instead of data for columnar results
     row_count: int = 0
     error: Optional[str] = None
     execution_time_ms: Optional[float] = None
+    cached: bool = False
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
+    query_id: Optional[str] = None
+
+
+class BatchQueryItem(BaseModel):
+    """A single query within a batch request"""
+    key: Optional[str] = None  # Client-supplied id echoed back in the result
+    data_source_id: int
+    query: QueryRequest
+
+
+class BatchQueryRequest(BaseModel):
+    """Request to execute many queries in one round trip"""
+    queries: List[BatchQueryItem] = Field(..., min_length=1, max_length=100)
+
+
+class BatchQueryResultItem(BaseModel):
+    """Result of a single query within a batch"""
+    key: Optional[str] = None
+    data_source_id: int
+    result: QueryResult
+
+
+class BatchQueryResult(BaseModel):
+    """Results of a batch query, in request order"""
+    results: List[BatchQueryResultItem]
+    execution_time_ms: float
+
+
+class QueryCacheStats(BaseModel):
+    """Query result cache counters for the current worker"""
+    backend: str
+    hits: int
+    misses: int
+    hit_ratio: float
+    entries: Optional[int] = None  # not reported by the Redis backend
+
+
+class RunningQuery(BaseModel):
+    """A data source query currently queued or running"""
+    query_id: str
+    data_source_id: int
+    owner_id: int
+    state: str  # "queued" or "running"
+    timeout: int
+    elapsed_ms: float
+
+
+class QueryGovernorStats(BaseModel):
+    """Query governor counters for the current worker"""
+    started: int
+    completed: int
+    failed: int
+    queued: int
+    rejected: int
+    timed_out: int
+    cancelled: int
+    running: int
+    waiting: int
@@ -97,6 +97,33 @@ class PluginPublic(Plugin):
     """Public plugin schema for marketplace display"""
     category: Optional[PluginCategory] = None
     author_name: Optional[str] = None
+    rating_histogram: Dict[int, int] = {}
+
+
+class PluginCard(BaseModel):
+    """Marketplace listing entry; source, assets and configuration come from GET /plugins/{id}"""
+    id: int
+    name: str
+    slug: str
+    description: Optional[str] = None
+    version: str
+    plugin_type: PluginType
+    category_id: int
+    category: Optional[PluginCategory] = None
+    author_id: int
+    is_free: bool
+    price: Optional[float] = None
+    currency: str
+    is_featured: bool
+    is_verified: bool
+    download_count: int
+    rating: float
+    review_count: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
 
 
 class PluginInstallationBase(BaseModel):
@@ -165,7 +192,7 @@ class PluginSearchFilters(BaseModel):
     is_featured: Optional[bool] = None
     min_rating: Optional[float] = Field(None, ge=0, le=5)
     search_query: Optional[str] = None
-    sort_by: Optional[str] = Field(default="download_count")  # download_count, rating, created_at
+    sort_by: Optional[str] = None  # relevance, download_count, rating, created_at, name (default: relevance when searching, else download_count)
     sort_order: Optional[str] = Field(default="desc")  # asc, desc
 
 
@@ -176,6 +203,9 @@ class PluginStats(BaseModel):
     featured_plugins: int
     free_plugins: int
     paid_plugins: int
+    # Active plugins per facet value, for the marketplace filters
+    category_counts: Dict[int, int] = {}
+    type_counts: Dict[str, int] = {}
 
 
 
@@ -1,8 +1,14 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+import hashlib
+import zlib
+from typing import Optional, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
-from app.models.app import App as AppModel
-from app.schemas import AppCreate, AppUpdate
+from app.core.database import SessionLocal
+from app.core.serialization import json_dumps
+from app.models.app import App as AppModel, AppSnapshot as AppSnapshotModel
+from app.schemas import AppCreate, AppUpdate, AppWithContent
 from app.services.base import BaseService
 
 
@@ -19,14 +25,44 @@ class AppService(BaseService[AppModel, AppCreate, AppUpdate]):
         return (
             self.db.query(AppModel)
             .options(
-                joinedload(AppModel.components),
-                joinedload(AppModel.pages),
-                joinedload(AppModel.layouts)
+                selectinload(AppModel.components),
+                selectinload(AppModel.pages),
+                selectinload(AppModel.layouts)
             )
             .filter(AppModel.slug == slug)
             .first()
         )
 
+    def get_with_content(self, app_id: int) -> Optional[AppModel]:
+        """Get app by ID with all related content (components, pages, layouts)"""
+        return (
+            self.db.query(AppModel)
+            .options(
+                selectinload(AppModel.components),
+                selectinload(AppModel.pages),
+                selectinload(AppModel.layouts)
+            )
+            .filter(AppModel.id == app_id)
+            .first()
+        )
+
+    def get_published_version(self, slug: str) -> Optional[Tuple[int, int]]:
+        """(app id, current snapshot version) of a published app"""
+        current = (
+            self.db.query(AppModel.id, AppModel.published_version)
+            .filter(
+                AppModel.slug == slug,
+                AppModel.is_published == True,
+                AppModel.published_version.isnot(None),
+            )
+            .first()
+        )
+        return tuple(current) if current else None
+
+    def get_published_snapshot(self, app_id: int, version: int) -> Optional[AppSnapshotModel]:
+        """Get one version of an app's published snapshots"""
+        return self.db.get(AppSnapshotModel, (app_id, version))
+
     def get_by_owner(self, owner_id: int, skip: int = 0, limit: int = 100) -> List[AppModel]:
         """Get apps by owner"""
         return (
@@ -52,8 +88,8 @@ class AppService(BaseService[AppModel, AppCreate, AppUpdate]):
         return (
             self.db.query(AppModel)
             .options(
-                joinedload(AppModel.components),
-                joinedload(AppModel.layouts)
+                selectinload(AppModel.components),
+                selectinload(AppModel.layouts)
             )
             .filter(AppModel.id == app_id)
             .first()
@@ -96,10 +132,13 @@ class AppService(BaseService[AppModel, AppCreate, AppUpdate]):
         return db_app
 
     def publish(self, app_id: int) -> Optional[AppModel]:
-        """Publish app"""
-        db_app = self.get(app_id)
+        """Publish app as a new immutable snapshot of its current content"""
+        db_app = self.get_with_content(app_id)
         if db_app:
+            snapshot = self._build_snapshot(db_app)
+            self.db.add(snapshot)
             db_app.is_published = True
+            db_app.published_version = snapshot.version
             self.db.commit()
             self.db.refresh(db_app)
         return db_app
@@ -171,3 +210,47 @@ class AppService(BaseService[AppModel, AppCreate, AppUpdate]):
             "is_published": app.is_published,
             "config_size": len(str(app.config)) if app.config else 0
         }
+
+    def _build_snapshot(self, app: AppModel) -> AppSnapshotModel:
+        """Serialize and compress an app loaded with its content as its next version"""
+        latest = (
+            self.db.query(func.max(AppSnapshotModel.version))
+            .filter(AppSnapshotModel.app_id == app.id)
+            .scalar()
+        )
+        body = json_dumps(AppWithContent.model_validate(app))
+        return AppSnapshotModel(
+            version=(latest or 0) + 1,
+            app_id=app.id,
+            content=zlib.compress(body),
+            content_size=len(body),
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+
+    def backfill_snapshots(self) -> int:
+        """Snapshot apps published before snapshots existed; returns how many were snapshotted"""
+        app_ids = [
+            app_id for (app_id,) in self.db.query(AppModel.id)
+            .filter(AppModel.is_published == True, AppModel.published_version.is_(None))
+        ]
+        snapshotted = 0
+        for app_id in app_ids:
+            try:
+                self.publish(app_id)
+                snapshotted += 1
+            except IntegrityError:
+                # Another worker snapshotted it first
+                self.db.rollback()
+        return snapshotted
+
+
+def backfill_published_snapshots() -> int:
+    """Startup job: give apps published before snapshots existed their first snapshot"""
+    db = SessionLocal()
+    try:
+        snapshotted = AppService(db).backfill_snapshots()
+        if snapshotted:
+            print(f"Snapshotted {snapshotted} published apps")
+        return snapshotted
+    finally:
+        db.close()
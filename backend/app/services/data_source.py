@@ -1,19 +1,406 @@
 import time
 import json
-from typing import Optional, List, Dict, Any
+import asyncio
+import itertools
+import uuid
+from datetime import datetime, timedelta
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Set
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 import httpx
 import pymongo
+from bson import ObjectId
 import redis
+import redis.asyncio as redis_asyncio
 import pandas as pd
+from fastapi.concurrency import run_in_threadpool
 
-from app.models.data_source import DataSource as DataSourceModel, DataSourceType
+from app.core.config import settings
+from app.core.serialization import json_dumps
+from app.models.data_source import (
+    DataSource as DataSourceModel, DataSourceSchema as DataSourceSchemaModel, DataSourceType
+)
 from app.schemas import (
     DataSourceCreate, DataSourceUpdate, DataSourceTestResult, 
-    QueryRequest, QueryResult
+    QueryRequest, QueryResult, QueryResultFormat, StreamQueryRequest
 )
 from app.services.base import BaseService
+from app.services.pagination import DEFAULT_PAGE_SIZE, build_keyset_query, decode_cursor, encode_cursor
+from app.services.graphql import (
+    INTROSPECTION_QUERY, PING_QUERY, introspection_cache, is_persisted_query_not_found,
+    persisted_query_extension, strip_query_text, summarize_introspection
+)
+from app.services.http_cache import http_response_cache, parse_retry_after
+from app.services.query_cache import query_cache, is_cacheable_query, query_fingerprint
+from app.services.query_governor import current_ticket, query_governor, run_with_ticket
+from app.services.schema_inference import infer_fields
+
+
+def _config_fingerprint(config: dict) -> str:
+    """Stable hash of a connection config, used to detect config changes"""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PooledRegistry:
+    """
+    Process-wide LRU registry of per-data-source connection resources.
+
+    Resources are keyed by data source id and remember the fingerprint of the
+    connection config they were built from, so a changed config gets a fresh
+    resource. Resources unused for `idle_timeout` seconds are released, and at
+    most `max_open` are kept open (least recently used go first). Subclasses
+    define how a resource is released.
+    """
+
+    def __init__(self, idle_timeout: int, max_open: int):
+        self.idle_timeout = idle_timeout
+        self.max_open = max_open
+        # data_source_id -> (config fingerprint, resource, last used)
+        self._resources: "OrderedDict[int, Tuple[str, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, data_source_id: int, config: dict, factory: Callable[[], Any]) -> Any:
+        """Return the cached resource for a data source, creating it if needed"""
+        fingerprint = _config_fingerprint(config)
+        now = time.monotonic()
+        stale: List[Any] = []
+
+        with self._lock:
+            entry = self._resources.pop(data_source_id, None)
+            if entry is not None and entry[0] != fingerprint:
+                stale.append(entry[1])
+                entry = None
+
+            resource = factory() if entry is None else entry[1]
+            self._resources[data_source_id] = (fingerprint, resource, now)
+            stale.extend(self._collect_evictions(now))
+
+        for old_resource in stale:
+            self._release(old_resource)
+        return resource
+
+    def _release(self, resource: Any) -> None:
+        resource.close()
+
+    def invalidate(self, data_source_id: int) -> None:
+        """Release the resource of a data source (e.g. after its config changed)"""
+        with self._lock:
+            entry = self._resources.pop(data_source_id, None)
+        if entry is not None:
+            self._release(entry[1])
+
+    def close_all(self) -> None:
+        """Release every cached resource (used on application shutdown)"""
+        with self._lock:
+            entries = list(self._resources.values())
+            self._resources.clear()
+        for _, resource, _ in entries:
+            self._release(resource)
+
+    def _collect_evictions(self, now: float) -> List[Any]:
+        """Pop idle and over-capacity resources; caller must hold the lock"""
+        evicted = []
+        for ds_id in list(self._resources.keys()):
+            last_used = self._resources[ds_id][2]
+            if now - last_used > self.idle_timeout:
+                evicted.append(self._resources.pop(ds_id)[1])
+        while len(self._resources) > self.max_open:
+            _, (_, resource, _) = self._resources.popitem(last=False)
+            evicted.append(resource)
+        return evicted
+
+
+class EngineRegistry(PooledRegistry):
+    """Pooled SQLAlchemy engines for MySQL/PostgreSQL data sources"""
+
+    def __init__(
+        self,
+        pool_size: int,
+        max_overflow: int,
+        pool_timeout: int,
+        pool_recycle: int,
+        idle_timeout: int,
+        max_engines: int,
+    ):
+        super().__init__(idle_timeout=idle_timeout, max_open=max_engines)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+
+    def get_engine(self, data_source_id: int, url: str, config: dict) -> Engine:
+        """Return the pooled engine for a data source, creating it if needed"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: create_engine(
+                url,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+                pool_recycle=self.pool_recycle,
+                pool_pre_ping=True,
+            ),
+        )
+
+    def _release(self, resource: Engine) -> None:
+        resource.dispose()
+
+
+class ClientRegistry(PooledRegistry):
+    """Pooled MongoDB, Redis and HTTP clients for non-SQL data sources"""
+
+    def __init__(self, pool_size: int, keepalive_expiry: int, idle_timeout: int, max_clients: int, http2: bool):
+        super().__init__(idle_timeout=idle_timeout, max_open=max_clients)
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+    def get_mongo_client(self, data_source_id: int, config: dict) -> pymongo.MongoClient:
+        """Return the pooled MongoClient for a data source"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: pymongo.MongoClient(
+                host=config['host'],
+                port=config['port'],
+                username=config.get('username'),
+                password=config.get('password'),
+                maxPoolSize=self.pool_size,
+                maxIdleTimeMS=self.keepalive_expiry * 1000,
+            ),
+        )
+
+    def get_redis_client(self, data_source_id: int, config: dict) -> redis.Redis:
+        """Return the pooled Redis client for a data source"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: redis.Redis(
+                host=config['host'],
+                port=config['port'],
+                password=config.get('password'),
+                db=config.get('db', 0),
+                max_connections=self.pool_size,
+                socket_keepalive=True,
+                health_check_interval=self.keepalive_expiry,
+            ),
+        )
+
+    def get_http_client(self, data_source_id: int, config: dict) -> httpx.Client:
+        """Return the keep-alive (HTTP/2 when enabled) httpx client for a REST/GraphQL data source"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: httpx.Client(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            ),
+        )
+
+
+engine_registry = EngineRegistry(
+    pool_size=settings.DATA_SOURCE_POOL_SIZE,
+    max_overflow=settings.DATA_SOURCE_MAX_OVERFLOW,
+    pool_timeout=settings.DATA_SOURCE_POOL_TIMEOUT,
+    pool_recycle=settings.DATA_SOURCE_POOL_RECYCLE,
+    idle_timeout=settings.DATA_SOURCE_ENGINE_IDLE_TIMEOUT,
+    max_engines=settings.DATA_SOURCE_MAX_ENGINES,
+)
+
+client_registry = ClientRegistry(
+    pool_size=settings.DATA_SOURCE_POOL_SIZE,
+    keepalive_expiry=settings.DATA_SOURCE_KEEPALIVE_EXPIRY,
+    idle_timeout=settings.DATA_SOURCE_ENGINE_IDLE_TIMEOUT,
+    max_clients=settings.DATA_SOURCE_MAX_CLIENTS,
+    http2=settings.REST_API_HTTP2,
+)
+
+
+class AsyncClientRegistry(PooledRegistry):
+    """Pooled async Redis and HTTP clients used by the async query path"""
+
+    def __init__(
+        self, pool_size: int, keepalive_expiry: int, timeout: int, idle_timeout: int, max_clients: int, http2: bool
+    ):
+        super().__init__(idle_timeout=idle_timeout, max_open=max_clients)
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.http2 = http2
+        # Loop the clients were created on; closes requested from other threads run there
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set["asyncio.Future[None]"] = set()
+
+    def _get(self, data_source_id: int, config: dict, factory: Callable[[], Any]) -> Any:
+        self._loop = asyncio.get_running_loop()
+        return super()._get(data_source_id, config, factory)
+
+    def get_redis_client(self, data_source_id: int, config: dict) -> redis_asyncio.Redis:
+        """Return the pooled asyncio Redis client for a data source"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: redis_asyncio.Redis(
+                host=config['host'],
+                port=config['port'],
+                password=config.get('password'),
+                db=config.get('db', 0),
+                max_connections=self.pool_size,
+                socket_keepalive=True,
+                socket_timeout=self.timeout,
+                health_check_interval=self.keepalive_expiry,
+            ),
+        )
+
+    def get_http_client(self, data_source_id: int, config: dict) -> httpx.AsyncClient:
+        """Return the keep-alive httpx.AsyncClient for a REST/GraphQL data source"""
+        return self._get(
+            data_source_id,
+            config,
+            lambda: httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            ),
+        )
+
+    def _release(self, resource: Any) -> None:
+        # Async clients can only be closed on the loop that owns them
+        try:
+            closing = asyncio.get_running_loop().create_task(self._aclose(resource))
+        except RuntimeError:
+            # Called from a threadpool worker (sync routes updating or deleting a data source)
+            if self._loop is None or self._loop.is_closed():
+                return
+            closing = asyncio.run_coroutine_threadsafe(self._aclose(resource), self._loop)
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
+
+    async def _aclose(self, resource: Any) -> None:
+        if isinstance(resource, httpx.AsyncClient):
+            await resource.aclose()
+        else:
+            await resource.close()
+
+    async def aclose_all(self) -> None:
+        """Close every cached async client (used on application shutdown)"""
+        with self._lock:
+            entries = list(self._resources.values())
+            self._resources.clear()
+        for _, resource, _ in entries:
+            await self._aclose(resource)
+
+
+async_client_registry = AsyncClientRegistry(
+    pool_size=settings.DATA_SOURCE_POOL_SIZE,
+    keepalive_expiry=settings.DATA_SOURCE_KEEPALIVE_EXPIRY,
+    timeout=settings.DATA_SOURCE_QUERY_TIMEOUT,
+    idle_timeout=settings.DATA_SOURCE_ENGINE_IDLE_TIMEOUT,
+    max_clients=settings.DATA_SOURCE_MAX_CLIENTS,
+    http2=settings.REST_API_HTTP2,
+)
+
+async def close_connection_registries() -> None:
+    """Release all pooled data source engines and clients"""
+    engine_registry.close_all()
+    client_registry.close_all()
+    await async_client_registry.aclose_all()
+
+
+_IDEMPOTENT_HTTP_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+_RETRYABLE_HTTP_STATUS_CODES = {429, 502, 503, 504}
+
+# Sorted-set commands whose WITHSCORES replies are flat member/score lists
+_REDIS_SCORED_COMMANDS = {"ZRANGE", "ZREVRANGE", "ZRANGEBYSCORE", "ZREVRANGEBYSCORE", "ZPOPMIN", "ZPOPMAX"}
+
+
+# Single-query bulk introspection per SQL dialect. `column_fields` name the
+# columns selected after the table name.
+_SQL_SCHEMA_QUERIES = {
+    "mysql+pymysql": {
+        "tables": """
+            SELECT TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE()
+            ORDER BY TABLE_NAME
+        """,
+        "columns": """
+            SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() {table_filter}
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """,
+        "table_filter": "AND TABLE_NAME = :table",
+        "column_fields": ["name", "type", "nullable", "key", "default", "extra"],
+    },
+    "postgresql": {
+        "tables": """
+            SELECT table_name, table_type FROM information_schema.tables
+            WHERE table_schema = 'public'
+            ORDER BY table_name
+        """,
+        "columns": """
+            SELECT table_name, column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_schema = 'public' {table_filter}
+            ORDER BY table_name, ordinal_position
+        """,
+        "table_filter": "AND table_name = :table",
+        "column_fields": ["name", "type", "nullable", "default"],
+    },
+}
+
+
+def encode_ndjson(rows: Iterator[dict], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON, emitting `batch_size` rows per chunk"""
+    try:
+        for batch in _batched(rows, batch_size):
+            yield b"".join(json_dumps(row) + b"\n" for row in batch)
+    except Exception as e:
+        yield json_dumps({"error": str(e)}) + b"\n"
+
+
+def encode_json_stream(rows: Iterator[dict], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as a chunked `QueryResult`-shaped JSON document"""
+    yield b'{"data": ['
+    row_count = 0
+    columns: List[str] = []
+    error = None
+    try:
+        for batch in _batched(rows, batch_size):
+            if not row_count:
+                columns = list(batch[0].keys())
+            chunk = b", ".join(json_dumps(row) for row in batch)
+            yield (b", " if row_count else b"") + chunk
+            row_count += len(batch)
+    except Exception as e:
+        error = str(e)
+    trailer = {"columns": columns, "row_count": row_count, "success": error is None, "error": error}
+    yield b"], " + json_dumps(trailer)[1:]
+
+
+def _batched(rows: Iterator[dict], batch_size: int) -> Iterator[List[dict]]:
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourceUpdate]):
@@ -41,6 +428,16 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             .first()
         )
 
+    def get_by_ids(self, data_source_ids: List[int]) -> List[DataSourceModel]:
+        """Get several data sources in one query"""
+        if not data_source_ids:
+            return []
+        return (
+            self.db.query(DataSourceModel)
+            .filter(DataSourceModel.id.in_(data_source_ids))
+            .all()
+        )
+
     def create(self, obj_in: DataSourceCreate, owner_id: int) -> DataSourceModel:
         """Create new data source"""
         # Encrypt connection config (in production, use proper encryption)
@@ -56,6 +453,41 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
         self.db.refresh(db_ds)
         return db_ds
 
+    def update_data_source(self, data_source_id: int, data_source_update: DataSourceUpdate) -> Optional[DataSourceModel]:
+        """Update data source, invalidating cached results and stale connections"""
+        db_ds = self.get(data_source_id)
+        if db_ds:
+            update_data = data_source_update.dict(exclude_unset=True)
+            config_changed = False
+            if update_data.get("connection_config") is not None:
+                update_data["connection_config"] = self._encrypt_connection_config(update_data["connection_config"])
+                config_changed = update_data["connection_config"] != db_ds.connection_config
+
+            for field, value in update_data.items():
+                setattr(db_ds, field, value)
+            if config_changed:
+                # The cached schema may describe a different database now
+                db_ds.schema_snapshot = None
+
+            self.db.commit()
+            self.db.refresh(db_ds)
+
+            query_cache.invalidate(data_source_id)
+            if config_changed:
+                self._release_connections(data_source_id)
+        return db_ds
+
+    def delete_data_source(self, data_source_id: int) -> bool:
+        """Delete data source and release its pooled connections"""
+        db_ds = self.get(data_source_id)
+        if db_ds:
+            self.db.delete(db_ds)
+            self.db.commit()
+            query_cache.invalidate(data_source_id)
+            self._release_connections(data_source_id)
+            return True
+        return False
+
     def test_connection(self, data_source: DataSourceModel) -> DataSourceTestResult:
         """Test data source connection"""
         try:
@@ -65,17 +497,17 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             config = self._decrypt_connection_config(data_source.connection_config)
             
             if data_source.type == DataSourceType.MYSQL:
-                result = self._test_mysql_connection(config, data_source.test_query)
+                result = self._test_mysql_connection(data_source.id, config, data_source.test_query)
             elif data_source.type == DataSourceType.POSTGRESQL:
-                result = self._test_postgresql_connection(config, data_source.test_query)
+                result = self._test_postgresql_connection(data_source.id, config, data_source.test_query)
             elif data_source.type == DataSourceType.MONGODB:
-                result = self._test_mongodb_connection(config)
+                result = self._test_mongodb_connection(data_source.id, config)
             elif data_source.type == DataSourceType.REST_API:
-                result = self._test_rest_api_connection(config)
+                result = self._test_rest_api_connection(data_source.id, config)
             elif data_source.type == DataSourceType.GRAPHQL:
-                result = self._test_graphql_connection(config)
+                result = self._test_graphql_connection(data_source.id, config)
             elif data_source.type == DataSourceType.REDIS:
-                result = self._test_redis_connection(config)
+                result = self._test_redis_connection(data_source.id, config)
             else:
                 return DataSourceTestResult(
                     success=False,
@@ -95,60 +527,396 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
                 error=str(e)
             )
 
-    def execute_query(self, data_source: DataSourceModel, query_request: QueryRequest) -> QueryResult:
-        """Execute query on data source"""
+    async def execute_query_async(self, data_source: DataSourceModel, query_request: QueryRequest) -> QueryResult:
+        """
+        Execute query on data source from an async endpoint.
+
+        REST API, GraphQL and Redis sources use native async clients; SQL and
+        MongoDB sources run their sync drivers in the threadpool. Either way
+        the call is governed by `query_governor`: per-owner and per-source
+        concurrency quotas, a timeout pushed down to the upstream, and
+        cancellation by `query_id`.
+        """
+        query_id = query_request.query_id or uuid.uuid4().hex
         try:
             start_time = time.time()
             
             # Decrypt connection config
             config = self._decrypt_connection_config(data_source.connection_config)
             
-            if data_source.type == DataSourceType.MYSQL:
-                result = self._execute_mysql_query(config, query_request)
-            elif data_source.type == DataSourceType.POSTGRESQL:
-                result = self._execute_postgresql_query(config, query_request)
-            elif data_source.type == DataSourceType.MONGODB:
-                result = self._execute_mongodb_query(config, query_request)
-            elif data_source.type == DataSourceType.REST_API:
-                result = self._execute_rest_api_query(config, query_request)
-            elif data_source.type == DataSourceType.GRAPHQL:
-                result = self._execute_graphql_query(config, query_request)
-            elif data_source.type == DataSourceType.REDIS:
-                result = self._execute_redis_query(config, query_request)
-            else:
-                return QueryResult(
-                    success=False,
-                    error="Unsupported data source type"
+            async def compute() -> dict:
+                return await query_governor.run(
+                    data_source, lambda: self._run_query_async(data_source, config, query_request), query_id
                 )
             
-            execution_time = (time.time() - start_time) * 1000
-            result["execution_time_ms"] = execution_time
+            ttl = self._get_cache_ttl(data_source, query_request)
+            if ttl > 0:
+                key = query_cache.make_key(data_source.id, query_request)
+                result = await query_cache.get_or_compute_async(key, ttl, compute)
+            else:
+                result = await compute()
             
-            return QueryResult(**result)
+            query_result = self._build_query_result(result, start_time)
+            query_result.query_id = query_id
+            return query_result
             
+        except asyncio.TimeoutError:
+            return QueryResult(
+                success=False,
+                error=f"Query timed out after {query_governor.get_timeout(data_source)} seconds",
+                query_id=query_id
+            )
         except Exception as e:
             return QueryResult(
                 success=False,
-                error=str(e)
+                error=str(e),
+                query_id=query_id
             )
 
-    def get_schema(self, data_source: DataSourceModel) -> Dict[str, Any]:
-        """Get schema information for data source"""
+    async def execute_batch_async(
+        self, queries: List[Tuple[DataSourceModel, QueryRequest]]
+    ) -> List[QueryResult]:
+        """
+        Execute many queries concurrently, returning results in input order.
+
+        Identical read-only queries against the same data source run once, and
+        at most `BATCH_QUERY_MAX_PARALLELISM` distinct queries are in flight at
+        a time (on top of the per-source limits of `execute_query_async`).
+        """
+        semaphore = asyncio.Semaphore(settings.BATCH_QUERY_MAX_PARALLELISM)
+        
+        async def run_one(data_source: DataSourceModel, query_request: QueryRequest) -> QueryResult:
+            async with semaphore:
+                return await self.execute_query_async(data_source, query_request)
+        
+        # Group identical read-only (data source, query) pairs so each runs once
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, (data_source, query_request) in enumerate(queries):
+            if is_cacheable_query(data_source, query_request):
+                group_key = (data_source.id, query_fingerprint(query_request))
+            else:
+                group_key = ("write", index)
+            groups.setdefault(group_key, []).append(index)
+        
+        group_indexes = list(groups.values())
+        
+        # Queries on a GraphQL source that accepts batched operations share one request
+        graphql_batches: Dict[int, List[int]] = {}
+        for position, indexes in enumerate(group_indexes):
+            data_source = queries[indexes[0]][0]
+            if data_source.type == DataSourceType.GRAPHQL and self._supports_graphql_batching(data_source):
+                graphql_batches.setdefault(data_source.id, []).append(position)
+        graphql_batches = {key: positions for key, positions in graphql_batches.items() if len(positions) > 1}
+        
+        async def run_graphql_batch(positions: List[int]) -> List[QueryResult]:
+            leaders = [queries[group_indexes[position][0]] for position in positions]
+            async with semaphore:
+                return await self.execute_graphql_batch_async(leaders[0][0], [query for _, query in leaders])
+        
+        batched_positions = {position for positions in graphql_batches.values() for position in positions}
+        single_positions = [position for position in range(len(group_indexes)) if position not in batched_positions]
+        outcomes = await asyncio.gather(
+            *(run_one(*queries[group_indexes[position][0]]) for position in single_positions),
+            *(run_graphql_batch(positions) for positions in graphql_batches.values())
+        )
+        
+        group_results: List[Optional[QueryResult]] = [None] * len(group_indexes)
+        for position, result in zip(single_positions, outcomes):
+            group_results[position] = result
+        for positions, batch_results in zip(graphql_batches.values(), outcomes[len(single_positions):]):
+            for position, result in zip(positions, batch_results):
+                group_results[position] = result
+        
+        results: List[Optional[QueryResult]] = [None] * len(queries)
+        for indexes, result in zip(group_indexes, group_results):
+            for index in indexes:
+                results[index] = result
+        return results
+
+    async def execute_graphql_batch_async(
+        self, data_source: DataSourceModel, query_requests: List[QueryRequest]
+    ) -> List[QueryResult]:
+        """
+        Execute several GraphQL queries on one data source as a single batched request.
+
+        Cached results are served from the query cache; the rest go upstream
+        together as one governed query.
+        """
+        start_time = time.time()
+        results: List[Optional[QueryResult]] = [None] * len(query_requests)
+        cache_keys: Dict[int, Tuple[str, int]] = {}
+        pending: List[int] = []
+        
+        for index, query_request in enumerate(query_requests):
+            ttl = self._get_cache_ttl(data_source, query_request)
+            if ttl > 0:
+                key = query_cache.make_key(data_source.id, query_request)
+                cached = query_cache.get(key)
+                if cached is not None:
+                    results[index] = self._build_query_result(cached, start_time)
+                    continue
+                cache_keys[index] = (key, ttl)
+            pending.append(index)
+        
+        if not pending:
+            return results
+        
+        pending_requests = [query_requests[index] for index in pending]
+        # The upstream request is governed (and cancellable) under one id
+        batch_query_id = pending_requests[0].query_id or uuid.uuid4().hex
         try:
             config = self._decrypt_connection_config(data_source.connection_config)
+            batch_results = await query_governor.run(
+                data_source,
+                lambda: self._execute_graphql_batch_query_async(data_source.id, config, pending_requests),
+                batch_query_id
+            )
+        except asyncio.TimeoutError:
+            error = f"Query timed out after {query_governor.get_timeout(data_source)} seconds"
+            batch_results = [{"success": False, "error": error} for _ in pending]
+        except Exception as e:
+            batch_results = [{"success": False, "error": str(e)} for _ in pending]
+        
+        for index, result in zip(pending, batch_results):
+            if index in cache_keys:
+                key, ttl = cache_keys[index]
+                query_cache.set(key, result, ttl)
+            query_result = self._build_query_result(result, start_time)
+            query_result.query_id = query_requests[index].query_id or batch_query_id
+            results[index] = query_result
+        return results
+
+    def _supports_graphql_batching(self, data_source: DataSourceModel) -> bool:
+        return bool(self._decrypt_connection_config(data_source.connection_config).get('batching'))
+
+    async def stream_query_async(self, data_source: DataSourceModel, query_request: StreamQueryRequest) -> Iterator[dict]:
+        """
+        Start streaming a query under `query_governor`.
+
+        The query holds its owner and data source slots until its rows are
+        consumed, and is bounded by its timeout and cancellable by
+        `query_id` like `execute_query_async`. The first row is fetched
+        before returning, so errors raised while opening the query reach the
+        caller instead of the stream.
+        """
+        ticket = await query_governor.acquire(data_source, query_request.query_id)
+        try:
+            rows = await run_in_threadpool(run_with_ticket, ticket, self.stream_query, data_source, query_request)
+        except BaseException:
+            query_governor.finish(ticket, "failed")
+            raise
+        governed = query_governor.stream(ticket, rows)
+        first = await run_in_threadpool(next, governed, None)
+        if first is None:
+            return iter(())
+        return itertools.chain([first], governed)
+
+    def stream_query(self, data_source: DataSourceModel, query_request: StreamQueryRequest) -> Iterator[dict]:
+        """
+        Yield result rows one at a time with bounded memory.
+
+        SQL sources use server-side cursors, MongoDB iterates its cursor in
+        batches and Redis `SCAN` walks the keyspace incrementally. REST API
+        and GraphQL responses are already in memory and are yielded as-is.
+        """
+        config = self._decrypt_connection_config(data_source.connection_config)
+        batch_size = settings.DATA_SOURCE_STREAM_BATCH_SIZE
+        
+        if data_source.type == DataSourceType.MYSQL:
+            rows = self._stream_sql_query(data_source.id, "mysql+pymysql", config, query_request, batch_size)
+        elif data_source.type == DataSourceType.POSTGRESQL:
+            rows = self._stream_sql_query(data_source.id, "postgresql", config, query_request, batch_size)
+        elif data_source.type == DataSourceType.MONGODB:
+            rows = self._stream_mongodb_query(data_source.id, config, query_request, batch_size)
+        elif data_source.type == DataSourceType.REDIS:
+            rows = self._stream_redis_query(data_source.id, config, query_request, batch_size)
+        elif data_source.type in (DataSourceType.REST_API, DataSourceType.GRAPHQL):
+            rows = iter(self._run_query(data_source, config, query_request)["data"])
+        else:
+            raise ValueError("Unsupported data source type")
+        
+        if query_request.limit is not None:
+            rows = itertools.islice(rows, query_request.limit)
+        return rows
+
+    def _run_query(self, data_source: DataSourceModel, config: dict, query_request: QueryRequest) -> dict:
+        """Dispatch a query to the connector for the data source type"""
+        args = (data_source.id, config, query_request)
+        
+        if data_source.type == DataSourceType.MYSQL:
+            result = self._execute_mysql_query(*args)
+        elif data_source.type == DataSourceType.POSTGRESQL:
+            result = self._execute_postgresql_query(*args)
+        elif data_source.type == DataSourceType.MONGODB:
+            result = self._execute_mongodb_query(*args)
+        elif data_source.type == DataSourceType.REST_API:
+            result = self._execute_rest_api_query(*args)
+        elif data_source.type == DataSourceType.GRAPHQL:
+            result = self._execute_graphql_query(*args)
+        elif data_source.type == DataSourceType.REDIS:
+            result = self._execute_redis_query(*args)
+        else:
+            raise ValueError("Unsupported data source type")
+        return self._apply_result_format(result, query_request)
+
+    async def _run_query_async(self, data_source: DataSourceModel, config: dict, query_request: QueryRequest) -> dict:
+        """Async dispatch; connectors without an async client run in the threadpool"""
+        args = (data_source.id, config, query_request)
+        
+        if data_source.type == DataSourceType.REST_API:
+            result = await self._execute_rest_api_query_async(*args)
+        elif data_source.type == DataSourceType.GRAPHQL:
+            result = await self._execute_graphql_query_async(*args)
+        elif data_source.type == DataSourceType.REDIS:
+            result = await self._execute_redis_query_async(*args)
+        else:
+            return await run_in_threadpool(
+                run_with_ticket, current_ticket.get(), self._run_query, data_source, config, query_request
+            )
+        return self._apply_result_format(result, query_request)
+
+    def _apply_result_format(self, result: dict, query_request: QueryRequest) -> dict:
+        """Convert row results to the requested format (SQL connectors build columnar directly)"""
+        if query_request.format != QueryResultFormat.COLUMNAR or "column_data" in result:
+            return result
+        
+        data = result.get("data") or []
+        columns = result.get("columns") or []
+        result = dict(result)
+        result["column_data"] = [[row.get(column) for row in data] for column in columns]
+        result["data"] = None
+        return result
+
+    def _format_columnar_result(self, columns: List[str], rows: List[Any]) -> dict:
+        """Build a columnar result straight from DBAPI row tuples"""
+        column_data = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+        return {
+            "success": True,
+            "data": None,
+            "columns": columns,
+            "column_data": column_data,
+            "row_count": len(rows)
+        }
+
+    def _get_cache_ttl(self, data_source: DataSourceModel, query_request: QueryRequest) -> int:
+        """Result cache TTL for this query, or 0 when it must not be cached"""
+        if not is_cacheable_query(data_source, query_request):
+            return 0
+        return query_cache.get_ttl(data_source)
+
+    def _build_query_result(self, result: dict, start_time: float) -> QueryResult:
+        # Copy so cached result dicts are never mutated
+        result = dict(result)
+        result["execution_time_ms"] = (time.time() - start_time) * 1000
+        # Connector output is trusted: skip re-validating every row and value
+        return QueryResult.model_construct(**result)
+
+    def get_schema(self, data_source: DataSourceModel, refresh: bool = False) -> Dict[str, Any]:
+        """Get schema information for data source, served from the persisted cache while fresh"""
+        try:
+            if not refresh:
+                snapshot = data_source.schema_snapshot
+                if snapshot is not None and self._is_schema_fresh(snapshot):
+                    return {**snapshot.schema_info, "introspected_at": snapshot.introspected_at.isoformat()}
+            
+            config = self._decrypt_connection_config(data_source.connection_config)
             
             if data_source.type == DataSourceType.MYSQL:
-                return self._get_mysql_schema(config)
+                schema = self._get_mysql_schema(data_source.id, config)
             elif data_source.type == DataSourceType.POSTGRESQL:
-                return self._get_postgresql_schema(config)
+                schema = self._get_postgresql_schema(data_source.id, config)
             elif data_source.type == DataSourceType.MONGODB:
-                return self._get_mongodb_schema(config)
+                schema = self._get_mongodb_schema(data_source.id, config)
+            elif data_source.type == DataSourceType.GRAPHQL:
+                if refresh:
+                    introspection_cache.delete(self._get_graphql_introspection_key(data_source.id, config))
+                schema = self._get_graphql_schema(data_source.id, config)
             else:
                 return {"error": "Schema introspection not supported for this data source type"}
+            
+            if schema.get("partial"):
+                # Incomplete results are returned but not persisted
+                return schema
+            
+            snapshot = self._save_schema_snapshot(data_source, schema)
+            return {**schema, "introspected_at": snapshot.introspected_at.isoformat()}
+                
+        except Exception as e:
+            return {"error": str(e)}
+
+    def get_schema_tables(self, data_source: DataSourceModel) -> Dict[str, Any]:
+        """List tables only; uses the cached schema when fresh, otherwise one cheap query"""
+        try:
+            snapshot = data_source.schema_snapshot
+            if snapshot is not None and self._is_schema_fresh(snapshot):
+                if "tables" in snapshot.schema_info:
+                    return {"tables": [{"name": name} for name in snapshot.schema_info["tables"]]}
+                if "collections" in snapshot.schema_info:
+                    return {"tables": [{"name": name} for name in snapshot.schema_info["collections"]]}
+            
+            config = self._decrypt_connection_config(data_source.connection_config)
+            
+            if data_source.type == DataSourceType.MYSQL:
+                return self._get_sql_tables(data_source.id, "mysql+pymysql", config)
+            elif data_source.type == DataSourceType.POSTGRESQL:
+                return self._get_sql_tables(data_source.id, "postgresql", config)
+            elif data_source.type == DataSourceType.MONGODB:
+                client = client_registry.get_mongo_client(data_source.id, config)
+                collections = client[config.get('database')].list_collection_names()
+                return {"tables": [{"name": name, "type": "collection"} for name in sorted(collections)]}
+            else:
+                return {"error": "Table listing not supported for this data source type"}
+                
+        except Exception as e:
+            return {"error": str(e)}
+
+    def get_table_schema(self, data_source: DataSourceModel, table: str) -> Dict[str, Any]:
+        """Get the columns of a single table"""
+        try:
+            snapshot = data_source.schema_snapshot
+            if snapshot is not None and self._is_schema_fresh(snapshot):
+                if table in snapshot.schema_info.get("collections", []):
+                    return {"name": table, **snapshot.schema_info[table]}
+                table_info = snapshot.schema_info.get("tables", {}).get(table)
+                if table_info is not None:
+                    return {"name": table, **table_info}
+            
+            config = self._decrypt_connection_config(data_source.connection_config)
+            
+            if data_source.type == DataSourceType.MYSQL:
+                schema = self._get_mysql_schema(data_source.id, config, table)
+            elif data_source.type == DataSourceType.POSTGRESQL:
+                schema = self._get_postgresql_schema(data_source.id, config, table)
+            elif data_source.type == DataSourceType.MONGODB:
+                schema = self._get_mongodb_schema(data_source.id, config, table)
+                return {"name": table, **schema[table]}
+            else:
+                return {"error": "Table introspection not supported for this data source type"}
+            
+            if table not in schema["tables"]:
+                return {"error": f"Table '{table}' not found"}
+            return {"name": table, **schema["tables"][table]}
                 
         except Exception as e:
             return {"error": str(e)}
 
+    # Schema cache helpers
+    def _is_schema_fresh(self, snapshot: DataSourceSchemaModel) -> bool:
+        introspected_at = snapshot.introspected_at.replace(tzinfo=None)
+        return datetime.utcnow() - introspected_at < timedelta(seconds=settings.SCHEMA_CACHE_TTL)
+
+    def _save_schema_snapshot(self, data_source: DataSourceModel, schema: dict) -> DataSourceSchemaModel:
+        """Persist an introspected schema, replacing any previous snapshot"""
+        snapshot = data_source.schema_snapshot
+        if snapshot is None:
+            snapshot = DataSourceSchemaModel(data_source_id=data_source.id)
+            data_source.schema_snapshot = snapshot
+        snapshot.schema_info = schema
+        snapshot.introspected_at = datetime.utcnow()
+        self.db.commit()
+        self.db.refresh(snapshot)
+        return snapshot
+
     # Encryption/Decryption helpers (simplified - use proper encryption in production)
     def _encrypt_connection_config(self, config: dict) -> dict:
         """Encrypt sensitive connection parameters"""
@@ -161,19 +929,29 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
         # In production, decrypt the config
         return config
 
+    def _release_connections(self, data_source_id: int) -> None:
+        """Drop any pooled engine or client held for a data source"""
+        engine_registry.invalidate(data_source_id)
+        client_registry.invalidate(data_source_id)
+        async_client_registry.invalidate(data_source_id)
+
+    def _get_sql_engine(self, data_source_id: int, dialect: str, config: dict) -> Engine:
+        """Get the pooled engine for a MySQL/PostgreSQL data source"""
+        connection_string = f"{dialect}://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
+        return engine_registry.get_engine(data_source_id, connection_string, config)
+
     # Database connection test methods
-    def _test_mysql_connection(self, config: dict, test_query: Optional[str] = None) -> dict:
+    def _test_mysql_connection(self, data_source_id: int, config: dict, test_query: Optional[str] = None) -> dict:
         """Test MySQL connection"""
-        connection_string = f"mysql+pymysql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+        engine = self._get_sql_engine(data_source_id, "mysql+pymysql", config)
         
         with engine.connect() as conn:
             if test_query:
                 result = conn.execute(text(test_query))
-                data = [dict(row) for row in result.fetchmany(5)]
+                data = [dict(row._mapping) for row in result.fetchmany(5)]
             else:
                 result = conn.execute(text("SELECT 1 as test"))
-                data = [dict(row) for row in result.fetchall()]
+                data = [dict(row._mapping) for row in result.fetchall()]
         
         return {
             "success": True,
@@ -181,18 +959,17 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             "data": data
         }
 
-    def _test_postgresql_connection(self, config: dict, test_query: Optional[str] = None) -> dict:
+    def _test_postgresql_connection(self, data_source_id: int, config: dict, test_query: Optional[str] = None) -> dict:
         """Test PostgreSQL connection"""
-        connection_string = f"postgresql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+        engine = self._get_sql_engine(data_source_id, "postgresql", config)
         
         with engine.connect() as conn:
             if test_query:
                 result = conn.execute(text(test_query))
-                data = [dict(row) for row in result.fetchmany(5)]
+                data = [dict(row._mapping) for row in result.fetchmany(5)]
             else:
                 result = conn.execute(text("SELECT 1 as test"))
-                data = [dict(row) for row in result.fetchall()]
+                data = [dict(row._mapping) for row in result.fetchall()]
         
         return {
             "success": True,
@@ -200,14 +977,9 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             "data": data
         }
 
-    def _test_mongodb_connection(self, config: dict) -> dict:
+    def _test_mongodb_connection(self, data_source_id: int, config: dict) -> dict:
         """Test MongoDB connection"""
-        client = pymongo.MongoClient(
-            host=config['host'],
-            port=config['port'],
-            username=config.get('username'),
-            password=config.get('password')
-        )
+        client = client_registry.get_mongo_client(data_source_id, config)
         
         # Test connection
         client.server_info()
@@ -221,9 +993,9 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             "data": [{"databases": databases}]
         }
 
-    def _test_rest_api_connection(self, config: dict) -> dict:
+    def _test_rest_api_connection(self, data_source_id: int, config: dict) -> dict:
         """Test REST API connection"""
-        headers = config.get('headers', {})
+        headers = dict(config.get('headers', {}))
         auth = None
         
         if config.get('auth_type') == 'bearer':
@@ -231,9 +1003,9 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
         elif config.get('auth_type') == 'basic':
             auth = (config.get('username'), config.get('password'))
         
-        with httpx.Client() as client:
-            response = client.get(config['base_url'], headers=headers, auth=auth)
-            response.raise_for_status()
+        client = client_registry.get_http_client(data_source_id, config)
+        response = client.get(config['base_url'], headers=headers, auth=auth)
+        response.raise_for_status()
         
         return {
             "success": True,
@@ -241,38 +1013,25 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             "data": [{"status_code": response.status_code}]
         }
 
-    def _test_graphql_connection(self, config: dict) -> dict:
+    def _test_graphql_connection(self, data_source_id: int, config: dict) -> dict:
         """Test GraphQL connection"""
-        headers = config.get('headers', {})
-        if config.get('token'):
-            headers['Authorization'] = f"Bearer {config['token']}"
+        headers = self._build_graphql_headers(config)
         
-        # Simple introspection query
-        query = {"query": "{ __schema { types { name } } }"}
-        
-        with httpx.Client() as client:
-            response = client.post(
-                config['endpoint'],
-                json=query,
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
+        # A trivial operation proves connectivity; the type list comes from the
+        # introspection cache shared with schema calls
+        client = client_registry.get_http_client(data_source_id, config)
+        self._send_graphql_request(client, config, headers, {"query": PING_QUERY})
+        schema = self._get_graphql_schema(data_source_id, config)
         
         return {
             "success": True,
             "message": "GraphQL connection successful",
-            "data": [data]
+            "data": [{"types": list(schema["types"])}]
         }
 
-    def _test_redis_connection(self, config: dict) -> dict:
+    def _test_redis_connection(self, data_source_id: int, config: dict) -> dict:
         """Test Redis connection"""
-        r = redis.Redis(
-            host=config['host'],
-            port=config['port'],
-            password=config.get('password'),
-            db=config.get('db', 0)
-        )
+        r = client_registry.get_redis_client(data_source_id, config)
         
         # Test connection
         r.ping()
@@ -284,21 +1043,41 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
         }
 
     # Query execution methods
-    def _execute_mysql_query(self, config: dict, query_request: QueryRequest) -> dict:
+    def _execute_mysql_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
         """Execute MySQL query"""
-        connection_string = f"mysql+pymysql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+        return self._execute_sql_query(data_source_id, "mysql+pymysql", config, query_request)
+
+    def _execute_postgresql_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute PostgreSQL query"""
+        return self._execute_sql_query(data_source_id, "postgresql", config, query_request)
+
+    def _execute_sql_query(self, data_source_id: int, dialect: str, config: dict, query_request: QueryRequest) -> dict:
+        """Execute a SQL query, optionally as one keyset-paginated page"""
+        engine = self._get_sql_engine(data_source_id, dialect, config)
         
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(query_request.query),
-                query_request.parameters or {}
-            )
+        sql, parameters = query_request.query, query_request.parameters or {}
+        page_size = query_request.limit or DEFAULT_PAGE_SIZE
+        if query_request.paginate:
+            sql, parameters = build_keyset_query(query_request, page_size)
+        
+        next_cursor = None
+        with engine.connect() as conn, self._sql_statement_guard(conn, dialect):
+            result = conn.execute(text(sql), parameters)
             
             if result.returns_rows:
-                rows = result.fetchmany(query_request.limit)
-                data = [dict(row) for row in rows]
-                columns = list(result.keys()) if data else []
+                columns = list(result.keys())
+                rows = result.fetchmany(page_size + 1 if query_request.paginate else query_request.limit)
+                if query_request.paginate and len(rows) > page_size:
+                    rows = rows[:page_size]
+                    last_value = rows[-1][columns.index(query_request.order_key)]
+                    next_cursor = encode_cursor(query_request, {"after": last_value})
+                if query_request.format == QueryResultFormat.COLUMNAR:
+                    result_dict = self._format_columnar_result(columns, rows)
+                    result_dict["next_cursor"] = next_cursor
+                    return result_dict
+                # One dict per row straight from the DBAPI tuple and the shared column list
+                data = [dict(zip(columns, row)) for row in rows]
+                columns = columns if data else []
                 row_count = len(data)
             else:
                 data = []
@@ -309,76 +1088,296 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
             "success": True,
             "data": data,
             "columns": columns,
-            "row_count": row_count
+            "row_count": row_count,
+            "next_cursor": next_cursor
         }
 
-    def _execute_postgresql_query(self, config: dict, query_request: QueryRequest) -> dict:
-        """Execute PostgreSQL query"""
-        connection_string = f"postgresql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+    @contextmanager
+    def _sql_statement_guard(self, conn, dialect: str) -> Iterator[None]:
+        """Push the governed query's deadline down to the server and make it cancellable"""
+        ticket = current_ticket.get()
+        if ticket is None:
+            yield
+            return
         
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(query_request.query),
-                query_request.parameters or {}
-            )
-            
-            if result.returns_rows:
-                rows = result.fetchmany(query_request.limit)
-                data = [dict(row) for row in rows]
-                columns = list(result.keys()) if data else []
-                row_count = len(data)
-            else:
-                data = []
-                columns = []
-                row_count = result.rowcount
+        dbapi_connection = conn.connection.dbapi_connection
+        if dialect == "postgresql":
+            # SET LOCAL ends with the transaction, so pooled connections are unaffected
+            conn.execute(text(f"SET LOCAL statement_timeout = {ticket.remaining_ms()}"))
+            with ticket.cancel_callback(dbapi_connection.cancel):
+                yield
+            return
         
-        return {
-            "success": True,
-            "data": data,
-            "columns": columns,
-            "row_count": row_count
-        }
+        # MySQL only bounds SELECT statements; KILL QUERY covers the rest
+        conn.execute(text(f"SET SESSION MAX_EXECUTION_TIME = {ticket.remaining_ms()}"))
+        thread_id = dbapi_connection.thread_id()
+        try:
+            with ticket.cancel_callback(lambda: self._kill_mysql_query(conn.engine, thread_id)):
+                yield
+        finally:
+            try:
+                conn.execute(text("SET SESSION MAX_EXECUTION_TIME = DEFAULT"))
+            except Exception:
+                # A killed or broken connection is discarded by the pool anyway
+                pass
 
-    def _execute_mongodb_query(self, config: dict, query_request: QueryRequest) -> dict:
-        """Execute MongoDB query"""
-        client = pymongo.MongoClient(
-            host=config['host'],
-            port=config['port'],
-            username=config.get('username'),
-            password=config.get('password')
-        )
+    def _kill_mysql_query(self, engine: Engine, thread_id: int) -> None:
+        with engine.connect() as conn:
+            conn.execute(text(f"KILL QUERY {int(thread_id)}"))
+
+    def _execute_mongodb_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute MongoDB query (find, aggregate, count or distinct)"""
+        client = client_registry.get_mongo_client(data_source_id, config)
         
         # Parse query (expecting JSON format)
         query_data = json.loads(query_request.query)
         database = query_data.get('database', config.get('database'))
         collection = query_data.get('collection')
         operation = query_data.get('operation', 'find')
-        filter_query = query_data.get('filter', {})
         
         db = client[database]
         coll = db[collection]
         
-        if operation == 'find':
-            cursor = coll.find(filter_query).limit(query_request.limit)
-            data = list(cursor)
-            # Convert ObjectId to string
-            for item in data:
-                if '_id' in item:
-                    item['_id'] = str(item['_id'])
+        ticket = current_ticket.get()
+        max_time_ms = ticket.remaining_ms() if ticket is not None else None
+        
+        next_cursor = None
+        if operation == 'find' and query_request.paginate:
+            data, next_cursor = self._find_mongodb_page(coll, query_data, query_request, max_time_ms)
+        elif operation in ('find', 'aggregate'):
+            # One batch holds the whole (limited) result: a single round trip
+            cursor = self._open_mongodb_cursor(coll, query_data, query_request.limit, max_time_ms, query_request.limit)
+            with cursor:
+                data = list(cursor)
+        elif operation in ('count', 'distinct'):
+            data = self._run_mongodb_scalar_operation(coll, query_data, max_time_ms)[:query_request.limit]
         else:
-            data = []
+            raise ValueError(f"Unsupported MongoDB operation: {operation}")
+        
+        data = [self._format_mongodb_document(item, operation) for item in data]
         
         return {
             "success": True,
             "data": data,
             "columns": list(data[0].keys()) if data else [],
-            "row_count": len(data)
+            "row_count": len(data),
+            "next_cursor": next_cursor
         }
 
-    def _execute_rest_api_query(self, config: dict, query_request: QueryRequest) -> dict:
-        """Execute REST API query"""
-        headers = config.get('headers', {})
+    def _open_mongodb_cursor(
+        self, coll, query_data: dict, limit: Optional[int], max_time_ms: Optional[int], batch_size: Optional[int]
+    ):
+        """Open a find or aggregate cursor with filter, projection, sort and limit pushed down"""
+        if query_data.get('operation', 'find') == 'aggregate':
+            pipeline = list(query_data.get('pipeline', []))
+            writes_output = bool(pipeline) and ('$out' in pipeline[-1] or '$merge' in pipeline[-1])
+            if limit and not writes_output:
+                pipeline.append({"$limit": limit})
+            options = {"allowDiskUse": bool(query_data.get('allow_disk_use', False))}
+            if max_time_ms is not None:
+                options["maxTimeMS"] = max_time_ms
+            if batch_size:
+                options["batchSize"] = batch_size
+            return coll.aggregate(pipeline, **options)
+        
+        cursor = coll.find(query_data.get('filter', {}), query_data.get('projection'))
+        sort = self._parse_mongodb_sort(query_data.get('sort'))
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor.max_time_ms(max_time_ms)
+
+    def _find_mongodb_page(
+        self, coll, query_data: dict, query_request: QueryRequest, max_time_ms: Optional[int]
+    ) -> Tuple[list, Optional[str]]:
+        """Fetch one page of a find, paging through the collection by _id"""
+        if query_data.get('sort'):
+            raise ValueError("Paginated MongoDB queries are ordered by _id; sort is not supported")
+        projection = query_data.get('projection')
+        if isinstance(projection, dict) and not projection.get('_id', True):
+            raise ValueError("Paginated MongoDB queries must include _id in the projection")
+        
+        # Every page is an index seek on _id
+        filter_query = query_data.get('filter', {})
+        position = decode_cursor(query_request)
+        if position is not None:
+            after = ObjectId(position["after"]) if position.get("object_id") else position["after"]
+            filter_query = {"$and": [filter_query, {"_id": {"$gt": after}}]}
+        page_size = query_request.limit or DEFAULT_PAGE_SIZE
+        data = list(
+            coll.find(filter_query, projection)
+            .sort("_id", pymongo.ASCENDING)
+            .limit(page_size + 1)
+            .batch_size(page_size + 1)
+            .max_time_ms(max_time_ms)
+        )
+        
+        next_cursor = None
+        if len(data) > page_size:
+            data = data[:page_size]
+            last_id = data[-1]["_id"]
+            next_cursor = encode_cursor(
+                query_request,
+                {"after": str(last_id), "object_id": isinstance(last_id, ObjectId)}
+            )
+        return data, next_cursor
+
+    def _run_mongodb_scalar_operation(self, coll, query_data: dict, max_time_ms: Optional[int]) -> List[dict]:
+        """Run count/distinct on the server and return the answer as rows"""
+        filter_query = query_data.get('filter', {})
+        options = {"maxTimeMS": max_time_ms} if max_time_ms is not None else {}
+        
+        if query_data['operation'] == 'count':
+            return [{"count": coll.count_documents(filter_query, **options)}]
+        
+        field = query_data.get('field')
+        if not field:
+            raise ValueError("MongoDB distinct queries require a field")
+        return [{field: value} for value in coll.distinct(field, filter_query, **options)]
+
+    @staticmethod
+    def _parse_mongodb_sort(sort: Any) -> Optional[List[Tuple[str, int]]]:
+        """Accept {"field": 1|-1} or [["field", 1|-1], ...] as a sort spec"""
+        if not sort:
+            return None
+        items = sort.items() if isinstance(sort, dict) else sort
+        return [(field, pymongo.DESCENDING if int(direction) < 0 else pymongo.ASCENDING) for field, direction in items]
+
+    def _format_mongodb_document(self, item: dict, operation: str) -> dict:
+        """Make a document JSON-serializable (ObjectIds become strings)"""
+        item = self._stringify_object_ids(item)
+        if operation == 'find' and '_id' in item:
+            item['_id'] = str(item['_id'])
+        return item
+
+    def _stringify_object_ids(self, value: Any) -> Any:
+        if isinstance(value, ObjectId):
+            return str(value)
+        if isinstance(value, dict):
+            return {key: self._stringify_object_ids(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._stringify_object_ids(item) for item in value]
+        return value
+
+    def _execute_rest_api_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute REST API query, following next-page links when configured"""
+        client = client_registry.get_http_client(data_source_id, config)
+        query_data = json.loads(query_request.query)
+        pagination = query_data.get('pagination')
+        position, offset = self._decode_rest_api_cursor(query_request, pagination)
+        
+        rows = []
+        for _ in range(self._get_rest_api_page_budget(pagination)):
+            method, url, request_kwargs = self._build_rest_api_request(config, query_request, position)
+            page = self._send_rest_api_request(client, data_source_id, config, method, url, request_kwargs)
+            data = self._extract_rest_api_rows(page["body"], query_data)
+            next_position = self._get_rest_api_next_position(pagination, page, data, position) if pagination else None
+            position = self._take_rest_api_rows(rows, data, offset, position, next_position, query_request.limit)
+            offset = 0
+            if position is None or (query_request.limit and len(rows) >= query_request.limit):
+                break
+        
+        return self._format_rest_api_result(rows, position if pagination else None, query_request)
+
+    def _send_rest_api_request(
+        self, client: httpx.Client, data_source_id: int, config: dict, method: str, url: str, request_kwargs: dict
+    ) -> dict:
+        """Send a REST API request through the HTTP cache, retrying transient failures"""
+        cache_key, entry, request_kwargs = self._prepare_rest_api_cache(data_source_id, config, method, url, request_kwargs)
+        if entry is not None and http_response_cache.is_fresh(entry):
+            return entry
+        
+        retry_policy = self._get_rest_api_retry_policy(config, method)
+        for attempt in itertools.count():
+            try:
+                response = client.request(method, url, **request_kwargs)
+            except httpx.TransportError:
+                delay = self._get_rest_api_retry_delay(attempt, retry_policy, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._get_rest_api_retry_delay(attempt, retry_policy, response)
+                if delay is None:
+                    break
+            time.sleep(delay)
+        
+        return self._handle_rest_api_response(response, cache_key, entry)
+
+    def _prepare_rest_api_cache(
+        self, data_source_id: int, config: dict, method: str, url: str, request_kwargs: dict
+    ) -> Tuple[Optional[str], Optional[dict], dict]:
+        """Look up a cached GET response and add its validators to the request"""
+        if method != 'GET' or not config.get('http_cache', True):
+            return None, None, request_kwargs
+        
+        cache_key = http_response_cache.make_key(data_source_id, url, request_kwargs)
+        entry = http_response_cache.get(cache_key)
+        if entry is not None:
+            headers = {**request_kwargs["headers"], **http_response_cache.conditional_headers(entry)}
+            request_kwargs = {**request_kwargs, "headers": headers}
+        return cache_key, entry, request_kwargs
+
+    def _handle_rest_api_response(self, response: httpx.Response, cache_key: Optional[str], entry: Optional[dict]) -> dict:
+        """Turn a response into a page dict, reusing the cached body on 304"""
+        if response.status_code == 304 and entry is not None:
+            http_response_cache.refresh(cache_key, entry, response.headers)
+            return entry
+        response.raise_for_status()
+        
+        page = {
+            "body": response.json(),
+            "url": str(response.url),
+            "next_link": response.links.get('next', {}).get('url')
+        }
+        if cache_key is not None and response.status_code == 200:
+            http_response_cache.store(cache_key, page, response.headers)
+        return page
+
+    def _get_rest_api_retry_policy(self, config: dict, method: str) -> Tuple[int, float]:
+        """(max retries, base backoff seconds); non-idempotent requests are never retried"""
+        if method not in _IDEMPOTENT_HTTP_METHODS:
+            return 0, 0.0
+        return (
+            int(config.get('max_retries', settings.REST_API_MAX_RETRIES)),
+            float(config.get('retry_backoff', settings.REST_API_RETRY_BACKOFF))
+        )
+
+    def _get_rest_api_retry_delay(
+        self, attempt: int, retry_policy: Tuple[int, float], response: Optional[httpx.Response]
+    ) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None when not retrying"""
+        max_retries, backoff = retry_policy
+        if response is not None and response.status_code not in _RETRYABLE_HTTP_STATUS_CODES:
+            return None
+        if attempt >= max_retries:
+            return None
+        
+        delay = backoff * (2 ** attempt)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('retry-after'))
+            if retry_after is not None:
+                delay = retry_after
+        
+        # Don't sleep past the governed query's deadline
+        ticket = current_ticket.get()
+        if ticket is not None and delay >= ticket.remaining():
+            return None
+        return delay
+
+    def _get_rest_api_page_budget(self, pagination: Optional[dict]) -> int:
+        """How many pages one query may fetch"""
+        if pagination and pagination.get('follow'):
+            return int(pagination.get('max_pages', settings.REST_API_MAX_FOLLOW_PAGES))
+        return 1
+
+    def _build_rest_api_request(
+        self, config: dict, query_request: QueryRequest, position: Optional[dict] = None
+    ) -> Tuple[str, str, dict]:
+        """Build method, URL and request kwargs for a REST API query (at a pagination position)"""
+        headers = dict(config.get('headers', {}))
         auth = None
         
         if config.get('auth_type') == 'bearer':
@@ -390,57 +1389,211 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
         query_data = json.loads(query_request.query)
         endpoint = query_data.get('endpoint', '')
         method = query_data.get('method', 'GET').upper()
-        params = query_data.get('params', {})
+        params = dict(query_data.get('params', {}))
         body = query_data.get('body', {})
         
         url = f"{config['base_url']}{endpoint}"
         
-        with httpx.Client() as client:
-            if method == 'GET':
-                response = client.get(url, params=params, headers=headers, auth=auth)
-            elif method == 'POST':
-                response = client.post(url, json=body, params=params, headers=headers, auth=auth)
-            else:
-                response = client.request(method, url, json=body, params=params, headers=headers, auth=auth)
-            
-            response.raise_for_status()
-            data = response.json()
+        pagination = query_data.get('pagination')
+        paginated = pagination and (query_request.paginate or pagination.get('follow'))
+        if paginated and pagination.get('type', 'page') == 'page':
+            page = position["page"] if position is not None else pagination.get('start', 1)
+            params[pagination.get('param', 'page')] = page
+        elif position is not None:
+            # Link/field pagination: the next URL already carries its query string
+            url = position["url"]
+            params = {}
+            if not self._is_same_origin(url, config['base_url']):
+                raise ValueError("Pagination link points outside the data source base_url")
+        
+        request_kwargs = {"params": params, "headers": headers, "auth": auth}
+        ticket = current_ticket.get()
+        if ticket is not None:
+            request_kwargs["timeout"] = ticket.remaining()
+        if method != 'GET':
+            request_kwargs["json"] = body
+        return method, url, request_kwargs
+
+    def _extract_rest_api_rows(self, body: Any, query_data: dict) -> list:
+        """Normalize a REST API response body to rows"""
+        data = body
+        if query_data.get('data_field') and isinstance(body, dict):
+            data = body.get(query_data['data_field'], [])
         
-        # Normalize data to list format
         if isinstance(data, dict):
-            data = [data]
-        elif not isinstance(data, list):
-            data = [{"result": data}]
+            return [data]
+        if not isinstance(data, list):
+            return [{"result": data}]
+        return data
+
+    @staticmethod
+    def _decode_rest_api_cursor(query_request: QueryRequest, pagination: Optional[dict]) -> Tuple[Optional[dict], int]:
+        """(page position, rows of that page already returned) to resume from"""
+        position = decode_cursor(query_request) if pagination and query_request.paginate else None
+        if position is None:
+            return None, 0
+        position = dict(position)
+        offset = int(position.pop("offset", 0))
+        return position or None, offset
+
+    @staticmethod
+    def _take_rest_api_rows(
+        rows: list, data: list, offset: int, position: Optional[dict], next_position: Optional[dict], limit: Optional[int]
+    ) -> Optional[dict]:
+        """
+        Append a page's rows from `offset` on, up to `limit` rows in total.
+
+        Returns where the next query should resume: the next page, or this
+        page at the first row left out when the limit cut it short.
+        """
+        remaining = data[offset:]
+        if limit is not None and len(rows) + len(remaining) > limit:
+            taken = max(limit - len(rows), 0)
+            rows.extend(remaining[:taken])
+            return {**(position or {}), "offset": offset + taken}
+        rows.extend(remaining)
+        return next_position
+
+    def _format_rest_api_result(self, data: list, position: Optional[dict], query_request: QueryRequest) -> dict:
+        """Build the query result from the collected rows and the next page position"""
+        next_cursor = None
+        if query_request.paginate and position is not None:
+            next_cursor = encode_cursor(query_request, position)
         
         return {
             "success": True,
-            "data": data[:query_request.limit],
+            "data": data,
             "columns": list(data[0].keys()) if data else [],
-            "row_count": len(data)
+            "row_count": len(data),
+            "next_cursor": next_cursor
         }
 
-    def _execute_graphql_query(self, config: dict, query_request: QueryRequest) -> dict:
+    def _get_rest_api_next_position(
+        self, pagination: dict, page: dict, data: list, position: Optional[dict]
+    ) -> Optional[dict]:
+        """Position of the next page for page/Link-header/next-field REST pagination"""
+        pagination_type = pagination.get('type', 'page')
+        if pagination_type == 'page':
+            if not data:
+                return None
+            page_number = position["page"] if position is not None else pagination.get('start', 1)
+            return {"page": page_number + 1}
+        
+        if pagination_type == 'link':
+            next_url = page["next_link"]
+        else:
+            body = page["body"]
+            next_url = body.get(pagination.get('field', 'next')) if isinstance(body, dict) else None
+        if not next_url:
+            return None
+        return {"url": str(httpx.URL(page["url"]).join(next_url))}
+
+    @staticmethod
+    def _is_same_origin(url: str, base_url: str) -> bool:
+        target, base = httpx.URL(url), httpx.URL(base_url)
+        return (target.scheme, target.host, target.port) == (base.scheme, base.host, base.port)
+
+    def _execute_graphql_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
         """Execute GraphQL query"""
-        headers = config.get('headers', {})
+        headers, query_data = self._build_graphql_request(config, query_request)
+        
+        client = client_registry.get_http_client(data_source_id, config)
+        result = self._send_graphql_request(client, config, headers, query_data)
+        
+        return self._format_graphql_result(result, query_request)
+
+    def _send_graphql_request(self, client: httpx.Client, config: dict, headers: dict, payload: Any) -> Any:
+        """POST a GraphQL payload, trying the hash-only persisted form first"""
+        if self._uses_persisted_queries(config, payload):
+            result = self._read_graphql_response(client.post(
+                config['endpoint'],
+                json=strip_query_text(payload),
+                headers=headers,
+                timeout=self._get_http_timeout(client)
+            ))
+            if not is_persisted_query_not_found(result):
+                return result
+        
+        # Full query text (registers the hash with servers supporting persisted queries)
+        return self._read_graphql_response(client.post(
+            config['endpoint'],
+            json=payload,
+            headers=headers,
+            timeout=self._get_http_timeout(client)
+        ))
+
+    def _read_graphql_response(self, response: httpx.Response) -> Any:
+        """Decode a GraphQL response; persisted-query misses are returned, not raised"""
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if is_persisted_query_not_found(body):
+                return body
+        response.raise_for_status()
+        return response.json()
+
+    def _uses_persisted_queries(self, config: dict, payload: Any) -> bool:
+        first = payload[0] if isinstance(payload, list) else payload
+        return bool(config.get('persisted_queries')) and "extensions" in first
+
+    def _get_http_timeout(self, client: Any) -> Any:
+        """Remaining time of the governed query, else the client's own timeout"""
+        ticket = current_ticket.get()
+        return ticket.remaining() if ticket is not None else client.timeout
+
+    def _build_graphql_headers(self, config: dict) -> dict:
+        headers = dict(config.get('headers', {}))
         if config.get('token'):
             headers['Authorization'] = f"Bearer {config['token']}"
-        
+        return headers
+
+    def _build_graphql_request(self, config: dict, query_request: QueryRequest) -> Tuple[dict, dict]:
+        """Build headers and payload for a GraphQL query"""
         query_data = {
             "query": query_request.query,
             "variables": query_request.parameters or {}
         }
-        
-        with httpx.Client() as client:
-            response = client.post(
-                config['endpoint'],
-                json=query_data,
-                headers=headers
+        if config.get('persisted_queries'):
+            query_data["extensions"] = persisted_query_extension(query_request.query)
+        return self._build_graphql_headers(config), query_data
+
+    def _get_graphql_schema(self, data_source_id: int, config: dict) -> dict:
+        """Introspected GraphQL types, cached per data source configuration"""
+        cache_key = self._get_graphql_introspection_key(data_source_id, config)
+        schema = introspection_cache.get(cache_key)
+        if schema is None:
+            client = client_registry.get_http_client(data_source_id, config)
+            result = self._send_graphql_request(
+                client, config, self._build_graphql_headers(config), {"query": INTROSPECTION_QUERY}
             )
-            response.raise_for_status()
-            result = response.json()
+            if result.get('errors') and not result.get('data'):
+                raise ValueError(self._format_graphql_errors(result))
+            schema = summarize_introspection(result)
+            introspection_cache.set(cache_key, schema, settings.SCHEMA_CACHE_TTL)
+        return schema
+
+    @staticmethod
+    def _get_graphql_introspection_key(data_source_id: int, config: dict) -> str:
+        return f"graphql-introspection:{data_source_id}:{_config_fingerprint(config)}"
+
+    @staticmethod
+    def _format_graphql_errors(result: dict) -> str:
+        return "; ".join(str(error.get('message', error)) for error in result['errors'])
+
+    def _format_graphql_result(self, result: dict, query_request: QueryRequest) -> dict:
+        """Flatten a GraphQL response into rows"""
+        if result.get('errors') and not result.get('data'):
+            return {
+                "success": False,
+                "error": self._format_graphql_errors(result),
+                "data": [],
+                "columns": [],
+                "row_count": 0
+            }
         
-        # Extract data from GraphQL response
-        data = result.get('data', {})
+        data = result.get('data') or {}
         if isinstance(data, dict):
             # Flatten the data structure
             flattened = []
@@ -451,133 +1604,394 @@ class DataSourceService(BaseService[DataSourceModel, DataSourceCreate, DataSourc
                     flattened.append({key: value})
             data = flattened
         
+        rows = data[:query_request.limit]
         return {
             "success": True,
-            "data": data[:query_request.limit],
-            "columns": list(data[0].keys()) if data else [],
-            "row_count": len(data)
+            "data": rows,
+            "columns": list(rows[0].keys()) if rows else [],
+            "row_count": len(rows)
         }
 
-    def _execute_redis_query(self, config: dict, query_request: QueryRequest) -> dict:
-        """Execute Redis query"""
-        r = redis.Redis(
-            host=config['host'],
-            port=config['port'],
-            password=config.get('password'),
-            db=config.get('db', 0)
-        )
-        
-        # Parse query (expecting JSON format with Redis command)
+    def _execute_redis_query(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute Redis query (a single command or a pipelined list of commands)"""
+        r = client_registry.get_redis_client(data_source_id, config)
         query_data = json.loads(query_request.query)
-        command = query_data.get('command')
-        args = query_data.get('args', [])
         
-        # Execute Redis command
+        if 'commands' in query_data:
+            commands = self._parse_redis_commands(query_data)
+            pipe = r.pipeline(transaction=bool(query_data.get('transaction', False)))
+            for command, args in commands:
+                pipe.execute_command(command, *args)
+            return self._format_redis_pipeline_result(commands, pipe.execute(raise_on_error=False), query_request)
+        
+        command, args = self._parse_redis_command(query_request)
+        if command.upper() in ('SCAN', 'KEYS'):
+            scan_options = self._get_redis_scan_options(command, args, query_data, settings.DATA_SOURCE_STREAM_BATCH_SIZE)
+            keys = list(itertools.islice(r.scan_iter(**scan_options), query_request.limit))
+            return self._format_redis_result(keys, query_request, 'SCAN')
+        
         result = r.execute_command(command, *args)
+        return self._format_redis_result(result, query_request, command, args)
+
+    def _parse_redis_command(self, query_request: QueryRequest) -> Tuple[str, list]:
+        """Parse Redis query (expecting JSON format with Redis command)"""
+        query_data = json.loads(query_request.query)
+        return query_data.get('command'), query_data.get('args', [])
+
+    def _parse_redis_commands(self, query_data: dict) -> List[Tuple[str, list]]:
+        """Parse a pipelined command list: {"command": ..., "args": [...]} items or ["CMD", arg, ...] arrays"""
+        commands = []
+        for item in query_data['commands']:
+            if isinstance(item, dict):
+                commands.append((item['command'], item.get('args', [])))
+            else:
+                commands.append((item[0], list(item[1:])))
+        if not commands:
+            raise ValueError("Redis commands list is empty")
+        return commands
+
+    def _get_redis_scan_options(self, command: str, args: list, query_data: dict, count: int) -> dict:
+        """Translate SCAN/KEYS arguments into incremental scan_iter options"""
+        if command.upper() == 'KEYS':
+            # KEYS blocks the server while it walks the keyspace; SCAN does not
+            return {"match": args[0] if args else None, "count": count}
         
-        # Format result
-        if isinstance(result, (list, tuple)):
-            data = [{"index": i, "value": str(v)} for i, v in enumerate(result)]
-        else:
-            data = [{"result": str(result)}]
+        options = {"match": query_data.get('match'), "count": count, "_type": query_data.get('type')}
+        # SCAN cursor [MATCH pattern] [COUNT count] [TYPE type]
+        tokens = [str(arg) for arg in args[1:]]
+        for name, value in zip(tokens[::2], tokens[1::2]):
+            if name.upper() == 'MATCH':
+                options["match"] = value
+            elif name.upper() == 'COUNT':
+                options["count"] = int(value)
+            elif name.upper() == 'TYPE':
+                options["_type"] = value
+        return options
+
+    def _format_redis_result(
+        self, result: Any, query_request: QueryRequest, command: str = "", args: Optional[list] = None
+    ) -> dict:
+        """Format a Redis reply as rows"""
+        data = self._redis_reply_to_rows(command, args or [], result)
         
+        rows = data[:query_request.limit]
         return {
             "success": True,
-            "data": data[:query_request.limit],
-            "columns": list(data[0].keys()) if data else [],
-            "row_count": len(data)
+            "data": rows,
+            "columns": list(rows[0].keys()) if rows else [],
+            "row_count": len(rows)
         }
 
+    def _format_redis_pipeline_result(self, commands: List[Tuple[str, list]], replies: list, query_request: QueryRequest) -> dict:
+        """One row per pipelined command, with its decoded reply or error"""
+        data = []
+        for index, ((command, args), reply) in enumerate(zip(commands, replies)):
+            failed = isinstance(reply, Exception)
+            data.append({
+                "index": index,
+                "command": str(command).upper(),
+                "key": self._decode_redis_value(args[0]) if args else None,
+                "result": None if failed else self._decode_redis_value(reply),
+                "error": str(reply) if failed else None
+            })
+        
+        rows = data[:query_request.limit]
+        return {
+            "success": True,
+            "data": rows,
+            "columns": list(rows[0].keys()) if rows else [],
+            "row_count": len(rows)
+        }
+
+    def _redis_reply_to_rows(self, command: str, args: list, reply: Any) -> List[dict]:
+        """Decode a reply into typed rows: hashes to field/value, scored sets to member/score"""
+        if isinstance(reply, dict):
+            return [
+                {"field": self._decode_redis_value(field), "value": self._decode_redis_value(value)}
+                for field, value in reply.items()
+            ]
+        if isinstance(reply, (list, tuple)):
+            if command.upper() in _REDIS_SCORED_COMMANDS and any(str(arg).upper() == 'WITHSCORES' for arg in args):
+                return [
+                    {"member": self._decode_redis_value(member), "score": float(score)}
+                    for member, score in zip(reply[::2], reply[1::2])
+                ]
+            if command.upper() in ('SCAN', 'KEYS'):
+                return [{"key": self._decode_redis_value(key)} for key in reply]
+            return [{"index": i, "value": self._decode_redis_value(v)} for i, v in enumerate(reply)]
+        return [{"result": self._decode_redis_value(reply)}]
+
+    def _decode_redis_value(self, value: Any) -> Any:
+        """Decode bytes to text (recursively); numbers and None keep their type"""
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        if isinstance(value, (list, tuple)):
+            return [self._decode_redis_value(item) for item in value]
+        if isinstance(value, dict):
+            return {self._decode_redis_value(k): self._decode_redis_value(v) for k, v in value.items()}
+        return value
+
+    # Async query execution methods
+    async def _execute_rest_api_query_async(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute REST API query without blocking the event loop"""
+        client = async_client_registry.get_http_client(data_source_id, config)
+        query_data = json.loads(query_request.query)
+        pagination = query_data.get('pagination')
+        position, offset = self._decode_rest_api_cursor(query_request, pagination)
+        
+        rows = []
+        for _ in range(self._get_rest_api_page_budget(pagination)):
+            method, url, request_kwargs = self._build_rest_api_request(config, query_request, position)
+            page = await self._send_rest_api_request_async(client, data_source_id, config, method, url, request_kwargs)
+            data = self._extract_rest_api_rows(page["body"], query_data)
+            next_position = self._get_rest_api_next_position(pagination, page, data, position) if pagination else None
+            position = self._take_rest_api_rows(rows, data, offset, position, next_position, query_request.limit)
+            offset = 0
+            if position is None or (query_request.limit and len(rows) >= query_request.limit):
+                break
+        
+        return self._format_rest_api_result(rows, position if pagination else None, query_request)
+
+    async def _send_rest_api_request_async(
+        self, client: httpx.AsyncClient, data_source_id: int, config: dict, method: str, url: str, request_kwargs: dict
+    ) -> dict:
+        """Async variant of `_send_rest_api_request`"""
+        cache_key, entry, request_kwargs = self._prepare_rest_api_cache(data_source_id, config, method, url, request_kwargs)
+        if entry is not None and http_response_cache.is_fresh(entry):
+            return entry
+        
+        retry_policy = self._get_rest_api_retry_policy(config, method)
+        for attempt in itertools.count():
+            try:
+                response = await client.request(method, url, **request_kwargs)
+            except httpx.TransportError:
+                delay = self._get_rest_api_retry_delay(attempt, retry_policy, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._get_rest_api_retry_delay(attempt, retry_policy, response)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+        
+        return self._handle_rest_api_response(response, cache_key, entry)
+
+    async def _execute_graphql_query_async(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute GraphQL query without blocking the event loop"""
+        headers, query_data = self._build_graphql_request(config, query_request)
+        
+        client = async_client_registry.get_http_client(data_source_id, config)
+        result = await self._send_graphql_request_async(client, config, headers, query_data)
+        
+        return self._format_graphql_result(result, query_request)
+
+    async def _execute_graphql_batch_query_async(
+        self, data_source_id: int, config: dict, query_requests: List[QueryRequest]
+    ) -> List[dict]:
+        """Send several GraphQL operations as one batched (array) request"""
+        headers = self._build_graphql_headers(config)
+        payload = [self._build_graphql_request(config, query_request)[1] for query_request in query_requests]
+        
+        client = async_client_registry.get_http_client(data_source_id, config)
+        results = await self._send_graphql_request_async(client, config, headers, payload)
+        if not isinstance(results, list) or len(results) != len(query_requests):
+            raise ValueError("GraphQL server did not return a batched response")
+        
+        return [
+            self._apply_result_format(self._format_graphql_result(result, query_request), query_request)
+            for result, query_request in zip(results, query_requests)
+        ]
+
+    async def _send_graphql_request_async(
+        self, client: httpx.AsyncClient, config: dict, headers: dict, payload: Any
+    ) -> Any:
+        """Async variant of `_send_graphql_request`"""
+        if self._uses_persisted_queries(config, payload):
+            result = self._read_graphql_response(await client.post(
+                config['endpoint'],
+                json=strip_query_text(payload),
+                headers=headers,
+                timeout=self._get_http_timeout(client)
+            ))
+            if not is_persisted_query_not_found(result):
+                return result
+        
+        return self._read_graphql_response(await client.post(
+            config['endpoint'],
+            json=payload,
+            headers=headers,
+            timeout=self._get_http_timeout(client)
+        ))
+
+    async def _execute_redis_query_async(self, data_source_id: int, config: dict, query_request: QueryRequest) -> dict:
+        """Execute Redis query without blocking the event loop"""
+        r = async_client_registry.get_redis_client(data_source_id, config)
+        query_data = json.loads(query_request.query)
+        
+        if 'commands' in query_data:
+            commands = self._parse_redis_commands(query_data)
+            async with r.pipeline(transaction=bool(query_data.get('transaction', False))) as pipe:
+                for command, args in commands:
+                    pipe.execute_command(command, *args)
+                replies = await pipe.execute(raise_on_error=False)
+            return self._format_redis_pipeline_result(commands, replies, query_request)
+        
+        command, args = self._parse_redis_command(query_request)
+        if command.upper() in ('SCAN', 'KEYS'):
+            scan_options = self._get_redis_scan_options(command, args, query_data, settings.DATA_SOURCE_STREAM_BATCH_SIZE)
+            keys = []
+            async for key in r.scan_iter(**scan_options):
+                if query_request.limit is not None and len(keys) >= query_request.limit:
+                    break
+                keys.append(key)
+            return self._format_redis_result(keys, query_request, 'SCAN')
+        
+        result = await r.execute_command(command, *args)
+        return self._format_redis_result(result, query_request, command, args)
+
+    # Streaming query methods
+    def _stream_sql_query(
+        self, data_source_id: int, dialect: str, config: dict, query_request: QueryRequest, batch_size: int
+    ) -> Iterator[dict]:
+        """Stream SQL rows through a server-side cursor"""
+        engine = self._get_sql_engine(data_source_id, dialect, config)
+        
+        with engine.connect() as conn, self._sql_statement_guard(conn, dialect):
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+                text(query_request.query),
+                query_request.parameters or {}
+            )
+            if not result.returns_rows:
+                return
+            columns = list(result.keys())
+            for row in result:
+                yield dict(zip(columns, row))
+
+    def _stream_mongodb_query(
+        self, data_source_id: int, config: dict, query_request: QueryRequest, batch_size: int
+    ) -> Iterator[dict]:
+        """Stream MongoDB documents or aggregation results, fetching them from the server in batches"""
+        client = client_registry.get_mongo_client(data_source_id, config)
+        
+        query_data = json.loads(query_request.query)
+        database = query_data.get('database', config.get('database'))
+        coll = client[database][query_data.get('collection')]
+        operation = query_data.get('operation', 'find')
+        
+        ticket = current_ticket.get()
+        max_time_ms = ticket.remaining_ms() if ticket is not None else None
+        
+        if operation in ('count', 'distinct'):
+            for item in self._run_mongodb_scalar_operation(coll, query_data, max_time_ms):
+                yield item
+            return
+        if operation not in ('find', 'aggregate'):
+            raise ValueError(f"Unsupported MongoDB operation: {operation}")
+        
+        # The row limit is applied by the caller; the cursor stays unbounded
+        cursor = self._open_mongodb_cursor(coll, query_data, None, max_time_ms, batch_size)
+        try:
+            for item in cursor:
+                yield self._format_mongodb_document(item, operation)
+        finally:
+            cursor.close()
+
+    def _stream_redis_query(
+        self, data_source_id: int, config: dict, query_request: QueryRequest, batch_size: int
+    ) -> Iterator[dict]:
+        """Stream Redis keys with SCAN (KEYS is scanned too); other queries yield their formatted reply"""
+        query_data = json.loads(query_request.query)
+        if 'commands' in query_data:
+            yield from self._execute_redis_query(data_source_id, config, query_request.copy(update={"limit": None}))["data"]
+            return
+        
+        r = client_registry.get_redis_client(data_source_id, config)
+        command, args = self._parse_redis_command(query_request)
+        if str(command).upper() not in ('SCAN', 'KEYS'):
+            result = r.execute_command(command, *args)
+            yield from self._redis_reply_to_rows(command, args, result)
+            return
+        
+        for key in r.scan_iter(**self._get_redis_scan_options(command, args, query_data, batch_size)):
+            yield {"key": self._decode_redis_value(key)}
+
     # Schema introspection methods
-    def _get_mysql_schema(self, config: dict) -> dict:
+    def _get_mysql_schema(self, data_source_id: int, config: dict, table: Optional[str] = None) -> dict:
         """Get MySQL schema information"""
-        connection_string = f"mysql+pymysql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+        return self._get_sql_schema(data_source_id, "mysql+pymysql", config, table)
+
+    def _get_postgresql_schema(self, data_source_id: int, config: dict, table: Optional[str] = None) -> dict:
+        """Get PostgreSQL schema information"""
+        return self._get_sql_schema(data_source_id, "postgresql", config, table)
+
+    def _get_sql_schema(self, data_source_id: int, dialect: str, config: dict, table: Optional[str] = None) -> dict:
+        """Introspect every column (or one table's columns) with a single query"""
+        queries = _SQL_SCHEMA_QUERIES[dialect]
+        engine = self._get_sql_engine(data_source_id, dialect, config)
         
+        columns_query = queries["columns"].format(table_filter=queries["table_filter"] if table else "")
         with engine.connect() as conn:
-            # Get tables
-            tables_result = conn.execute(text("SHOW TABLES"))
-            tables = [row[0] for row in tables_result.fetchall()]
-            
-            schema = {"tables": {}}
-            
-            # Get columns for each table
-            for table in tables:
-                columns_result = conn.execute(text(f"DESCRIBE {table}"))
-                columns = []
-                for row in columns_result.fetchall():
-                    columns.append({
-                        "name": row[0],
-                        "type": row[1],
-                        "nullable": row[2] == "YES",
-                        "key": row[3],
-                        "default": row[4],
-                        "extra": row[5]
-                    })
-                schema["tables"][table] = {"columns": columns}
+            rows = conn.execute(text(columns_query), {"table": table} if table else {}).fetchall()
         
+        schema = {"tables": {}}
+        for row in rows:
+            column = dict(zip(queries["column_fields"], row[1:]))
+            column["nullable"] = column["nullable"] == "YES"
+            schema["tables"].setdefault(row[0], {"columns": []})["columns"].append(column)
         return schema
 
-    def _get_postgresql_schema(self, config: dict) -> dict:
-        """Get PostgreSQL schema information"""
-        connection_string = f"postgresql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
-        engine = create_engine(connection_string)
+    def _get_sql_tables(self, data_source_id: int, dialect: str, config: dict) -> dict:
+        """List tables without their columns (cheap, for very large schemas)"""
+        engine = self._get_sql_engine(data_source_id, dialect, config)
         
         with engine.connect() as conn:
-            # Get tables
-            tables_result = conn.execute(text("""
-                SELECT table_name FROM information_schema.tables 
-                WHERE table_schema = 'public'
-            """))
-            tables = [row[0] for row in tables_result.fetchall()]
-            
-            schema = {"tables": {}}
-            
-            # Get columns for each table
-            for table in tables:
-                columns_result = conn.execute(text(f"""
-                    SELECT column_name, data_type, is_nullable, column_default 
-                    FROM information_schema.columns 
-                    WHERE table_name = '{table}' AND table_schema = 'public'
-                """))
-                columns = []
-                for row in columns_result.fetchall():
-                    columns.append({
-                        "name": row[0],
-                        "type": row[1],
-                        "nullable": row[2] == "YES",
-                        "default": row[3]
-                    })
-                schema["tables"][table] = {"columns": columns}
-        
-        return schema
+            rows = conn.execute(text(_SQL_SCHEMA_QUERIES[dialect]["tables"])).fetchall()
+        return {"tables": [{"name": row[0], "type": row[1]} for row in rows]}
 
-    def _get_mongodb_schema(self, config: dict) -> dict:
-        """Get MongoDB schema information"""
-        client = pymongo.MongoClient(
-            host=config['host'],
-            port=config['port'],
-            username=config.get('username'),
-            password=config.get('password')
-        )
+    def _get_mongodb_schema(self, data_source_id: int, config: dict, collection: Optional[str] = None) -> dict:
+        """Infer MongoDB schema by sampling collections concurrently within a time budget"""
+        client = client_registry.get_mongo_client(data_source_id, config)
         
         database_name = config.get('database')
         db = client[database_name]
         
-        collections = db.list_collection_names()
+        collections = [collection] if collection else db.list_collection_names()
         schema = {"collections": collections}
         
-        # Sample documents from each collection to infer schema
-        for collection_name in collections:
-            collection = db[collection_name]
-            sample_doc = collection.find_one()
-            if sample_doc:
-                # Remove ObjectId for JSON serialization
-                if '_id' in sample_doc:
-                    sample_doc['_id'] = str(sample_doc['_id'])
-                schema[collection_name] = {
-                    "sample_document": sample_doc,
-                    "fields": list(sample_doc.keys())
-                }
+        budget = settings.MONGODB_SCHEMA_TIME_BUDGET
+        executor = ThreadPoolExecutor(max_workers=max(1, min(settings.MONGODB_SCHEMA_MAX_WORKERS, len(collections))))
+        futures = {
+            executor.submit(self._sample_mongodb_collection, db[name], budget): name
+            for name in collections
+        }
+        _, not_done = wait(futures, timeout=budget)
+        # Don't wait for stragglers; maxTimeMS stops them server-side
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        for future, name in futures.items():
+            if future in not_done:
+                schema[name] = {"error": "Schema sampling exceeded the time budget"}
+                schema["partial"] = True
+            elif future.exception() is not None:
+                schema[name] = {"error": str(future.exception())}
+                schema["partial"] = True
+            else:
+                schema[name] = future.result()
         
         return schema
+
+    def _sample_mongodb_collection(self, collection, budget: int) -> dict:
+        """Infer one collection's fields from a random `$sample` of documents"""
+        documents = list(collection.aggregate(
+            [{"$sample": {"size": settings.MONGODB_SCHEMA_SAMPLE_SIZE}}],
+            maxTimeMS=budget * 1000
+        ))
+        inferred = infer_fields(documents)
+        
+        return {
+            "fields": list(inferred["fields"]),
+            "field_stats": inferred["fields"],
+            "sampled": inferred["sampled"],
+            # Round-trip through JSON so ObjectIds and dates can be persisted
+            "sample_document": json.loads(json.dumps(documents[0], default=str)) if documents else None
+        }
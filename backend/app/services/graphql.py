@@ -0,0 +1,85 @@
+import hashlib
+from typing import Any, Dict, List, Optional, Union
+
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+  __schema {
+    queryType { name }
+    mutationType { name }
+    types {
+      kind
+      name
+      fields(includeDeprecated: false) {
+        name
+        type { kind name ofType { kind name ofType { kind name ofType { kind name } } } }
+      }
+    }
+  }
+}
+"""
+
+# Cheapest possible operation, used to check connectivity
+PING_QUERY = "{ __typename }"
+
+# Introspection results per data source, shared by connection tests and schema calls
+introspection_cache = create_cache_backend(settings.DATA_SOURCE_MAX_CLIENTS)
+
+
+def persisted_query_extension(query: str) -> Dict[str, Any]:
+    """Automatic persisted query extension identifying `query` by its hash"""
+    return {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode("utf-8")).hexdigest()}}
+
+
+def strip_query_text(payload: Union[dict, List[dict]]) -> Union[dict, List[dict]]:
+    """Hash-only form of a persisted query payload (or batch of payloads)"""
+    if isinstance(payload, list):
+        return [strip_query_text(item) for item in payload]
+    return {key: value for key, value in payload.items() if key != "query"}
+
+
+def is_persisted_query_not_found(result: Any) -> bool:
+    """Whether the server asked for the full query text of a persisted query"""
+    if isinstance(result, list):
+        return any(is_persisted_query_not_found(item) for item in result)
+    if not isinstance(result, dict):
+        return False
+    for error in result.get("errors") or []:
+        code = (error.get("extensions") or {}).get("code")
+        if error.get("message") == "PersistedQueryNotFound" or code == "PERSISTED_QUERY_NOT_FOUND":
+            return True
+    return False
+
+
+def format_type_ref(type_ref: Optional[dict]) -> Optional[str]:
+    """Render an introspected type reference in SDL notation, e.g. [User!]!"""
+    if not type_ref:
+        return None
+    if type_ref["kind"] == "NON_NULL":
+        return f"{format_type_ref(type_ref.get('ofType'))}!"
+    if type_ref["kind"] == "LIST":
+        return f"[{format_type_ref(type_ref.get('ofType'))}]"
+    return type_ref.get("name")
+
+
+def summarize_introspection(result: dict) -> dict:
+    """Reduce an introspection response to types and their fields"""
+    schema = result["data"]["__schema"]
+    types = {}
+    for type_info in schema["types"]:
+        if type_info["name"].startswith("__"):
+            continue
+        types[type_info["name"]] = {
+            "kind": type_info["kind"],
+            "fields": [
+                {"name": field["name"], "type": format_type_ref(field["type"])}
+                for field in type_info.get("fields") or []
+            ],
+        }
+    return {
+        "query_type": (schema.get("queryType") or {}).get("name"),
+        "mutation_type": (schema.get("mutationType") or {}).get("name"),
+        "types": types,
+    }
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: value-or-None}"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (header or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def parse_retry_after(header: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)"""
+    if not header:
+        return None
+    try:
+        return max(float(header), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(header).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpResponseCache:
+    """
+    Validator-aware cache of REST API GET responses.
+
+    Responses are kept while `Cache-Control: max-age` says they are fresh
+    and served without a request. Stale entries that carry an `ETag` or
+    `Last-Modified` are kept for `REST_API_HTTP_CACHE_TTL` seconds so the
+    next request can be made conditional, and a `304 Not Modified` reuses
+    the stored body.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def make_key(self, data_source_id: int, url: str, request_kwargs: dict) -> str:
+        payload = json.dumps(
+            {
+                "url": url,
+                "params": request_kwargs.get("params") or {},
+                # Different credentials may see different representations
+                "headers": request_kwargs.get("headers") or {},
+                "auth": request_kwargs.get("auth"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return f"http:{data_source_id}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.backend.get(key)
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        return entry["fresh_until"] > time.time()
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Validators to send so an unchanged resource answers 304"""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, key: str, page: Dict[str, Any], headers: Any) -> None:
+        """Store a 200 response page if its headers allow reuse"""
+        cache_control = parse_cache_control(headers.get("cache-control"))
+        # "private" is fine: entries are only reused for the same data source
+        if "no-store" in cache_control:
+            return
+
+        max_age = 0
+        if "no-cache" not in cache_control:
+            try:
+                max_age = int(cache_control.get("max-age") or 0)
+            except ValueError:
+                max_age = 0
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if max_age <= 0 and not etag and not last_modified:
+            return
+
+        entry = {
+            **page,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh_until": time.time() + max_age,
+        }
+        self.backend.set(key, entry, max(max_age, settings.REST_API_HTTP_CACHE_TTL))
+
+    def refresh(self, key: str, entry: Dict[str, Any], headers: Any) -> None:
+        """Re-store an entry after a 304, taking the new freshness headers"""
+        page = {name: entry[name] for name in ("body", "url", "next_link")}
+        merged = {
+            "cache-control": headers.get("cache-control"),
+            "etag": headers.get("etag") or entry.get("etag"),
+            "last-modified": headers.get("last-modified") or entry.get("last_modified"),
+        }
+        self.store(key, page, merged)
+
+
+http_response_cache = HttpResponseCache(create_cache_backend(settings.REST_API_HTTP_CACHE_MAX_ENTRIES))
@@ -0,0 +1,73 @@
+import base64
+import hashlib
+import json
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from app.schemas import QueryRequest
+
+DEFAULT_PAGE_SIZE = 100
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _query_scope(query_request: QueryRequest) -> str:
+    """Short hash tying a cursor to the query that produced it"""
+    payload = json.dumps(
+        {
+            "query": query_request.query,
+            "parameters": query_request.parameters or {},
+            "order_key": query_request.order_key,
+            "order_desc": query_request.order_desc,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(query_request: QueryRequest, position: Dict[str, Any]) -> str:
+    """Encode an opaque continuation token for the next page"""
+    payload = {"scope": _query_scope(query_request), "position": position}
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(query_request: QueryRequest) -> Optional[Dict[str, Any]]:
+    """Decode the request's cursor, or return None when starting at page 1"""
+    if not query_request.cursor:
+        return None
+    try:
+        padded = query_request.cursor + "=" * (-len(query_request.cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(payload, dict) or "position" not in payload:
+        raise ValueError("Invalid pagination cursor")
+    if payload.get("scope") != _query_scope(query_request):
+        raise ValueError("Pagination cursor does not belong to this query")
+    return payload["position"]
+
+
+def build_keyset_query(query_request: QueryRequest, limit: int) -> Tuple[str, Dict[str, Any]]:
+    """
+    Wrap a SQL query so it returns one keyset page ordered by `order_key`.
+
+    Fetches `limit + 1` rows so the caller can tell whether another page
+    exists. `order_key` must be a unique column of the query's result.
+    """
+    order_key = query_request.order_key
+    if not order_key or not _IDENTIFIER_RE.match(order_key):
+        raise ValueError("order_key must be a plain column name to paginate SQL queries")
+
+    inner_query = query_request.query.strip().rstrip(";")
+    parameters = dict(query_request.parameters or {})
+    sql = f"SELECT * FROM ({inner_query}) AS _keyset_page"
+
+    position = decode_cursor(query_request)
+    if position is not None:
+        sql += f" WHERE {order_key} {'<' if query_request.order_desc else '>'} :_keyset_after"
+        parameters["_keyset_after"] = position["after"]
+
+    sql += f" ORDER BY {order_key} {'DESC' if query_request.order_desc else 'ASC'} LIMIT {int(limit) + 1}"
+    return sql, parameters
@@ -1,6 +1,7 @@
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, asc, func
+from datetime import timedelta
+from typing import Optional, List, Dict, Any, Callable
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy import and_, desc, asc, func, case, cast, select, update, bindparam, true, Numeric
 
 from app.models.plugin import Plugin, PluginCategory, PluginInstallation, PluginReview
 from app.schemas.plugin import (
@@ -8,7 +9,49 @@ from app.schemas.plugin import (
     PluginInstallationCreate, PluginInstallationUpdate, PluginReviewCreate,
     PluginReviewUpdate, PluginSearchFilters, PluginStats, PluginType
 )
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+from app.core.counters import create_counter_buffer
+from app.core.database import SessionLocal
 from app.services.base import BaseService
+from app.services.plugin_search import native_search_clause, plugin_search_index, tokenize, uses_native_search
+
+# Columns behind the PluginCard listing schema; the rest (source, assets,
+# configuration, long description) is only loaded for plugin details
+_CARD_COLUMNS = (
+    Plugin.id, Plugin.name, Plugin.slug, Plugin.description, Plugin.version, Plugin.plugin_type,
+    Plugin.category_id, Plugin.author_id, Plugin.is_free, Plugin.price, Plugin.currency,
+    Plugin.is_active, Plugin.is_featured, Plugin.is_verified, Plugin.download_count,
+    Plugin.rating, Plugin.review_count, Plugin.created_at, Plugin.updated_at,
+)
+
+
+_STAR_COLUMNS = {
+    1: Plugin.rating_1_count,
+    2: Plugin.rating_2_count,
+    3: Plugin.rating_3_count,
+    4: Plugin.rating_4_count,
+    5: Plugin.rating_5_count,
+}
+
+# Installs are counted here and flushed to plugins.download_count in batches
+download_counts = create_counter_buffer("plugin_downloads")
+
+_STATS_CACHE_KEY = "plugin_stats"
+_stats_cache = create_cache_backend(max_entries=1)
+
+
+def invalidate_plugin_stats() -> None:
+    """Drop the cached marketplace stats after plugins or categories change"""
+    _stats_cache.delete(_STATS_CACHE_KEY)
+
+
+def _average_rating(rating_sum, review_count):
+    """SQL expression for the rounded mean rating, 0 without reviews"""
+    return case(
+        (review_count > 0, func.round(cast(rating_sum, Numeric(14, 4)) / review_count, 2)),
+        else_=0.0,
+    )
 
 
 class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
@@ -25,13 +68,14 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         self.db.add(db_category)
         self.db.commit()
         self.db.refresh(db_category)
+        invalidate_plugin_stats()
         return db_category
 
     def search_plugins(self, filters: PluginSearchFilters, skip: int = 0, limit: int = 100) -> List[Plugin]:
-        """Search plugins with filters"""
+        """Search plugins with filters, loading only the listing columns"""
         query = self.db.query(Plugin).options(
-            joinedload(Plugin.category),
-            joinedload(Plugin.author)
+            load_only(*_CARD_COLUMNS, raiseload=True),
+            joinedload(Plugin.category)
         ).filter(Plugin.is_active == True)
 
         # Apply filters
@@ -49,41 +93,55 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         
         if filters.min_rating:
             query = query.filter(Plugin.rating >= filters.min_rating)
-        
-        if filters.search_query:
-            search_term = f"%{filters.search_query}%"
-            query = query.filter(
-                or_(
-                    Plugin.name.ilike(search_term),
-                    Plugin.description.ilike(search_term),
-                    Plugin.long_description.ilike(search_term)
-                )
-            )
 
-        # Apply sorting
-        if filters.sort_by == "rating":
+        terms = tokenize(filters.search_query)
+        if not terms:
+            return self._sort_plugins(query, filters, None).offset(skip).limit(limit).all()
+
+        if uses_native_search(self.db):
+            condition, score = native_search_clause(self.db, terms)
+            matches = query.filter(condition)
+            plugins = self._sort_plugins(matches, filters, score).offset(skip).limit(limit).all()
+            if plugins or not settings.PLUGIN_SEARCH_TYPO_FALLBACK:
+                return plugins
+            if skip and self.db.query(matches.exists()).scalar():
+                return plugins
+            # No exact or prefix match at all: retry with typo tolerance
+
+        plugin_search_index.sync(self.db)
+        ranked = plugin_search_index.search(terms, settings.PLUGIN_SEARCH_MAX_CANDIDATES)
+        if not ranked:
+            return []
+        score = case(dict(ranked), value=Plugin.id, else_=0)
+        matches = query.filter(Plugin.id.in_([plugin_id for plugin_id, _ in ranked]))
+        return self._sort_plugins(matches, filters, score).offset(skip).limit(limit).all()
+
+    def _sort_plugins(self, query, filters: PluginSearchFilters, score):
+        """Order a plugin query by the requested column, or by search relevance"""
+        sort_by = filters.sort_by or ("relevance" if score is not None else "download_count")
+        if sort_by == "relevance" and score is not None:
+            return query.order_by(desc(score), desc(Plugin.download_count))
+
+        if sort_by == "rating":
             sort_column = Plugin.rating
-        elif filters.sort_by == "created_at":
+        elif sort_by == "created_at":
             sort_column = Plugin.created_at
-        elif filters.sort_by == "name":
+        elif sort_by == "name":
             sort_column = Plugin.name
         else:  # download_count
             sort_column = Plugin.download_count
 
         if filters.sort_order == "asc":
-            query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(desc(sort_column))
-
-        return query.offset(skip).limit(limit).all()
+            return query.order_by(asc(sort_column))
+        return query.order_by(desc(sort_column))
 
     def get_featured_plugins(self, limit: int = 10) -> List[Plugin]:
-        """Get featured plugins"""
+        """Get featured plugins, loading only the listing columns"""
         return (
             self.db.query(Plugin)
             .options(
-                joinedload(Plugin.category),
-                joinedload(Plugin.author)
+                load_only(*_CARD_COLUMNS, raiseload=True),
+                joinedload(Plugin.category)
             )
             .filter(Plugin.is_active == True, Plugin.is_featured == True)
             .order_by(desc(Plugin.download_count))
@@ -112,6 +170,8 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         self.db.add(db_plugin)
         self.db.commit()
         self.db.refresh(db_plugin)
+        plugin_search_index.upsert_plugin(db_plugin)
+        invalidate_plugin_stats()
         return db_plugin
 
     def update_plugin(self, plugin_id: int, plugin_update: PluginUpdate) -> Optional[Plugin]:
@@ -124,8 +184,21 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
             
             self.db.commit()
             self.db.refresh(db_plugin)
+            plugin_search_index.upsert_plugin(db_plugin)
+            invalidate_plugin_stats()
         return db_plugin
 
+    def delete_plugin(self, plugin_id: int) -> bool:
+        """Delete a plugin"""
+        db_plugin = self.get(plugin_id)
+        if not db_plugin:
+            return False
+        self.db.delete(db_plugin)
+        self.db.commit()
+        plugin_search_index.remove(plugin_id)
+        invalidate_plugin_stats()
+        return True
+
     def get_plugin_installations(self, plugin_id: int) -> List[PluginInstallation]:
         """Get all installations for a plugin"""
         return (
@@ -162,12 +235,11 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         
         db_installation = PluginInstallation(**installation_dict)
         self.db.add(db_installation)
-        
-        # Update download count
-        plugin.download_count += 1
-        
         self.db.commit()
         self.db.refresh(db_installation)
+
+        # Counted once committed; flush_download_counts applies it to the plugin row
+        download_counts.add(plugin_id)
         return db_installation
 
     def update_installation(self, installation_id: int, installation_update: PluginInstallationUpdate, user_id: int) -> Optional[PluginInstallation]:
@@ -232,7 +304,7 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         self.db.add(db_review)
         
         # Update plugin rating
-        self._update_plugin_rating(plugin_id)
+        self._apply_rating_change(plugin_id, added=db_review.rating)
         
         self.db.commit()
         self.db.refresh(db_review)
@@ -246,12 +318,14 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         ).first()
 
         if db_review:
+            previous_rating = db_review.rating
             update_data = review_update.dict(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(db_review, field, value)
             
             # Update plugin rating
-            self._update_plugin_rating(db_review.plugin_id)
+            if db_review.rating != previous_rating:
+                self._apply_rating_change(db_review.plugin_id, added=db_review.rating, removed=previous_rating)
             
             self.db.commit()
             self.db.refresh(db_review)
@@ -265,56 +339,192 @@ class PluginService(BaseService[Plugin, PluginCreate, PluginUpdate]):
         ).first()
 
         if db_review:
-            plugin_id = db_review.plugin_id
             self.db.delete(db_review)
             
             # Update plugin rating
-            self._update_plugin_rating(plugin_id)
+            self._apply_rating_change(db_review.plugin_id, removed=db_review.rating)
             
             self.db.commit()
             return True
         return False
 
-    def _update_plugin_rating(self, plugin_id: int):
-        """Update plugin rating based on reviews"""
-        reviews = self.db.query(PluginReview).filter(PluginReview.plugin_id == plugin_id).all()
-        
-        if reviews:
-            avg_rating = sum(review.rating for review in reviews) / len(reviews)
-            review_count = len(reviews)
-        else:
-            avg_rating = 0.0
-            review_count = 0
+    def _apply_rating_change(self, plugin_id: int, added: Optional[int] = None, removed: Optional[int] = None):
+        """Fold an added and/or removed review rating into the plugin's aggregates in one UPDATE"""
+        rating_sum = Plugin.rating_sum + ((added or 0) - (removed or 0))
+        review_count = Plugin.review_count + (int(added is not None) - int(removed is not None))
+        # The mean comes first: MySQL applies SET assignments left to right
+        values = [
+            (Plugin.rating, _average_rating(rating_sum, review_count)),
+            (Plugin.rating_sum, rating_sum),
+            (Plugin.review_count, review_count),
+        ]
+        for star, delta in ((added, 1), (removed, -1)):
+            if star is not None:
+                values.append((_STAR_COLUMNS[star], _STAR_COLUMNS[star] + delta))
+        self.db.execute(
+            update(Plugin)
+            .where(Plugin.id == plugin_id)
+            .ordered_values(*values)
+            .execution_options(synchronize_session=False)
+        )
 
-        plugin = self.get(plugin_id)
-        if plugin:
-            plugin.rating = round(avg_rating, 2)
-            plugin.review_count = review_count
+    def reconcile_ratings(self) -> int:
+        """Recompute rating aggregates from the reviews for plugins that drifted; returns how many were fixed"""
+        expected = {
+            row[0]: tuple(row[1:])
+            for row in self.db.query(
+                PluginReview.plugin_id,
+                func.count(PluginReview.id),
+                func.sum(PluginReview.rating),
+                *(func.sum(case((PluginReview.rating == star, 1), else_=0)) for star in _STAR_COLUMNS),
+            ).group_by(PluginReview.plugin_id)
+        }
+        empty = (0, 0) + (0,) * len(_STAR_COLUMNS)
+        drifted = [
+            row[0]
+            for row in self.db.query(Plugin.id, Plugin.review_count, Plugin.rating_sum, *_STAR_COLUMNS.values())
+            if tuple(row[1:]) != expected.get(row[0], empty)
+        ]
+        if not drifted:
+            return 0
+
+        # Correlated subqueries, so reviews written meanwhile are not lost
+        def of_plugin(aggregate, *criteria):
+            return select(aggregate).where(PluginReview.plugin_id == Plugin.id, *criteria).scalar_subquery()
+
+        review_count = of_plugin(func.count(PluginReview.id))
+        rating_sum = of_plugin(func.coalesce(func.sum(PluginReview.rating), 0))
+        values = [
+            (Plugin.rating, _average_rating(rating_sum, review_count)),
+            (Plugin.rating_sum, rating_sum),
+            (Plugin.review_count, review_count),
+        ]
+        for star, column in _STAR_COLUMNS.items():
+            values.append((column, of_plugin(func.count(PluginReview.id), PluginReview.rating == star)))
+        self.db.execute(
+            update(Plugin)
+            .where(Plugin.id.in_(drifted))
+            .ordered_values(*values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return len(drifted)
+
+    def flush_download_counts(self) -> int:
+        """Apply buffered download increments in one batched UPDATE; returns how many plugins changed"""
+        counts = download_counts.drain()
+        if not counts:
+            return 0
+        plugins = Plugin.__table__
+        statement = (
+            plugins.update()
+            .where(plugins.c.id == bindparam("plugin_id"))
+            .values(download_count=plugins.c.download_count + bindparam("increment"))
+        )
+        try:
+            self.db.execute(statement, [{"plugin_id": key, "increment": amount} for key, amount in counts.items()])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            download_counts.restore(counts)
+            raise
+        return len(counts)
+
+    def reconcile_download_counts(self) -> int:
+        """Raise download counts that fell below the plugin's settled installations; returns how many were fixed"""
+        # Installations older than this have been flushed by every worker
+        grace = timedelta(seconds=2 * settings.PLUGIN_DOWNLOAD_FLUSH_INTERVAL + 60)
+        settled_before = self.db.query(func.now()).scalar() - grace
+        installations = (
+            select(func.count(PluginInstallation.id))
+            .where(PluginInstallation.plugin_id == Plugin.id, PluginInstallation.installed_at < settled_before)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(Plugin)
+            .where(Plugin.download_count < installations)
+            .values(download_count=installations)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
 
     def get_stats(self) -> PluginStats:
-        """Get plugin marketplace statistics"""
-        total_plugins = self.db.query(Plugin).filter(Plugin.is_active == True).count()
-        total_categories = self.db.query(PluginCategory).count()
-        total_installations = self.db.query(PluginInstallation).count()
-        featured_plugins = self.db.query(Plugin).filter(
-            Plugin.is_active == True, 
-            Plugin.is_featured == True
-        ).count()
-        free_plugins = self.db.query(Plugin).filter(
-            Plugin.is_active == True, 
-            Plugin.is_free == True
-        ).count()
-        paid_plugins = total_plugins - free_plugins
-
-        return PluginStats(
-            total_plugins=total_plugins,
-            total_categories=total_categories,
-            total_installations=total_installations,
-            featured_plugins=featured_plugins,
-            free_plugins=free_plugins,
-            paid_plugins=paid_plugins
+        """Get plugin marketplace statistics and facet counts"""
+        cached = _stats_cache.get(_STATS_CACHE_KEY)
+        if cached is not None:
+            return PluginStats(**cached)
+        stats = self._aggregate_stats()
+        _stats_cache.set(_STATS_CACHE_KEY, stats.dict(), settings.PLUGIN_STATS_CACHE_TTL)
+        return stats
+
+    def _aggregate_stats(self) -> PluginStats:
+        """Compute the marketplace stats with a single grouped query"""
+        totals = select(
+            select(func.count(PluginCategory.id)).scalar_subquery().label("total_categories"),
+            select(func.count(PluginInstallation.id)).scalar_subquery().label("total_installations"),
+        ).subquery()
+        facets = (
+            select(
+                Plugin.category_id,
+                Plugin.plugin_type,
+                Plugin.is_free,
+                func.count(Plugin.id).label("plugins"),
+                func.sum(case((Plugin.is_featured == True, 1), else_=0)).label("featured"),
+            )
+            .where(Plugin.is_active == True)
+            .group_by(Plugin.category_id, Plugin.plugin_type, Plugin.is_free)
+            .subquery()
         )
-
-
-
-
+        # Outer join so the totals row comes back even without active plugins
+        rows = self.db.execute(select(totals, facets).select_from(totals.outerjoin(facets, true()))).all()
+
+        stats = PluginStats(
+            total_plugins=0,
+            total_categories=rows[0].total_categories,
+            total_installations=rows[0].total_installations,
+            featured_plugins=0,
+            free_plugins=0,
+            paid_plugins=0,
+        )
+        for row in rows:
+            if row.plugins is None:
+                continue
+            stats.total_plugins += row.plugins
+            stats.featured_plugins += int(row.featured)
+            if row.is_free:
+                stats.free_plugins += row.plugins
+            else:
+                stats.paid_plugins += row.plugins
+            stats.category_counts[row.category_id] = stats.category_counts.get(row.category_id, 0) + row.plugins
+            stats.type_counts[row.plugin_type] = stats.type_counts.get(row.plugin_type, 0) + row.plugins
+        return stats
+
+
+def _run_maintenance_job(job: Callable[[PluginService], int], message: str) -> int:
+    """Run a PluginService maintenance job in its own session, logging what it changed"""
+    db = SessionLocal()
+    try:
+        changed = job(PluginService(db))
+        if changed:
+            print(message.format(changed))
+        return changed
+    finally:
+        db.close()
+
+
+def reconcile_plugin_ratings() -> int:
+    """Periodic job: repair plugin rating aggregates from the reviews"""
+    return _run_maintenance_job(PluginService.reconcile_ratings, "Reconciled rating aggregates of {} plugins")
+
+
+def flush_plugin_download_counts() -> int:
+    """Periodic job: write buffered download increments to the plugins table"""
+    return _run_maintenance_job(PluginService.flush_download_counts, "Flushed download counts of {} plugins")
+
+
+def reconcile_plugin_download_counts() -> int:
+    """Periodic job: repair download counts that lost increments"""
+    return _run_maintenance_job(
+        PluginService.reconcile_download_counts, "Reconciled download counts of {} plugins"
+    )
@@ -0,0 +1,228 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.plugin import Plugin, plugin_search_vector
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Relative weight of a term occurrence in each searchable field
+_FIELD_WEIGHTS = {"name": 3.0, "description": 1.5, "long_description": 1.0}
+
+# Score factors for query terms matched exactly, as a prefix or with one typo
+_EXACT, _PREFIX, _TYPO = 1.0, 0.8, 0.6
+
+_MAX_PREFIX_EXPANSIONS = 50
+_MIN_TYPO_LENGTH = 4
+_MAX_TYPO_LENGTH = 24
+
+_SEARCH_INDEXES = ("ix_plugins_fulltext", "ix_plugins_search_vector")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase alphanumeric search terms of at least two characters"""
+    return [token for token in _TOKEN_RE.findall((text or "").lower()) if len(token) > 1]
+
+
+def _deletes(term: str) -> Iterator[str]:
+    """Every string one deletion away from `term`"""
+    for i in range(len(term)):
+        yield term[:i] + term[i + 1:]
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Whether `a` and `b` differ by at most one insertion, deletion, substitution or transposition"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        # One substitution, or one swap of adjacent characters
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        return a[i:i + 2] == b[i:i + 2][::-1] and a[i + 2:] == b[i + 2:]
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    return shorter[i:] == longer[i + 1:]
+
+
+class PluginSearchIndex:
+    """
+    In-process inverted index over plugin names and descriptions.
+
+    Used as the search engine on databases without a native full-text index
+    and, on MySQL/PostgreSQL, for typo-tolerant retries when the native
+    search finds nothing. Terms match exactly, as a prefix, or within one
+    edit (deletion-neighbourhood lookup), and documents are ranked by a
+    BM25-style score with field weights. The index is built on first use,
+    updated in place when this worker creates, updates or deletes a plugin,
+    and picks up other workers' changes every
+    `PLUGIN_SEARCH_REFRESH_INTERVAL` seconds from the rows' modification
+    times.
+    """
+
+    def __init__(self, refresh_interval: int):
+        self.refresh_interval = refresh_interval
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._documents: Dict[int, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        self._neighbours: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._synced_at = None
+        self._checked_at: Optional[float] = None
+
+    def sync(self, db: Session) -> None:
+        """Build the index, or apply rows changed since the last sync once the interval has passed"""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        with self._sync_lock:
+            if self._checked_at is not None and time.monotonic() - self._checked_at < self.refresh_interval:
+                return
+            # Database time, so the watermark matches the rows' own timestamps
+            started_at = db.query(func.now()).scalar()
+            query = db.query(Plugin.id, Plugin.name, Plugin.description, Plugin.long_description, Plugin.is_active)
+            if self._synced_at is None:
+                query = query.filter(Plugin.is_active == True)
+            else:
+                query = query.filter(func.coalesce(Plugin.updated_at, Plugin.created_at) >= self._synced_at)
+            for row in query.yield_per(1000):
+                if row.is_active:
+                    self.upsert(row.id, row.name, row.description, row.long_description)
+                else:
+                    self.remove(row.id)
+            self._synced_at = started_at
+            self._checked_at = time.monotonic()
+
+    def upsert_plugin(self, plugin: Plugin) -> None:
+        """Index a plugin after a create or update (inactive plugins are dropped)"""
+        if plugin.is_active:
+            self.upsert(plugin.id, plugin.name, plugin.description, plugin.long_description)
+        else:
+            self.remove(plugin.id)
+
+    def upsert(self, plugin_id: int, name: str, description: Optional[str], long_description: Optional[str]) -> None:
+        weights: Dict[str, float] = {}
+        for field, text in (("name", name), ("description", description), ("long_description", long_description)):
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0.0) + _FIELD_WEIGHTS[field]
+        with self._lock:
+            self.remove(plugin_id)
+            self._documents[plugin_id] = weights
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._add_term(term)
+                postings[plugin_id] = weight
+
+    def remove(self, plugin_id: int) -> None:
+        with self._lock:
+            for term in self._documents.pop(plugin_id, {}):
+                postings = self._postings[term]
+                postings.pop(plugin_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._remove_term(term)
+
+    def search(self, terms: List[str], limit: int) -> List[Tuple[int, float]]:
+        """(plugin id, score) of the best `limit` plugins matching every term"""
+        with self._lock:
+            total = len(self._documents)
+            scores: Optional[Dict[int, float]] = None
+            for term in terms:
+                term_scores: Dict[int, float] = {}
+                for candidate, factor in self._expand(term).items():
+                    postings = self._postings[candidate]
+                    idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for plugin_id, weight in postings.items():
+                        score = factor * idf * weight / (weight + 1.2)
+                        if score > term_scores.get(plugin_id, 0.0):
+                            term_scores[plugin_id] = score
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        plugin_id: score + term_scores[plugin_id]
+                        for plugin_id, score in scores.items()
+                        if plugin_id in term_scores
+                    }
+                if not scores:
+                    return []
+        return heapq.nlargest(limit, (scores or {}).items(), key=lambda item: item[1])
+
+    def _expand(self, term: str) -> Dict[str, float]:
+        """Indexed terms matching a query term, with their score factor"""
+        expansions: Dict[str, float] = {}
+        if term in self._postings:
+            expansions[term] = _EXACT
+        start = bisect.bisect_left(self._vocabulary, term)
+        for candidate in self._vocabulary[start:start + _MAX_PREFIX_EXPANSIONS + 1]:
+            if not candidate.startswith(term):
+                break
+            expansions.setdefault(candidate, _PREFIX)
+        if _MIN_TYPO_LENGTH <= len(term) <= _MAX_TYPO_LENGTH:
+            # Terms sharing a one-deletion variant with the query term
+            for key in {term, *_deletes(term)}:
+                for candidate in self._neighbours.get(key, ()):
+                    if candidate not in expansions and _within_one_edit(term, candidate):
+                        expansions[candidate] = _TYPO
+        return expansions
+
+    def _add_term(self, term: str) -> None:
+        bisect.insort(self._vocabulary, term)
+        if len(term) <= _MAX_TYPO_LENGTH:
+            for key in {term, *_deletes(term)}:
+                self._neighbours.setdefault(key, set()).add(term)
+
+    def _remove_term(self, term: str) -> None:
+        position = bisect.bisect_left(self._vocabulary, term)
+        if position < len(self._vocabulary) and self._vocabulary[position] == term:
+            del self._vocabulary[position]
+        if len(term) <= _MAX_TYPO_LENGTH:
+            for key in {term, *_deletes(term)}:
+                neighbours = self._neighbours.get(key)
+                if neighbours is not None:
+                    neighbours.discard(term)
+                    if not neighbours:
+                        del self._neighbours[key]
+
+
+plugin_search_index = PluginSearchIndex(refresh_interval=settings.PLUGIN_SEARCH_REFRESH_INTERVAL)
+
+
+def uses_native_search(db: Session) -> bool:
+    """Whether plugin search runs on the database's own full-text index"""
+    return settings.PLUGIN_SEARCH_BACKEND == "auto" and db.get_bind().dialect.name in ("mysql", "postgresql")
+
+
+def native_search_clause(db: Session, terms: List[str]):
+    """(filter, relevance score) matching every term as a word prefix with the dialect's full-text index"""
+    if db.get_bind().dialect.name == "mysql":
+        condition = match(
+            Plugin.name, Plugin.description, Plugin.long_description,
+            against=" ".join(f"+{term}*" for term in terms),
+        ).in_boolean_mode()
+        return condition, condition
+    vector = plugin_search_vector(Plugin.name, Plugin.description, Plugin.long_description)
+    tsquery = func.to_tsquery(literal_column("'english'::regconfig"), " & ".join(f"{term}:*" for term in terms))
+    return vector.op("@@")(tsquery), func.ts_rank(vector, tsquery)
+
+
+def create_search_indexes(bind) -> None:
+    """Create the dialect's full-text index on an existing plugins table (create_all skips existing tables)"""
+    for index in Plugin.__table__.indexes:
+        if index.name in _SEARCH_INDEXES:
+            # ddl_if limits each index to its own dialect
+            index.create(bind=bind, checkfirst=True)
@@ -0,0 +1,38 @@
+import zlib
+from typing import Optional, Tuple
+
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+from app.models.app import AppSnapshot as AppSnapshotModel
+
+
+class PublishedAppCache:
+    """
+    Decompressed bodies of published app snapshots.
+
+    Snapshots are immutable, so bodies are cached per (app id, version) and
+    never invalidated. Which version an app currently serves is not cached:
+    callers read it from the apps row on every view.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, app_id: int, version: int) -> Optional[Tuple[bytes, str]]:
+        """(body, etag) of a snapshot, or None on a miss"""
+        entry = self.backend.get(f"published_app:{app_id}:{version}")
+        if entry is None:
+            return None
+        return entry["body"].encode("utf-8"), entry["etag"]
+
+    def store(self, snapshot: AppSnapshotModel) -> Tuple[bytes, str]:
+        """Decompress and store a snapshot"""
+        body = zlib.decompress(snapshot.content)
+        # Stored as text so the Redis backend can hold it as JSON
+        entry = {"body": body.decode("utf-8"), "etag": snapshot.etag}
+        self.backend.set(f"published_app:{snapshot.app_id}:{snapshot.version}", entry, settings.PUBLISHED_APP_CACHE_TTL)
+        return body, snapshot.etag
+
+
+published_app_cache = PublishedAppCache(create_cache_backend(settings.PUBLISHED_APP_CACHE_MAX_ENTRIES))
+
@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import json
+import re
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.cache import create_cache_backend
+from app.core.config import settings
+from app.models.data_source import DataSource as DataSourceModel, DataSourceType
+from app.schemas import QueryRequest
+
+# Quoted literals are kept verbatim; any other run of whitespace collapses
+_QUERY_TOKEN_RE = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|\s+")
+
+_READ_ONLY_SQL_PREFIXES = ("select", "with", "show", "describe", "desc", "explain")
+_READ_ONLY_MONGO_OPERATIONS = {"find", "count", "distinct", "aggregate"}
+_READ_ONLY_REDIS_COMMANDS = {
+    "GET", "MGET", "STRLEN", "EXISTS", "TTL", "TYPE", "KEYS", "SCAN",
+    "HGET", "HMGET", "HGETALL", "HKEYS", "HVALS", "HLEN",
+    "LRANGE", "LLEN", "LINDEX",
+    "SMEMBERS", "SCARD", "SISMEMBER",
+    "ZRANGE", "ZREVRANGE", "ZRANGEBYSCORE", "ZREVRANGEBYSCORE", "ZCARD", "ZSCORE", "ZRANK",
+}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for cache keys without touching quoted literals"""
+    stripped = query.strip()
+    try:
+        # JSON queries (MongoDB, REST API, Redis) compare by content
+        return json.dumps(json.loads(stripped), sort_keys=True)
+    except ValueError:
+        pass
+    return _QUERY_TOKEN_RE.sub(lambda m: m.group(1) or " ", stripped)
+
+
+def query_fingerprint(query_request: QueryRequest) -> str:
+    """Hash of everything that determines a query's result"""
+    payload = json.dumps(
+        {
+            "query": normalize_query(query_request.query),
+            "parameters": query_request.parameters or {},
+            "limit": query_request.limit,
+            "format": query_request.format,
+            "paginate": query_request.paginate,
+            "order_key": query_request.order_key,
+            "order_desc": query_request.order_desc,
+            "cursor": query_request.cursor,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable_query(data_source: DataSourceModel, query_request: QueryRequest) -> bool:
+    """Only read-only queries are cached; writes must always reach the source"""
+    query = query_request.query.strip()
+    try:
+        if data_source.type in (DataSourceType.MYSQL, DataSourceType.POSTGRESQL):
+            return query.lower().startswith(_READ_ONLY_SQL_PREFIXES)
+        if data_source.type == DataSourceType.GRAPHQL:
+            return not query.lower().startswith("mutation")
+        query_data = json.loads(query)
+        if data_source.type == DataSourceType.MONGODB:
+            if query_data.get("operation", "find") not in _READ_ONLY_MONGO_OPERATIONS:
+                return False
+            # $out/$merge stages make an aggregation a write
+            return not any("$out" in stage or "$merge" in stage for stage in query_data.get("pipeline", []))
+        if data_source.type == DataSourceType.REST_API:
+            return query_data.get("method", "GET").upper() == "GET"
+        if data_source.type == DataSourceType.REDIS:
+            if "commands" in query_data:
+                names = [item["command"] if isinstance(item, dict) else item[0] for item in query_data["commands"]]
+                return all(str(name).upper() in _READ_ONLY_REDIS_COMMANDS for name in names)
+            return str(query_data.get("command", "")).upper() in _READ_ONLY_REDIS_COMMANDS
+    except (ValueError, AttributeError, KeyError, IndexError, TypeError):
+        return False
+    return False
+
+
+class QueryResultCache:
+    """
+    Cache of data source query results.
+
+    Keys combine the data source id, an invalidation generation for that
+    source and a fingerprint of the normalized query, its parameters, row
+    limit and result format. Bumping
+    the generation invalidates every cached result of a source at once
+    (across workers when the Redis backend is used). Concurrent misses for
+    the same key are collapsed into a single upstream query.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._inflight_async: Dict[str, "asyncio.Future[dict]"] = {}
+
+    def get_ttl(self, data_source: DataSourceModel) -> int:
+        """Cache TTL in seconds for a data source (0 disables caching)"""
+        if data_source.cache_ttl is not None:
+            return data_source.cache_ttl
+        return settings.QUERY_CACHE_DEFAULT_TTL
+
+    def make_key(self, data_source_id: int, query_request: QueryRequest) -> str:
+        generation = self.backend.get_counter(self._generation_key(data_source_id))
+        return f"query:{data_source_id}:{generation}:{query_fingerprint(query_request)}"
+
+    def invalidate(self, data_source_id: int) -> None:
+        """Invalidate every cached result of a data source"""
+        self.backend.incr(self._generation_key(data_source_id))
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cached result for `key`, if any (counted in the hit/miss stats)"""
+        return self._lookup(key)
+
+    def set(self, key: str, result: dict, ttl: int) -> None:
+        """Cache a result computed outside `get_or_compute_async`"""
+        self._store(key, result, ttl)
+
+    async def get_or_compute_async(self, key: str, ttl: int, compute: Callable[[], Awaitable[dict]]) -> dict:
+        """Return the cached result for `key`, computing it at most once per key; waiters share the leader's result"""
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight_async.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading request was cancelled; run the query ourselves
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_async[key] = future
+        try:
+            result = await compute()
+            self._store(key, result, ttl)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody awaited is not logged
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight_async.get(key) is future:
+                del self._inflight_async[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "backend": settings.CACHE_BACKEND,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "entries": self.backend.size(),
+        }
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        cached = self.backend.get(key)
+        with self._stats_lock:
+            if cached is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return cached
+
+    def _store(self, key: str, result: dict, ttl: int) -> None:
+        # Failed queries are not cached so the next request retries
+        if result.get("success"):
+            self.backend.set(key, {**result, "cached": True}, ttl)
+
+    @staticmethod
+    def _generation_key(data_source_id: int) -> str:
+        return f"query-generation:{data_source_id}"
+
+
+query_cache = QueryResultCache(create_cache_backend(settings.QUERY_CACHE_MAX_ENTRIES))
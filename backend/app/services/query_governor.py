@@ -0,0 +1,389 @@
+import asyncio
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models.data_source import DataSource as DataSourceModel
+
+
+class QueryRejectedError(Exception):
+    """Raised when an owner already has the maximum number of queries queued"""
+
+
+class QueryCancelledError(Exception):
+    """Raised when an in-flight query is cancelled through the API"""
+
+
+class QueryTicket:
+    """
+    Handle for one governed query.
+
+    Connectors read the ticket of the running query from `current_ticket` to
+    push its deadline down to the upstream (statement timeouts, maxTimeMS,
+    HTTP timeouts) and to register callbacks that abort the query upstream
+    when it is cancelled or times out.
+    """
+
+    def __init__(self, query_id: str, data_source: DataSourceModel, timeout: int):
+        self.query_id = query_id
+        self.data_source_id = data_source.id
+        self.owner_id = data_source.owner_id
+        self.timeout = timeout
+        self.state = "queued"
+        self.cancelled = False
+        self.started_at = time.time()
+        self.deadline = time.monotonic() + timeout
+        self._callbacks: List[Callable[[], None]] = []
+        self._interrupted = False
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._release: Optional[Callable[[], None]] = None
+
+    def remaining(self) -> float:
+        """Seconds left before the query's deadline"""
+        return max(self.deadline - time.monotonic(), 0)
+
+    def remaining_ms(self) -> int:
+        return max(int(self.remaining() * 1000), 1)
+
+    @contextmanager
+    def cancel_callback(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Register `callback` to abort the upstream work while the block runs"""
+        with self._lock:
+            interrupted = self._interrupted
+            if not interrupted:
+                self._callbacks.append(callback)
+        if interrupted:
+            callback()
+        try:
+            yield
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+    def interrupt(self) -> None:
+        """Abort the upstream work (may block on the upstream; call off the event loop)"""
+        with self._lock:
+            if self._interrupted:
+                return
+            self._interrupted = True
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Failed to interrupt query {self.query_id}: {e}")
+
+    def cancel(self) -> None:
+        """Cancel the query: abort it upstream and stop waiting for its result"""
+        self.cancelled = True
+        self.interrupt()
+        if self._runner is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._runner.cancel)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query_id": self.query_id,
+            "data_source_id": self.data_source_id,
+            "owner_id": self.owner_id,
+            "state": self.state,
+            "timeout": self.timeout,
+            "elapsed_ms": round((time.time() - self.started_at) * 1000, 2),
+        }
+
+
+# Ticket of the query being executed in the current task or worker thread
+current_ticket: ContextVar[Optional[QueryTicket]] = ContextVar("current_ticket", default=None)
+
+
+def run_with_ticket(ticket: Optional[QueryTicket], func: Callable[..., Any], *args: Any) -> Any:
+    """Call `func` with `ticket` as the current ticket (for threadpool work)"""
+    token = current_ticket.set(ticket)
+    try:
+        return func(*args)
+    finally:
+        current_ticket.reset(token)
+
+
+class QueryGovernor:
+    """
+    Bounds how long and how many data source queries may run.
+
+    Each query gets a timeout (the data source's `query_timeout` or the
+    default) covering both queueing and execution. A query first takes one
+    of its owner's slots, waiting in a bounded queue when they are all
+    busy, then one of its data source's slots. In-flight queries are
+    tracked by id so they can be listed and cancelled.
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_source: int,
+        max_concurrency_per_owner: int,
+        max_queued_per_owner: int,
+        default_timeout: int,
+    ):
+        self.max_concurrency_per_source = max_concurrency_per_source
+        self.max_concurrency_per_owner = max_concurrency_per_owner
+        self.max_queued_per_owner = max_queued_per_owner
+        self.default_timeout = default_timeout
+        self._source_semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._owner_semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._owner_waiting: Dict[int, int] = {}
+        # Queries per owner holding or waiting for an owner slot
+        self._owner_inflight: Dict[int, int] = {}
+        self._tickets: Dict[str, QueryTicket] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "started": 0,
+            "completed": 0,
+            "failed": 0,
+            "queued": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+        }
+
+    def get_timeout(self, data_source: DataSourceModel) -> int:
+        """Query timeout in seconds for a data source"""
+        return data_source.query_timeout or self.default_timeout
+
+    async def run(
+        self, data_source: DataSourceModel, work: Callable[[], Awaitable[Any]], query_id: Optional[str] = None
+    ) -> Any:
+        """
+        Run `work()` under the owner and data source limits.
+
+        Raises QueryRejectedError when the owner's queue is full,
+        asyncio.TimeoutError when the deadline passes and QueryCancelledError
+        when the query is cancelled.
+        """
+        ticket = self._open_ticket(data_source, query_id)
+        ticket._loop = asyncio.get_running_loop()
+        ticket._runner = asyncio.current_task()
+        task: Optional[asyncio.Future] = None
+        try:
+            release = await self._acquire_slots(ticket)
+            ticket.state = "running"
+            self._count("started")
+
+            # The task copies the current context, so connectors see the ticket
+            token = current_ticket.set(ticket)
+            try:
+                task = asyncio.ensure_future(work())
+            finally:
+                current_ticket.reset(token)
+            # Slots are held until the work really finishes, even past a timeout
+            task.add_done_callback(lambda _: release())
+
+            done, _ = await asyncio.wait({task}, timeout=ticket.remaining())
+            if not done:
+                raise asyncio.TimeoutError()
+            result = task.result()
+            self._count("completed")
+            return result
+        except asyncio.TimeoutError:
+            self._count("timed_out")
+            if task is not None:
+                task.cancel()
+                await run_in_threadpool(ticket.interrupt)
+            raise
+        except asyncio.CancelledError:
+            if task is not None:
+                task.cancel()
+            if not ticket.cancelled:
+                raise
+            # The cancellation was ours and is reported as an error instead
+            runner = asyncio.current_task()
+            if hasattr(runner, "uncancel"):
+                runner.uncancel()
+            self._count("cancelled")
+            raise QueryCancelledError(f"Query {ticket.query_id} was cancelled")
+        except QueryRejectedError:
+            raise
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            with self._lock:
+                self._tickets.pop(ticket.query_id, None)
+
+    async def acquire(self, data_source: DataSourceModel, query_id: Optional[str] = None) -> QueryTicket:
+        """
+        Take the owner and data source slots for a query that outlives the
+        caller (a streamed response). Pass the ticket to `stream`, which
+        releases the slots once the rows are consumed, or to `finish`.
+        """
+        ticket = self._open_ticket(data_source, query_id)
+        ticket._loop = asyncio.get_running_loop()
+        try:
+            ticket._release = await self._acquire_slots(ticket)
+        except asyncio.TimeoutError:
+            self.finish(ticket, "timed_out")
+            raise
+        except QueryRejectedError:
+            self.finish(ticket, None)
+            raise
+        except BaseException:
+            self.finish(ticket, "failed")
+            raise
+        ticket.state = "running"
+        self._count("started")
+        return ticket
+
+    def stream(self, ticket: QueryTicket, rows: Iterator[Any]) -> Iterator[Any]:
+        """
+        Iterate `rows` as the ticket's query, from any thread.
+
+        Each row is fetched with the ticket as the current ticket, so
+        connectors push its deadline down and register cancel callbacks.
+        The stream stops with TimeoutError once the deadline passes and with
+        QueryCancelledError when the query is cancelled.
+        """
+        outcome = "failed"
+        rows = iter(rows)
+        try:
+            while True:
+                if ticket.cancelled:
+                    raise QueryCancelledError(f"Query {ticket.query_id} was cancelled")
+                if not ticket.remaining():
+                    ticket.interrupt()
+                    raise TimeoutError(f"Query timed out after {ticket.timeout} seconds")
+                try:
+                    row = run_with_ticket(ticket, next, rows)
+                except StopIteration:
+                    break
+                except Exception as e:
+                    # The upstream error of an aborted query is reported as the abort
+                    if ticket.cancelled:
+                        raise QueryCancelledError(f"Query {ticket.query_id} was cancelled") from e
+                    if not ticket.remaining():
+                        raise TimeoutError(f"Query timed out after {ticket.timeout} seconds") from e
+                    raise
+                yield row
+            outcome = "completed"
+        except QueryCancelledError:
+            outcome = "cancelled"
+            raise
+        except TimeoutError:
+            outcome = "timed_out"
+            raise
+        except GeneratorExit:
+            # The client went away before the stream ended
+            outcome = "cancelled"
+            raise
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+            self.finish(ticket, outcome)
+
+    def finish(self, ticket: QueryTicket, outcome: Optional[str]) -> None:
+        """Count the outcome of an acquired ticket, forget it and give back its slots (any thread)"""
+        if outcome is not None:
+            self._count(outcome)
+        with self._lock:
+            self._tickets.pop(ticket.query_id, None)
+        release, ticket._release = ticket._release, None
+        if release is not None and ticket._loop is not None and not ticket._loop.is_closed():
+            # asyncio semaphores must be released on their loop
+            ticket._loop.call_soon_threadsafe(release)
+
+    def get_ticket(self, query_id: str) -> Optional[QueryTicket]:
+        with self._lock:
+            return self._tickets.get(query_id)
+
+    def list_tickets(self, owner_id: Optional[int] = None) -> List[QueryTicket]:
+        """In-flight queries, optionally only those of one owner"""
+        with self._lock:
+            tickets = list(self._tickets.values())
+        if owner_id is not None:
+            tickets = [ticket for ticket in tickets if ticket.owner_id == owner_id]
+        return tickets
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["running"] = sum(1 for ticket in self._tickets.values() if ticket.state == "running")
+            stats["waiting"] = sum(self._owner_waiting.values())
+        return stats
+
+    def _open_ticket(self, data_source: DataSourceModel, query_id: Optional[str]) -> QueryTicket:
+        ticket = QueryTicket(query_id or uuid.uuid4().hex, data_source, self.get_timeout(data_source))
+        with self._lock:
+            if ticket.query_id in self._tickets:
+                raise ValueError(f"Query id '{ticket.query_id}' is already in use")
+            self._tickets[ticket.query_id] = ticket
+        return ticket
+
+    async def _acquire_slots(self, ticket: QueryTicket) -> Callable[[], None]:
+        """Take an owner slot (queueing if needed) and a data source slot"""
+        owner_semaphore = self._get_semaphore(
+            self._owner_semaphores, ticket.owner_id, self.max_concurrency_per_owner
+        )
+        source_semaphore = self._get_semaphore(
+            self._source_semaphores, ticket.data_source_id, self.max_concurrency_per_source
+        )
+
+        owner_id = ticket.owner_id
+        # Counted before awaiting, so a burst of callers in one tick is limited too
+        with self._lock:
+            inflight = self._owner_inflight.get(owner_id, 0)
+            if inflight >= self.max_concurrency_per_owner + self.max_queued_per_owner:
+                self._counters["rejected"] += 1
+                raise QueryRejectedError("Too many queries queued for this data source owner")
+            if inflight >= self.max_concurrency_per_owner:
+                self._counters["queued"] += 1
+            self._owner_inflight[owner_id] = inflight + 1
+            self._owner_waiting[owner_id] = self._owner_waiting.get(owner_id, 0) + 1
+        try:
+            await asyncio.wait_for(owner_semaphore.acquire(), timeout=ticket.remaining())
+        except BaseException:
+            self._leave_owner(owner_id)
+            raise
+        finally:
+            with self._lock:
+                self._owner_waiting[owner_id] -= 1
+
+        try:
+            await asyncio.wait_for(source_semaphore.acquire(), timeout=ticket.remaining())
+        except BaseException:
+            owner_semaphore.release()
+            self._leave_owner(owner_id)
+            raise
+
+        def release() -> None:
+            source_semaphore.release()
+            owner_semaphore.release()
+            self._leave_owner(owner_id)
+        return release
+
+    def _leave_owner(self, owner_id: int) -> None:
+        with self._lock:
+            self._owner_inflight[owner_id] -= 1
+
+    def _get_semaphore(self, semaphores: Dict[int, asyncio.Semaphore], key: int, size: int) -> asyncio.Semaphore:
+        semaphore = semaphores.get(key)
+        if semaphore is None:
+            semaphore = semaphores.setdefault(key, asyncio.Semaphore(size))
+        return semaphore
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+
+query_governor = QueryGovernor(
+    max_concurrency_per_source=settings.DATA_SOURCE_MAX_CONCURRENT_QUERIES,
+    max_concurrency_per_owner=settings.DATA_SOURCE_MAX_CONCURRENT_QUERIES_PER_OWNER,
+    max_queued_per_owner=settings.DATA_SOURCE_MAX_QUEUED_QUERIES_PER_OWNER,
+    default_timeout=settings.DATA_SOURCE_QUERY_TIMEOUT,
+)
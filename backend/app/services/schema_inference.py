@@ -0,0 +1,81 @@
+import datetime
+from typing import Any, Dict, Iterable
+
+from bson import Decimal128, ObjectId
+
+# Nested documents deeper than this are reported as "object" without expanding
+MAX_FIELD_DEPTH = 8
+
+
+def bson_type_name(value: Any) -> str:
+    """Name the BSON type of a decoded value"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    if isinstance(value, datetime.datetime):
+        return "date"
+    if isinstance(value, Decimal128):
+        return "decimal"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    if isinstance(value, bytes):
+        return "binData"
+    return type(value).__name__
+
+
+def _collect_fields(value: Dict[str, Any], prefix: str, depth: int, seen: Dict[str, set]) -> None:
+    for key, item in value.items():
+        path = f"{prefix}{key}"
+        seen.setdefault(path, set()).add(bson_type_name(item))
+        if depth >= MAX_FIELD_DEPTH:
+            continue
+        if isinstance(item, dict):
+            _collect_fields(item, f"{path}.", depth + 1, seen)
+        elif isinstance(item, (list, tuple)):
+            # Follow MongoDB dot notation: fields of embedded documents in
+            # an array are addressed as `array.field`
+            for element in item:
+                if isinstance(element, dict):
+                    _collect_fields(element, f"{path}.", depth + 1, seen)
+
+
+def infer_fields(documents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the fields of sampled documents into a frequency map.
+
+    Every (nested) field path gets the share of documents containing it and
+    a count per observed type, so optional and polymorphic fields show up.
+    """
+    counts: Dict[str, int] = {}
+    type_counts: Dict[str, Dict[str, int]] = {}
+    total = 0
+    for document in documents:
+        total += 1
+        seen: Dict[str, set] = {}
+        _collect_fields(document, "", 0, seen)
+        # Count each path and type at most once per document
+        for path, types in seen.items():
+            counts[path] = counts.get(path, 0) + 1
+            path_types = type_counts.setdefault(path, {})
+            for type_name in types:
+                path_types[type_name] = path_types.get(type_name, 0) + 1
+
+    fields = {
+        path: {
+            "frequency": round(counts[path] / total, 4),
+            "types": dict(sorted(type_counts[path].items(), key=lambda item: -item[1])),
+        }
+        for path in sorted(counts)
+    }
+    return {"sampled": total, "fields": fields}
@@ -1,19 +1,52 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.core.migrations import upgrade_schema
+from app.core.periodic import run_periodically
+from app.core.serialization import FastJSONResponse
 from app.api.v1 import api_router
+from app.services.app import backfill_published_snapshots
+from app.services.data_source import close_connection_registries
+from app.services.plugin import (
+    flush_plugin_download_counts, reconcile_plugin_download_counts, reconcile_plugin_ratings
+)
+from app.services.plugin_search import create_search_indexes
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create database tables on startup
+    # Create database tables on startup, then add columns new to existing tables
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    create_search_indexes(engine)
+    # Snapshot apps that were published before snapshots existed
+    await run_in_threadpool(backfill_published_snapshots)
+    jobs = [asyncio.create_task(run_periodically(
+        settings.PLUGIN_DOWNLOAD_FLUSH_INTERVAL, flush_plugin_download_counts, "plugin download count flush"
+    ))]
+    if settings.PLUGIN_DOWNLOAD_RECONCILE_INTERVAL > 0:
+        jobs.append(asyncio.create_task(run_periodically(
+            settings.PLUGIN_DOWNLOAD_RECONCILE_INTERVAL, reconcile_plugin_download_counts,
+            "plugin download count reconciliation"
+        )))
+    if settings.PLUGIN_RATING_RECONCILE_INTERVAL > 0:
+        jobs.append(asyncio.create_task(run_periodically(
+            settings.PLUGIN_RATING_RECONCILE_INTERVAL, reconcile_plugin_ratings, "plugin rating reconciliation"
+        )))
     yield
+    for job in jobs:
+        job.cancel()
+    # Write out download counts still buffered in this worker
+    await run_in_threadpool(flush_plugin_download_counts)
+    # Release pooled data source connections on shutdown
+    await close_connection_registries()
 
 
 # Create FastAPI application
@@ -22,6 +55,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="A no-code application builder platform",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Add CORS middleware
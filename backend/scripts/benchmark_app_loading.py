@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading an app with all of its content.
+
+Compares eager loading the components, pages and layouts collections with
+one LEFT OUTER JOIN each (joinedload, the previous strategy, which returns
+components x pages x layouts rows) against one extra SELECT ... IN query
+per collection (selectinload, used by AppService), on a large synthetic
+app in an in-memory SQLite database.
+
+Usage: python scripts/benchmark_app_loading.py [--components 200] [--pages 10] [--layouts 10] [--repeat 5]
+"""
+
+import argparse
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models import App, Component, Layout, Page, User
+from app.models import plugin  # noqa: F401  (registers models referenced by App relationships)
+from app.models.component import ComponentType
+from app.services.app import AppService
+
+
+def create_app(engine, component_count: int, page_count: int, layout_count: int) -> str:
+    """Insert one app with the given number of components, pages and layouts"""
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        owner = User(email="bench@example.com", username="bench", first_name="Bench", last_name="User", hashed_password="x")
+        app = App(name="Large app", slug="large-app", config={"theme": "light"}, is_published=True, owner=owner)
+        types = list(ComponentType)
+        app.components = [
+            Component(
+                name=f"component-{i}", component_type=types[i % len(types)],
+                props={"label": f"Field {i}", "options": list(range(20))}, styles={"width": "100%"},
+            )
+            for i in range(component_count)
+        ]
+        app.pages = [Page(name=f"page-{i}", page_definition='{"rows": []}') for i in range(page_count)]
+        app.layouts = [
+            Layout(name=f"layout-{i}", layout_config={"lg": [{"i": str(c), "x": c, "y": 0, "w": 2, "h": 2} for c in range(20)]})
+            for i in range(layout_count)
+        ]
+        session.add(app)
+        session.commit()
+        return app.slug
+
+
+def load_joined(session: Session, slug: str) -> App:
+    return (
+        session.query(App)
+        .options(joinedload(App.components), joinedload(App.pages), joinedload(App.layouts))
+        .filter(App.slug == slug)
+        .first()
+    )
+
+
+def load_selectin(session: Session, slug: str) -> App:
+    return AppService(session).get_by_slug_with_content(slug)
+
+
+def measure(engine, loader, slug: str, repeat: int):
+    """Best-of-`repeat` milliseconds, plus statements and rows fetched by one load"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            del statements[:]
+            with Session(engine) as session:
+                started = time.perf_counter()
+                app = loader(session, slug)
+                best = min(best, time.perf_counter() - started)
+                assert app is not None
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    raw = engine.raw_connection()
+    try:
+        rows = sum(len(raw.cursor().execute(statement, parameters).fetchall()) for statement, parameters in statements)
+    finally:
+        raw.close()
+    return best * 1000, len(statements), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--components", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--layouts", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    slug = create_app(engine, args.components, args.pages, args.layouts)
+
+    print(f"App: {args.components} components, {args.pages} pages, {args.layouts} layouts")
+    results = [
+        ("joinedload", measure(engine, load_joined, slug, args.repeat)),
+        ("selectinload", measure(engine, load_selectin, slug, args.repeat)),
+    ]
+    for label, (elapsed, statements, rows) in results:
+        print(f"  {label:<13} {elapsed:>9.2f} ms  {statements} queries  {rows:>8,} rows")
+    print(f"Speedup: {results[0][1][0] / results[1][1][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark a marketplace listing page.
+
+Compares the previous `GET /plugins/` path (every plugin column loaded,
+author joined, full PluginPublic response) with the listing projection
+(only PluginCard columns loaded, PluginCard response) for one page of
+plugins in an in-memory SQLite database, reporting payload size and
+p50/p95 latency of query + validation + encoding.
+
+Usage: python scripts/benchmark_plugin_listing.py [--plugins 100] [--requests 200]
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, desc
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.serialization import FastJSONResponse
+from app.models import User
+from app.models.plugin import Plugin, PluginCategory
+from app.schemas import PluginCard, PluginPublic, PluginSearchFilters
+from app.services.plugin import PluginService
+
+
+def create_plugins(engine, plugin_count: int) -> None:
+    """Insert plugins with realistic source, assets and descriptions"""
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        author = User(email="bench@example.com", username="bench", first_name="Bench", last_name="User", hashed_password="x")
+        category = PluginCategory(name="Charts", description="Chart components", icon="bar_chart")
+        session.add_all([author, category])
+        session.flush()
+        session.add_all([
+            Plugin(
+                name=f"Plugin {i}", slug=f"plugin-{i}", description="Interactive chart with drill-down",
+                long_description="Detailed usage guide and changelog. " * 100, version="2.1.0",
+                plugin_type="component", category_id=category.id, author_id=author.id,
+                config_schema={"type": "object", "properties": {f"option_{k}": {"type": "string"} for k in range(30)}},
+                default_config={f"option_{k}": "value" for k in range(30)},
+                main_file="export default function Chart(props) { return render(props) }\n" * 200,
+                assets={"css": "chart.css", "images": [f"image-{k}.png" for k in range(20)]},
+                dependencies=["react", "d3"], download_count=i * 17, rating=4.2, review_count=i,
+            )
+            for i in range(plugin_count)
+        ])
+        session.commit()
+
+
+def list_full(session: Session, limit: int) -> bytes:
+    plugins = (
+        session.query(Plugin)
+        .options(joinedload(Plugin.category), joinedload(Plugin.author))
+        .filter(Plugin.is_active == True)
+        .order_by(desc(Plugin.download_count))
+        .limit(limit)
+        .all()
+    )
+    adapter = TypeAdapter(List[PluginPublic])
+    return FastJSONResponse(adapter.dump_python(adapter.validate_python(plugins), mode="json")).body
+
+
+def list_cards(session: Session, limit: int) -> bytes:
+    plugins = PluginService(session).search_plugins(PluginSearchFilters(), limit=limit)
+    adapter = TypeAdapter(List[PluginCard])
+    return FastJSONResponse(adapter.dump_python(adapter.validate_python(plugins), mode="json")).body
+
+
+def measure(engine, handler, limit: int, requests: int):
+    """Response size in bytes and p50/p95 latency in milliseconds"""
+    timings = []
+    for _ in range(requests):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            body = handler(session, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+    cut_points = statistics.quantiles(timings, n=20)
+    return len(body), statistics.median(timings), cut_points[18]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plugins", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    create_plugins(engine, args.plugins)
+
+    print(f"Page of {args.plugins} plugins, {args.requests} requests")
+    for label, handler in (("PluginPublic", list_full), ("PluginCard", list_cards)):
+        size, p50, p95 = measure(engine, handler, args.plugins, args.requests)
+        print(f"  {label:<13} {size / 1024:>9.1f} KiB  p50 {p50:>7.2f} ms  p95 {p95:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
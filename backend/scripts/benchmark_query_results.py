@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQL query result materialization and serialization.
+
+Compares the previous path (a dict per SQLAlchemy row mapping, QueryResult
+validation and FastAPI's jsonable_encoder + json.dumps) with the fast path
+(dicts zipped from cursor tuples, QueryResult.model_construct and orjson),
+using real rows fetched from an in-memory SQLite table.
+
+Usage: python scripts/benchmark_query_results.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, text
+
+from app.core.serialization import FastJSONResponse
+from app.schemas import QueryResult
+
+
+def fetch_rows(row_count: int):
+    """Create and read back a table shaped like a typical dashboard query"""
+    engine = create_engine("sqlite://")
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, customer TEXT, status TEXT, "
+            "total REAL, quantity INTEGER, created_at TIMESTAMP)"
+        ))
+        conn.execute(
+            text("INSERT INTO orders VALUES (:id, :customer, :status, :total, :quantity, :created_at)"),
+            [
+                {
+                    "id": i,
+                    "customer": f"customer-{i % 500}",
+                    "status": ("paid", "pending", "refunded")[i % 3],
+                    "total": round(i * 1.37, 2),
+                    "quantity": i % 7,
+                    "created_at": start + timedelta(minutes=i),
+                }
+                for i in range(row_count)
+            ],
+        )
+    with engine.connect() as conn:
+        result = conn.execute(text("SELECT * FROM orders"))
+        return list(result.keys()), result.fetchall()
+
+
+def before(columns, rows) -> bytes:
+    data = [dict(row._mapping) for row in rows]
+    result = QueryResult(success=True, data=data, columns=columns, row_count=len(data))
+    return json.dumps(jsonable_encoder(result)).encode("utf-8")
+
+
+def after(columns, rows) -> bytes:
+    data = [dict(zip(columns, row)) for row in rows]
+    result = QueryResult.model_construct(success=True, data=data, columns=columns, row_count=len(data))
+    return FastJSONResponse(dict(result)).body
+
+
+def measure(func, columns, rows, repeat: int) -> float:
+    """Best-of-`repeat` throughput in rows per second"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(columns, rows)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    columns, rows = fetch_rows(args.rows)
+    before_rate = measure(before, columns, rows, args.repeat)
+    after_rate = measure(after, columns, rows, args.repeat)
+
+    print(f"Rows: {args.rows}")
+    print(f"Before (row mapping + validation + jsonable_encoder): {before_rate:>12,.0f} rows/sec")
+    print(f"After  (tuple zip + model_construct + orjson):        {after_rate:>12,.0f} rows/sec")
+    print(f"Speedup: {after_rate / before_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark response encoding for the heaviest public endpoints.
+
+Encodes the payloads of `/apps/standalone/{slug}` (an app with its pages,
+components and layouts) and `/plugins/` (a page of plugins with their
+categories) three ways:
+
+- stdlib: response_model validation + JSON-mode dump + json.dumps (the
+  previous default JSONResponse)
+- orjson: response_model validation + JSON-mode dump + orjson (the
+  FastJSONResponse default response class)
+- cached: the cached body of the app's published snapshot (standalone app only)
+
+Usage: python scripts/benchmark_responses.py [--components 300] [--plugins 100] [--repeat 20]
+"""
+
+import argparse
+import sys
+import os
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.cache import MemoryCacheBackend
+from app.core.serialization import FastJSONResponse, json_dumps
+from app.models import App, AppSnapshot, Component, Page, Layout
+from app.models.plugin import Plugin, PluginCategory
+from app.models.component import ComponentType
+from app.schemas import AppWithContent, PluginPublic
+from app.services.published_app_cache import PublishedAppCache
+
+
+def build_app(component_count: int) -> App:
+    """A published app shaped like a mid-sized dashboard"""
+    created = datetime(2024, 1, 1)
+    app = App(
+        id=1, name="Sales dashboard", slug="sales-dashboard", description="Regional sales overview",
+        config={"theme": "light", "layout": "grid", "responsive": True}, is_published=True,
+        owner_id=1, created_at=created, updated_at=created,
+    )
+    types = list(ComponentType)
+    app.components = [
+        Component(
+            id=i, name=f"component-{i}", component_type=types[i % len(types)].value, app_id=1,
+            props={"label": f"Field {i}", "placeholder": "Type here", "options": list(range(10))},
+            styles={"width": "100%", "margin": "8px", "color": "#333333"},
+            data_binding={"data_source_id": 1, "query": f"SELECT * FROM orders WHERE region = {i}"},
+            events={"onClick": {"action": "navigate", "target": f"/details/{i}"}},
+            created_at=created + timedelta(minutes=i), updated_at=None,
+        )
+        for i in range(component_count)
+    ]
+    app.pages = [
+        Page(id=i, name=f"page-{i}", app_id=1, page_definition='{"rows": []}', created_at=created, updated_at=None)
+        for i in range(10)
+    ]
+    app.layouts = [
+        Layout(
+            id=i, name=f"layout-{i}", app_id=1,
+            layout_config={"lg": [{"i": str(c), "x": c % 12, "y": c // 12, "w": 3, "h": 2} for c in range(50)]},
+            breakpoints={"lg": 1200, "md": 996, "sm": 768}, created_at=created, updated_at=None,
+        )
+        for i in range(3)
+    ]
+    return app
+
+
+def build_plugins(plugin_count: int) -> List[Plugin]:
+    """A marketplace page of plugins with their categories"""
+    created = datetime(2024, 1, 1)
+    category = PluginCategory(id=1, name="Charts", description="Chart components", icon="chart", created_at=created)
+    return [
+        Plugin(
+            id=i, name=f"Plugin {i}", slug=f"plugin-{i}", description="A useful plugin",
+            long_description="Long description. " * 40, version="1.2.0", plugin_type="component",
+            category_id=1, category=category, config_schema={"type": "object", "properties": {"color": {"type": "string"}}},
+            default_config={"color": "blue"}, main_file="export default function Plugin() {}\n" * 20,
+            assets={"css": "plugin.css"}, dependencies=["react"], is_free=True, price=None, currency="USD",
+            is_active=True, is_featured=i % 10 == 0, is_verified=True, download_count=i * 13,
+            rating=4.5, review_count=i, author_id=1, created_at=created, updated_at=None,
+        )
+        for i in range(plugin_count)
+    ]
+
+
+def measure(func, repeat: int) -> float:
+    """Best-of-`repeat` time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def report(name: str, adapter: TypeAdapter, payload, repeat: int, cached=None) -> None:
+    def stdlib() -> bytes:
+        return JSONResponse(adapter.dump_python(adapter.validate_python(payload), mode="json")).body
+
+    def orjson() -> bytes:
+        return FastJSONResponse(adapter.dump_python(adapter.validate_python(payload), mode="json")).body
+
+    paths = [("stdlib", stdlib), ("orjson", orjson)]
+    if cached is not None:
+        paths.append(("cached", cached))
+    timings = [(label, measure(func, repeat)) for label, func in paths]
+    print(f"{name} ({len(stdlib()) / 1024:.0f} KiB)")
+    for label, elapsed in timings:
+        print(f"  {label:<7} {elapsed:>9.3f} ms  {timings[0][1] / elapsed:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--components", type=int, default=300)
+    parser.add_argument("--plugins", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = build_app(args.components)
+    body = json_dumps(AppWithContent.model_validate(app))
+    snapshot = AppSnapshot(
+        app_id=app.id, version=1, content=zlib.compress(body), content_size=len(body), etag='"bench"'
+    )
+    cache = PublishedAppCache(MemoryCacheBackend(max_entries=10))
+    cache.store(snapshot)
+    report(
+        "GET /apps/standalone/{slug}", TypeAdapter(AppWithContent), app, args.repeat,
+        cached=lambda: cache.get(app.id, 1)[0],
+    )
+    plugins = build_plugins(args.plugins)
+    report("GET /plugins/", TypeAdapter(List[PluginPublic]), plugins, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Script to test the query governor's per-owner queue limit
+
+Starts governed queries for one owner both as a burst (asyncio.gather, like
+/batch-query) and one after another, and checks that both paths admit
+max_concurrency + max_queued queries and reject the rest.
+
+Usage: python scripts/test_query_governor.py
+"""
+
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.query_governor import QueryGovernor, QueryRejectedError
+
+QUERIES = 10
+MAX_CONCURRENCY = 1
+MAX_QUEUED = 1
+
+
+def create_governor() -> QueryGovernor:
+    return QueryGovernor(
+        max_concurrency_per_source=MAX_CONCURRENCY,
+        max_concurrency_per_owner=MAX_CONCURRENCY,
+        max_queued_per_owner=MAX_QUEUED,
+        default_timeout=5,
+    )
+
+
+async def slow_query() -> dict:
+    await asyncio.sleep(0.05)
+    return {"success": True}
+
+
+async def run_query(governor: QueryGovernor, data_source) -> str:
+    try:
+        await governor.run(data_source, slow_query)
+        return "completed"
+    except QueryRejectedError:
+        return "rejected"
+
+
+async def run_burst(data_source) -> dict:
+    governor = create_governor()
+    outcomes = await asyncio.gather(*(run_query(governor, data_source) for _ in range(QUERIES)))
+    return {"outcomes": outcomes, "stats": governor.get_stats()}
+
+
+async def run_staggered(data_source) -> dict:
+    governor = create_governor()
+    tasks = []
+    for _ in range(QUERIES):
+        tasks.append(asyncio.create_task(run_query(governor, data_source)))
+        # Let each query reach the governor before starting the next one
+        await asyncio.sleep(0)
+    outcomes = await asyncio.gather(*tasks)
+    return {"outcomes": outcomes, "stats": governor.get_stats()}
+
+
+def check(label: str, result: dict) -> bool:
+    admitted = MAX_CONCURRENCY + MAX_QUEUED
+    completed = result["outcomes"].count("completed")
+    rejected = result["outcomes"].count("rejected")
+    stats = result["stats"]
+    ok = (
+        completed == admitted
+        and rejected == QUERIES - admitted
+        and stats["rejected"] == QUERIES - admitted
+        and stats["queued"] == MAX_QUEUED
+    )
+    print(f"{'✅' if ok else '❌'} {label}: {completed} completed, {rejected} rejected, "
+          f"queued={stats['queued']}, rejected={stats['rejected']}")
+    return ok
+
+
+def test_query_governor():
+    """Test the per-owner queue limit for bursts and staggered queries"""
+    print("🧪 Testing query governor owner queue...")
+    data_source = SimpleNamespace(id=1, owner_id=1, query_timeout=None)
+    results = [
+        check("burst", asyncio.run(run_burst(data_source))),
+        check("staggered", asyncio.run(run_staggered(data_source))),
+    ]
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    test_query_governor()
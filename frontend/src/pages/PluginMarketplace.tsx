@@ -37,7 +37,14 @@ import {
   Favorite as FavoriteIcon,
   FavoriteBorder as FavoriteBorderIcon
 } from '@mui/icons-material'
-import { PluginPublic, PluginCategory, PluginType, PluginStats } from '@/types/plugin'
+import { PluginCard, PluginCategory, PluginType, PluginStats } from '@/types/plugin'
+
+const typeOptions: [PluginType, string][] = [
+  [PluginType.COMPONENT, 'Components'],
+  [PluginType.INTEGRATION, 'Integrations'],
+  [PluginType.TEMPLATE, 'Templates'],
+  [PluginType.THEME, 'Themes'],
+]
 
 interface TabPanelProps {
   children?: React.ReactNode
@@ -62,7 +69,7 @@ function TabPanel(props: TabPanelProps) {
 }
 
 const PluginMarketplace: React.FC = () => {
-  const [plugins, setPlugins] = useState<PluginPublic[]>([])
+  const [plugins, setPlugins] = useState<PluginCard[]>([])
   const [categories, setCategories] = useState<PluginCategory[]>([])
   const [stats, setStats] = useState<PluginStats | null>(null)
   const [loading, setLoading] = useState(true)
@@ -258,6 +265,7 @@ const PluginMarketplace: React.FC = () => {
                 {categories.map((category) => (
                   <MenuItem key={category.id} value={category.id}>
                     {category.name}
+                    {stats && ` (${stats.category_counts[category.id] ?? 0})`}
                   </MenuItem>
                 ))}
               </Select>
@@ -272,10 +280,12 @@ const PluginMarketplace: React.FC = () => {
                 label="Type"
               >
                 <MenuItem value="">All Types</MenuItem>
-                <MenuItem value="component">Components</MenuItem>
-                <MenuItem value="integration">Integrations</MenuItem>
-                <MenuItem value="template">Templates</MenuItem>
-                <MenuItem value="theme">Themes</MenuItem>
+                {typeOptions.map(([value, label]) => (
+                  <MenuItem key={value} value={value}>
+                    {label}
+                    {stats && ` (${stats.type_counts[value] ?? 0})`}
+                  </MenuItem>
+                ))}
               </Select>
             </FormControl>
           </Grid>
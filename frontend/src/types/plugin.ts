@@ -47,8 +47,18 @@ export interface Plugin {
 export interface PluginPublic extends Plugin {
   category?: PluginCategory
   author_name?: string
+  // Number of reviews per star rating (1-5)
+  rating_histogram: Record<number, number>
 }
 
+// Marketplace listing entry returned by GET /plugins/ and /plugins/featured;
+// fetch GET /plugins/{id} for the full PluginPublic
+export type PluginCard = Omit<
+  PluginPublic,
+  | 'long_description' | 'config_schema' | 'default_config' | 'main_file' | 'assets' | 'dependencies' | 'is_active'
+  | 'author_name' | 'rating_histogram'
+>
+
 export interface PluginInstallation {
   id: number
   plugin_id: number
@@ -94,6 +104,8 @@ export interface PluginStats {
   featured_plugins: number
   free_plugins: number
   paid_plugins: number
+  category_counts: Record<number, number>
+  type_counts: Record<string, number>
 }
 
 // Plugin Component Interface for Runtime